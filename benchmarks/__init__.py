@@ -0,0 +1,13 @@
+import os
+
+# Application settings for benchmarks, so that no .env file is required
+for name, value in {
+    "DEBUG": "false",
+    "CORS_ORIGINS": '["*"]',
+    "DB__HOST": "localhost",
+    "DB__PORT": "5432",
+    "DB__USER": "postgres",
+    "DB__PASSWORD": "postgres",
+    "DB__NAME": "bench",
+}.items():
+    os.environ.setdefault(name, value)
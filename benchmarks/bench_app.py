@@ -0,0 +1,133 @@
+"""
+Load test of the application stack: `create_app` with the sample router
+on SQLite, driven in-process over ASGI.
+
+Reports requests/sec and p50/p95/p99 latency for get, list, create, update
+and get of a missing item (404).
+
+Usage: python -m benchmarks.bench_app [--requests 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from benchmarks.sample import create_sample_engine, create_sample_router
+from src.bootstrap import create_app
+from src.core.database import get_session
+
+Scenario = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "get": lambda client, i: client.get(f"/items/{i % 1000 + 1}"),
+    "get_missing": lambda client, i: client.get(f"/items/{i + 1_000_000}"),
+    "list": lambda client, i: client.get("/items", params={"limit": 50}),
+    "create": lambda client, i: client.post(
+        "/items",
+        json={"title": f"New #{i}", "description": "Created", "price": i % 1000},
+    ),
+    "update": lambda client, i: client.patch(
+        "/items", json={"id": i % 1000 + 1, "price": i % 997}
+    ),
+}
+
+
+def create_bench_app(engine: AsyncEngine) -> FastAPI:
+    """
+    Builds the application with the sample router bound to `engine`.
+    """
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def session_getter() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    app = create_app()
+    app.include_router(create_sample_router())
+    app.dependency_overrides[get_session] = session_getter
+    return app
+
+
+def percentile(latencies: list[float], percent: int) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percent - 1]
+
+
+async def measure(
+    app: FastAPI,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """
+    Issues `requests` calls from `concurrency` workers, returns throughput
+    and latency percentiles in milliseconds.
+    """
+    counter = itertools.count()
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker() -> None:
+            while (i := next(counter)) < requests:
+                started = time.perf_counter()
+                response = await scenario(client, i)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code < 500, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def main(requests: int, concurrency: int) -> dict[str, dict[str, float]]:
+    # Console logging of every query would dominate the measurements
+    logging.disable(logging.WARNING)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.sqlite3"
+        engine = await create_sample_engine(1000, f"sqlite+aiosqlite:///{database}")
+        try:
+            app = create_bench_app(engine)
+            for name, scenario in SCENARIOS.items():
+                await measure(app, scenario, min(requests, 100), concurrency)
+                results[name] = await measure(app, scenario, requests, concurrency)
+                print(
+                    f"{name:>11}: {results[name]['rps']:8,.0f} req/sec"
+                    f"  p50 {results[name]['p50_ms']:6.2f} ms"
+                    f"  p95 {results[name]['p95_ms']:6.2f} ms"
+                    f"  p99 {results[name]['p99_ms']:6.2f} ms"
+                )
+        finally:
+            await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+    results = asyncio.run(main(args.requests, args.concurrency))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
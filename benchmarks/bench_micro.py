@@ -0,0 +1,105 @@
+"""
+Microbenchmarks of hot helpers: ORM-to-schema conversion, schema
+serialization, `to_snake_case` and error responses.
+
+Usage: python -m benchmarks.bench_micro [--number 20000]
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from benchmarks.sample import SampleItem, SampleItemReadSchema, SampleItemRepository
+from src.core.exceptions import BusinessExceptionHandler, ModelNotFoundError
+from src.core.repositories.plans import get_schema_plan
+from src.core.utils.case_converter import to_snake_case
+
+
+def make_models(count: int) -> list[SampleItem]:
+    return [
+        SampleItem(
+            id=i,
+            title=f"Item #{i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            price=i % 1000,
+            created_at=datetime(2025, 1, 1),
+        )
+        for i in range(count)
+    ]
+
+
+def create_cases(batch: int) -> dict[str, tuple[Callable[[], object], int]]:
+    """
+    Returns benchmark callables with the number of operations per call.
+    """
+    repository = SampleItemRepository(session=None)  # type: ignore[arg-type]
+    models = make_models(batch)
+    plan = get_schema_plan(SampleItem, SampleItemReadSchema)
+    rows = [
+        tuple(getattr(model, column.key) for column in plan.columns) for model in models
+    ]
+    schemas = [repository._model_validate(model) for model in models]
+    adapter = TypeAdapter(list[SampleItemReadSchema])
+    try:
+        raise ModelNotFoundError(SampleItem, model_id=1)
+    except ModelNotFoundError as exc:
+        error = exc
+    handler = BusinessExceptionHandler()
+    _, prefix = handler._template(ModelNotFoundError)
+    return {
+        "model_validate": (lambda: repository._model_validate(models[0]), 1),
+        "schema_plan_build": (lambda: plan.build(rows), batch),
+        "serialize_jsonable_encoder": (
+            lambda: json.dumps(jsonable_encoder(schemas)).encode(),
+            batch,
+        ),
+        "serialize_model_dump_json": (
+            lambda: [schema.model_dump_json(by_alias=True) for schema in schemas],
+            batch,
+        ),
+        "serialize_type_adapter": (
+            lambda: adapter.dump_json(schemas, by_alias=True),
+            batch,
+        ),
+        "to_snake_case": (lambda: to_snake_case("HTTPResponseCode2XXHandler"), 1),
+        "to_snake_case_uncached": (
+            lambda: to_snake_case.__wrapped__("HTTPResponseCode2XXHandler"),
+            1,
+        ),
+        "exception_type": (lambda: error.type, 1),
+        "exception_schema": (
+            lambda: error.get_schema(debug=False).model_dump_json(),
+            1,
+        ),
+        "exception_response_body": (lambda: handler.render(error, prefix), 1),
+        "exception_schema_debug": (
+            lambda: error.get_schema(debug=True).model_dump_json(),
+            1,
+        ),
+    }
+
+
+def main(number: int, batch: int = 1000) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, (case, operations) in create_cases(batch).items():
+        calls = max(number // operations, 1)
+        best = min(timeit.repeat(case, number=calls, repeat=5)) / (calls * operations)
+        results[name] = {"ns_per_op": best * 1e9, "ops_per_sec": 1 / best}
+        print(f"{name:>28}: {best * 1e9:10,.0f} ns/op")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+    results = main(args.number)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
@@ -0,0 +1,85 @@
+"""
+Compares requests/sec of the pure ASGI `ProcessTimeMiddleware` with the
+previous `BaseHTTPMiddleware`-based timing middleware.
+
+Usage: python -m benchmarks.bench_middleware [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.metrics import MetricsRegistry
+from src.core.middleware import ProcessTimeMiddleware
+
+
+async def calc_process_time(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    The previous timing middleware, kept for comparison.
+    """
+    start_time = time.perf_counter()
+    response = await call_next(request)
+    process_time = time.perf_counter() - start_time
+    response.headers["X-Process-Time"] = f"{process_time:.5f}"
+    return response
+
+
+def create_app(middleware: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    if middleware == "base_http":
+        app.add_middleware(BaseHTTPMiddleware, dispatch=calc_process_time)
+    elif middleware == "pure_asgi":
+        app.add_middleware(ProcessTimeMiddleware, registry=MetricsRegistry())
+    return app
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    """
+    Returns requests/sec for `requests` GETs issued by `concurrency` workers.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int) -> None:
+            for i in range(count):
+                response = await client.get(f"/items/{i}")
+                assert response.status_code == 200
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker(requests // concurrency) for _ in range(concurrency))
+        )
+        return (requests // concurrency * concurrency) / (time.perf_counter() - started)
+
+
+async def main(requests: int, concurrency: int) -> dict[str, float]:
+    results = {}
+    for middleware in ("none", "base_http", "pure_asgi"):
+        app = create_app(middleware)
+        await measure(app, min(requests, 500), concurrency)  # warm up
+        results[middleware] = await measure(app, requests, concurrency)
+        print(f"{middleware:>10}: {results[middleware]:10,.0f} req/sec")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
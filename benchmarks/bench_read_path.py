@@ -0,0 +1,59 @@
+"""
+Compares rows/sec of the ORM read path (`model_validate(from_attributes=True)`)
+with the opt-in `fast_read` path of `CrudBaseRepository`.
+
+Usage: python -m benchmarks.bench_read_path [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.sample import SampleItemRepository, create_sample_engine
+
+
+class FastSampleItemRepository(SampleItemRepository):
+    fast_read = True
+
+
+async def measure(
+    repository_type: type[SampleItemRepository],
+    rows: int,
+    repeat: int,
+) -> float:
+    """
+    Returns the best rows/sec of `get_all` over `repeat` runs.
+    """
+    engine = await create_sample_engine(rows)
+    best = float("inf")
+    try:
+        for _ in range(repeat):
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                started = time.perf_counter()
+                items = await repository_type(session).get_all()
+                best = min(best, time.perf_counter() - started)
+                assert len(items) == rows
+    finally:
+        await engine.dispose()
+    return rows / best
+
+
+async def main(rows: int, repeat: int) -> dict[str, float]:
+    results = {
+        "orm": await measure(SampleItemRepository, rows, repeat),
+        "fast_read": await measure(FastSampleItemRepository, rows, repeat),
+    }
+    for name, rows_per_sec in results.items():
+        print(f"{name:>10}: {rows_per_sec:12,.0f} rows/sec")
+    print(f"{'speedup':>10}: {results['fast_read'] / results['orm']:12.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,83 @@
+"""
+Compares list endpoint throughput of FastAPI's default response path
+(validation, `jsonable_encoder`, `json.dumps`) with `SchemaJSONResponse`
+served through `SchemaResponseRoute`.
+
+Usage: python -m benchmarks.bench_response [--sizes 1000 10000] [--requests 50]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from benchmarks.sample import SampleItemReadSchema
+from src.core.responses import SchemaJSONResponse
+from src.core.routing import SchemaResponseRoute
+
+
+def create_app(mode: str, items: list[SampleItemReadSchema]) -> FastAPI:
+    fast = mode == "schema"
+    router = APIRouter(route_class=SchemaResponseRoute if fast else APIRoute)
+
+    @router.get("/items")
+    async def get_items() -> list[SampleItemReadSchema]:
+        return items
+
+    app = FastAPI(default_response_class=SchemaJSONResponse if fast else JSONResponse)
+    app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """
+    Returns seconds per request for `requests` sequential GETs.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("/items")
+            assert response.status_code == 200
+        return (time.perf_counter() - started) / requests
+
+
+async def main(sizes: list[int], requests: int) -> dict[int, dict[str, float]]:
+    results: dict[int, dict[str, float]] = {}
+    for size in sizes:
+        items = [
+            SampleItemReadSchema(
+                id=i,
+                title=f"title-{i}",
+                description="description " * 8,
+                price=i % 1000,
+                created_at=datetime(2024, 1, 1),
+            )
+            for i in range(size)
+        ]
+        results[size] = {}
+        for mode in ("default", "schema"):
+            app = create_app(mode, items)
+            await measure(app, 2)  # warm up
+            results[size][mode] = await measure(app, requests)
+        default, schema = results[size]["default"], results[size]["schema"]
+        print(
+            f"{size:>6} items: default {default * 1000:8.2f} ms, "
+            f"schema {schema * 1000:8.2f} ms ({default / schema:.1f}x)"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.requests))
@@ -0,0 +1,75 @@
+"""
+Cold start profile: imports application modules in fresh interpreters with
+`python -X importtime` and reports the cumulative import time of each module
+and the modules that cost the most to import.
+
+`src.bootstrap` must stay free of import side effects, `src.main` also builds
+the application with `create_app`. With `--budget` the exit code is 1 when
+importing `src.main` takes longer than the budget (milliseconds).
+
+Usage: python -m benchmarks.bench_startup [--runs 5] [--top 15] [--budget 1500]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+MODULES = ("src.bootstrap", "src.main")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Imports `module` in a new interpreter and returns
+    `{module: (self_us, cumulative_us)}` for every module it imported.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        try:
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def main(runs: int, top: int = 0) -> dict[str, dict[str, float]]:
+    results = {}
+    for module in MODULES:
+        # The fastest run is the one least disturbed by the OS page cache
+        profile = min(
+            (import_times(module) for _ in range(runs)),
+            key=lambda times: times[module][1],
+        )
+        import_ms = profile[module][1] / 1000
+        results[module] = {"import_ms": import_ms}
+        print(f"{module:>14}: {import_ms:8.1f} ms")
+        heaviest = sorted(profile.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_us, cumulative_us) in heaviest[:top]:
+            print(f"{'':>16}{self_us / 1000:7.1f} ms self  {name}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget", type=float, help="src.main import budget, ms")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args()
+    results = main(args.runs, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.budget is not None and results["src.main"]["import_ms"] > args.budget:
+        print(f"OVER BUDGET src.main: {args.budget:,.0f} ms")
+        sys.exit(1)
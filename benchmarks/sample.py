@@ -0,0 +1,132 @@
+"""
+Sample model, schemas, repository and router shared by the benchmarks.
+"""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import SessionDep
+from src.core.models import Base
+from src.core.repositories.crud import CrudBaseRepository
+from src.core.schemas import (
+    CreateSchemaInt,
+    PageSchema,
+    ReadSchemaInt,
+    RequestSchema,
+    ResponseSchema,
+    UpdateSchemaInt,
+)
+
+
+class SampleItem(Base):
+    __tablename__ = "bench_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(128))
+    description: Mapped[str] = mapped_column(String(512))
+    price: Mapped[int] = mapped_column(index=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+
+class SampleItemReadSchema(ResponseSchema, ReadSchemaInt):
+    title: str
+    description: str
+    price: int
+    created_at: datetime
+
+
+class SampleItemCreateSchema(RequestSchema, CreateSchemaInt):
+    title: str
+    description: str
+    price: int
+
+
+class SampleItemUpdateSchema(RequestSchema, UpdateSchemaInt):
+    title: str | None = None
+    description: str | None = None
+    price: int | None = None
+
+
+class SampleItemRepository(
+    CrudBaseRepository[
+        SampleItem,
+        SampleItemReadSchema,
+        SampleItemCreateSchema,
+        SampleItemUpdateSchema,
+        int,
+    ]
+):
+    model_type = SampleItem
+    read_schema_type = SampleItemReadSchema
+    sortable_fields = ("id", "price")
+
+
+async def create_sample_engine(
+    rows: int, url: str = "sqlite+aiosqlite://"
+) -> AsyncEngine:
+    """
+    Creates a database engine with the sample table filled with `rows` items.
+    """
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        if rows:
+            await connection.execute(
+                SampleItem.__table__.insert(),
+                [
+                    {
+                        "id": i,
+                        "title": f"Item #{i}",
+                        "description": "Lorem ipsum dolor sit amet " * 4,
+                        "price": i % 1000,
+                        "created_at": datetime(2025, 1, 1),
+                    }
+                    for i in range(1, rows + 1)
+                ],
+            )
+    return engine
+
+
+def get_repository(session: SessionDep) -> SampleItemRepository:
+    return SampleItemRepository(session)
+
+
+RepositoryDep = Annotated[SampleItemRepository, Depends(get_repository)]
+
+
+def create_sample_router() -> APIRouter:
+    """
+    Creates CRUD endpoints for the sample model.
+    """
+    router = APIRouter(prefix="/items", tags=["items"])
+
+    @router.get("/{item_id}")
+    async def get_item(item_id: int, repository: RepositoryDep) -> SampleItemReadSchema:
+        return await repository.get(item_id)
+
+    @router.get("")
+    async def list_items(
+        repository: RepositoryDep,
+        limit: Annotated[int, Query(ge=1, le=100)] = 50,
+        cursor: str | None = None,
+    ) -> PageSchema[SampleItemReadSchema]:
+        return await repository.get_page(limit=limit, cursor=cursor)
+
+    @router.post("", status_code=201)
+    async def create_item(
+        item: SampleItemCreateSchema, repository: RepositoryDep
+    ) -> SampleItemReadSchema:
+        return await repository.create(item)
+
+    @router.patch("")
+    async def update_item(
+        item: SampleItemUpdateSchema, repository: RepositoryDep
+    ) -> SampleItemReadSchema:
+        return await repository.update(item)
+
+    return router
@@ -0,0 +1,97 @@
+"""
+Runs the application load test, the microbenchmarks and the cold start
+profile and writes the results as JSON. With `--baseline` the run is compared
+with a previous results file and the exit code is 1 if any metric regressed
+by more than `--threshold`.
+
+Usage: python -m benchmarks.suite --output results.json [--baseline old.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks import bench_app, bench_micro, bench_startup
+
+# Metrics where a larger value is better; the rest are latencies and costs
+HIGHER_IS_BETTER = ("rps", "ops_per_sec")
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(requests: int, concurrency: int, number: int) -> dict[str, Any]:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "requests": requests,
+            "concurrency": concurrency,
+        },
+        "http": asyncio.run(bench_app.main(requests, concurrency)),
+        "micro": bench_micro.main(number),
+        "startup": bench_startup.main(runs=3),
+    }
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[str]:
+    """
+    Returns descriptions of metrics that regressed by more than `threshold`.
+    """
+    regressions = []
+    for group in ("http", "micro", "startup"):
+        for case, metrics in results[group].items():
+            for metric, value in metrics.items():
+                old = baseline.get(group, {}).get(case, {}).get(metric)
+                if not old or metric == "requests":
+                    continue
+                change = value / old - 1
+                if metric not in HIGHER_IS_BETTER:
+                    change = -change
+                if change < -threshold:
+                    regressions.append(
+                        f"{group}.{case}.{metric}: {old:,.2f} -> {value:,.2f}"
+                    )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    results = run(args.requests, args.concurrency, args.number)
+    args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
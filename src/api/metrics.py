@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.core.metrics import metrics
+from src.settings import settings
+
+
+router_metrics = APIRouter()
+
+
+@router_metrics.get(
+    settings.metrics.path,
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Отдаем метрики процесса в текстовом формате Prometheus.
+    """
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
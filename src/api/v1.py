@@ -1,7 +1,11 @@
 from fastapi import APIRouter
+from src.core.unit_of_work import UnitOfWorkRoute
 from src.settings import settings
 
-
-router_v1 = APIRouter(prefix=settings.api.v1.prefix)
+router_v1 = APIRouter(
+    prefix=settings.api.v1.prefix,
+    route_class=UnitOfWorkRoute,
+)
 # Include API routers
+# (routers using TransactionDep must be created with route_class=UnitOfWorkRoute)
 # router_v1.include_router()
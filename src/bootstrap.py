@@ -1,22 +1,44 @@
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.core.database import get_db_provider
+from src.core.metrics import metrics
+from src.core.responses import SchemaJSONResponse
 from src.settings import settings
+from src.handlers import apply_exception_handlers
 from src.middleware import apply_middleware
 from src.router import apply_routes
 from src.logs import setup_logging
 
-setup_logging(settings.base_dir)
-
 logger = logging.getLogger(__name__)
 
+startup_seconds = metrics.gauge(
+    "app_startup_seconds",
+    "Seconds from create_app to the end of the lifespan startup",
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("Application started successfully!")
+    # Engines and pools are created here, in the serving process
+    db_provider = get_db_provider()
+    if settings.db.pool_warm_up:
+        await db_provider.warm_up()
+        logger.info("Database connection pools warmed up.")
+    elapsed = time.perf_counter() - app.state.created_at
+    startup_seconds.set(elapsed)
+    budget = settings.run.startup_budget
+    if budget is not None and elapsed > budget:
+        logger.warning(
+            "Application startup took %.3f s, over the %.3f s budget", elapsed, budget
+        )
+    logger.info("Application started successfully in %.3f s!", elapsed)
     yield
+    await db_provider.dispose()
+    get_db_provider.cache_clear()
     logger.info("Application shut down.")
 
 
@@ -27,8 +49,14 @@ def create_app() -> FastAPI:
     Applies:
     1. Middlewares.
     2. Routes.
-    3. Addition modules (admin-panel, handlers, etc.)
+    3. Addition modules (admin-panel, exception handlers, etc.)
+
+    Logging is configured here rather than on import; the database
+    provider is created lazily by the lifespan handler.
     """
+    created_at = time.perf_counter()
+    setup_logging(settings.base_dir)
+
     docs_url = "/docs" if settings.debug else None
     redoc_url = "/redoc" if settings.debug else None
     openapi_url = "/openapi.json" if settings.debug else None
@@ -39,7 +67,10 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         openapi_url=openapi_url,
+        default_response_class=SchemaJSONResponse,
     )
+    app.state.created_at = created_at
     app = apply_middleware(app)
     app = apply_routes(app)
+    app = apply_exception_handlers(app)
     return app
@@ -0,0 +1,2 @@
+from .backends import CacheBackend as CacheBackend
+from .backends import MemoryCacheBackend as MemoryCacheBackend
@@ -0,0 +1,103 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Mapping
+
+
+class CacheBackend(ABC):
+    """
+    Асинхронный интерфейс хранилища кэша.
+
+    Позволяет подменить in-process кэш внешним хранилищем (Redis и т.п.)
+    или фейком в тестах.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """
+        Получаем значения по ключам. Отсутствующие ключи в результат не попадают.
+        """
+        ...
+
+    @abstractmethod
+    async def set_many(
+        self,
+        items: Mapping[Hashable, Any],
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Сохраняем значения. `ttl` в секундах, None - время жизни по умолчанию.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[Hashable]) -> None:
+        """
+        Удаляем значения по ключам.
+        """
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Очищаем кэш.
+        """
+        ...
+
+    async def get(self, key: Hashable) -> Any | None:
+        return (await self.get_many((key,))).get(key)
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        await self.set_many({key: value}, ttl)
+
+    async def delete(self, key: Hashable) -> None:
+        await self.delete_many((key,))
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process кэш с вытеснением по LRU и временем жизни записей.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float | None = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        now = time.monotonic()
+        result = {}
+        for key in keys:
+            entry = self._data.get(key)
+            if entry is None:
+                continue
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                continue
+            self._data.move_to_end(key)
+            result[key] = value
+        return result
+
+    async def set_many(
+        self,
+        items: Mapping[Hashable, Any],
+        ttl: float | None = None,
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        for key, value in items.items():
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete_many(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
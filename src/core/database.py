@@ -1,14 +1,32 @@
-from typing import AsyncGenerator, Annotated
-from fastapi import Depends
+import asyncio
+import functools
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Annotated, Sequence
+from fastapi import Depends, Request
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
 )
 
-from src.settings import settings
+from src.core.pool import InstrumentedAsyncAdaptedQueuePool, pool_metrics
+from src.core.replicas import (
+    ReplicaBalancing,
+    ReplicaRouter,
+    RoutingSession,
+    use_primary,
+)
+from src.core.repositories.loader import LOADERS_SESSION_KEY
+from src.core.statements import asyncpg_connect_args, statement_cache
+from src.core.tracing import QueryTracer
+from src.core.unit_of_work import UnitOfWork, UNIT_OF_WORK_SESSION_KEY
+from src.settings import Settings, settings
 
 
 class DatabaseProvider:
@@ -19,39 +37,212 @@ class DatabaseProvider:
         echo_pool: bool = False,
         max_overflow: int = 10,
         pool_size: int = 50,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        query_cache_size: int = 500,
+        prepared_statement_cache_size: int = 100,
+        pgbouncer: bool = False,
+        replica_urls: Sequence[str] = (),
+        replica_balancing: ReplicaBalancing = "round_robin",
+        read_your_writes_window: float = 0.0,
+        query_tracer: QueryTracer | None = None,
     ) -> None:
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
+        self.pool_size = pool_size
+        self.query_tracer = query_tracer
+        _providers.add(self)
+        engine_options = dict(
             echo=echo,
             echo_pool=echo_pool,
             max_overflow=max_overflow,
             pool_size=pool_size,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            query_cache_size=query_cache_size,
+        )
+        self.asyncpg_connect_args = asyncpg_connect_args(
+            prepared_statement_cache_size, pgbouncer
+        )
+        self.engine: AsyncEngine = self._create_engine(url, "primary", **engine_options)
+        self.replica_engines: list[AsyncEngine] = [
+            self._create_engine(replica_url, f"replica-{index}", **engine_options)
+            for index, replica_url in enumerate(replica_urls)
+        ]
+        self.router = ReplicaRouter(
+            primary=self.engine,
+            replicas=self.replica_engines,
+            balancing=replica_balancing,
+            read_your_writes_window=read_your_writes_window,
         )
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            router=self.router,
         )
 
+    def _create_engine(self, url: str, name: str, **options: Any) -> AsyncEngine:
+        if make_url(url).get_driver_name() == "asyncpg":
+            options["connect_args"] = self.asyncpg_connect_args
+        engine = create_async_engine(url=url, pool_logging_name=name, **options)
+        pool_metrics.instrument(name, engine)
+        statement_cache.instrument(name, engine)
+        if self.query_tracer is not None:
+            self.query_tracer.instrument(name, engine)
+        return engine
+
+    async def warm_up(self) -> None:
+        """
+        Открываем `pool_size` соединений в каждом пуле заранее, чтобы первые
+        запросы после старта не платили за установку соединения.
+        """
+
+        async def open_connection(engine: AsyncEngine) -> AsyncConnection:
+            return await engine.connect()
+
+        for engine in (self.engine, *self.replica_engines):
+            connections = await asyncio.gather(
+                *(open_connection(engine) for _ in range(self.pool_size))
+            )
+            for connection in connections:
+                await connection.close()
+
+    def reset_after_fork(self) -> None:
+        """
+        Сбрасываем пулы в дочернем процессе после fork.
+
+        Соединения родителя не закрываются (ими продолжает пользоваться
+        родитель), дочерний процесс открывает собственные.
+        """
+        for engine in (self.engine, *self.replica_engines):
+            engine.sync_engine.dispose(close=False)
+
     async def dispose(self) -> None:
         await self.engine.dispose()
+        for replica_engine in self.replica_engines:
+            await replica_engine.dispose()
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_factory() as session:
             try:
                 yield session
             finally:
+                session.info.pop(LOADERS_SESSION_KEY, None)
                 await session.close()
 
+    async def transaction_getter(
+        self,
+        request: Request,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Сессия с одной транзакцией на запрос (единица работы).
 
-db_provider = DatabaseProvider(
-    url=settings.db.dsn,
-    echo=settings.debug,
-    echo_pool=settings.db.echo_pool,
-    max_overflow=settings.db.max_overflow,
-    pool_size=settings.db.pool_size,
-)
+        Транзакция фиксируется `UnitOfWorkRoute` до отправки ответа
+        и откатывается, если обработчик завершился ошибкой. Все запросы
+        такой сессии выполняются на primary.
+        """
+        async with self.session_factory() as session:
+            use_primary(session)
+            unit_of_work = UnitOfWork(session)
+            setattr(request.state, UNIT_OF_WORK_SESSION_KEY, unit_of_work)
+            try:
+                await unit_of_work.begin()
+                yield session
+                # Маршруты без UnitOfWorkRoute фиксируются здесь, уже после ответа
+                await unit_of_work.commit()
+            except BaseException:
+                await unit_of_work.rollback()
+                raise
+            finally:
+                unit_of_work.close()
+                session.info.pop(LOADERS_SESSION_KEY, None)
+
+
+_providers: weakref.WeakSet[DatabaseProvider] = weakref.WeakSet()
+
+
+def _reset_providers_after_fork() -> None:
+    for provider in list(_providers):
+        provider.reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_providers_after_fork)
+
+
+def create_db_provider(settings: Settings) -> DatabaseProvider:
+    """
+    Создаём провайдер по настройкам приложения.
+
+    Лимиты пула заданы на весь сервер и делятся между процессами-воркерами.
+    """
+    pool_size, max_overflow = settings.worker_pool_limits
+    return DatabaseProvider(
+        url=settings.db.dsn,
+        echo=settings.debug,
+        echo_pool=settings.db.echo_pool,
+        max_overflow=max_overflow,
+        pool_size=pool_size,
+        pool_timeout=settings.db.pool_timeout,
+        pool_recycle=settings.db.pool_recycle,
+        pool_pre_ping=settings.db.pool_pre_ping,
+        query_cache_size=settings.db.query_cache_size,
+        prepared_statement_cache_size=settings.db.prepared_statement_cache_size,
+        pgbouncer=settings.db.pgbouncer,
+        replica_urls=settings.db.replicas,
+        replica_balancing=settings.db.replica_balancing,
+        read_your_writes_window=settings.db.read_your_writes_window,
+        query_tracer=(
+            QueryTracer(
+                slow_query_threshold=settings.tracing.slow_query_threshold,
+                n_plus_one_threshold=settings.tracing.n_plus_one_threshold,
+            )
+            if settings.tracing.enabled
+            else None
+        ),
+    )
+
+
+@functools.cache
+def get_db_provider() -> DatabaseProvider:
+    """
+    Провайдер приложения, создаётся при первом обращении.
+
+    Импорт модуля не создаёт движков и не открывает соединений.
+    `get_db_provider.cache_clear()` сбрасывает провайдер, например
+    после изменения настроек в тестах.
+    """
+    return create_db_provider(settings)
+
+
+def __getattr__(name: str) -> Any:
+    # Совместимость с `from src.core.database import db_provider`
+    if name == "db_provider":
+        return get_db_provider()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Зависимость: сессия провайдера приложения (`DatabaseProvider.session_getter`).
+    """
+    getter = asynccontextmanager(get_db_provider().session_getter)
+    async with getter() as session:
+        yield session
+
+
+async def get_transaction(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Зависимость: сессия с транзакцией на запрос
+    (`DatabaseProvider.transaction_getter`).
+    """
+    getter = asynccontextmanager(get_db_provider().transaction_getter)
+    async with getter(request) as session:
+        yield session
 
 
-SessionDep = Annotated[AsyncSession, Depends(db_provider.session_getter)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+TransactionDep = Annotated[AsyncSession, Depends(get_transaction)]
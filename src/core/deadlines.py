@@ -0,0 +1,46 @@
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator
+
+# Дедлайн текущего HTTP запроса (`time.monotonic()`), None - без дедлайна.
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextlib.contextmanager
+def request_deadline(deadline: float | None) -> Iterator[None]:
+    """
+    Устанавливаем дедлайн для кода внутри блока (см. `deadline_timeout`).
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """
+    Секунды до дедлайна текущего запроса или None, если дедлайна нет.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def deadline_expired() -> bool:
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+@contextlib.asynccontextmanager
+async def deadline_timeout() -> AsyncIterator[None]:
+    """
+    Прерываем блок `TimeoutError`, когда наступает дедлайн запроса.
+
+    Без дедлайна блок выполняется без ограничения времени.
+    """
+    async with asyncio.timeout(remaining()):
+        yield
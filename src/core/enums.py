@@ -33,3 +33,16 @@ class ModelActionEnum(StrEnum):
     UPDATE = auto()
     UPSERT = auto()
     DELETE = auto()
+
+
+class CountStrategyEnum(StrEnum):
+    """
+    Способ подсчета моделей.
+    """
+
+    # count(*) по всем подходящим строкам
+    EXACT = auto()
+    # Оценка планировщика (pg_class.reltuples, EXPLAIN), малые значения точно
+    ESTIMATED = auto()
+    # Точно до `count_cap`, больше — "N+"
+    CAPPED = auto()
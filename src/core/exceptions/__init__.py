@@ -1,3 +1,7 @@
 from .repository import ModelNotFoundError as ModelNotFoundError
 from .repository import ModelIntegrityError as ModelIntegrityError
 from .repository import ModelAlreadyExistsError as ModelAlreadyExistsError
+from .repository import ModelConflictError as ModelConflictError
+from .repository import InvalidPaginationError as InvalidPaginationError
+from .repository import BusinessLogicException as BusinessLogicException
+from .handlers import BusinessExceptionHandler as BusinessExceptionHandler
@@ -0,0 +1,93 @@
+import functools
+from typing import Mapping
+
+from fastapi import Request
+from pydantic_core import to_json
+from starlette.responses import Response
+
+from src.core.exceptions.repository import (
+    BusinessLogicException,
+    ModelAlreadyExistsError,
+    ModelConflictError,
+    ModelIntegrityError,
+    ModelNotFoundError,
+)
+from src.core.metrics import MetricsRegistry, metrics
+from src.core.responses import SchemaJSONResponse
+
+# Статусы ответов по типам исключений, ищутся по MRO исключения
+DEFAULT_STATUS_CODES: Mapping[type[BusinessLogicException], int] = {
+    ModelNotFoundError: 404,
+    ModelAlreadyExistsError: 409,
+    ModelConflictError: 409,
+    ModelIntegrityError: 409,
+    BusinessLogicException: 422,
+}
+
+
+class BusinessExceptionHandler:
+    """
+    Обработчик исключений бизнес-логики для `FastAPI.add_exception_handler`.
+
+    Тело ответа совпадает с `get_schema(debug).model_dump_json()`, но вне
+    режима отладки собирается из заранее сериализованных частей шаблона
+    класса исключения: сериализуются только сообщение и дополнительные
+    поля, схема не строится, трассировка не форматируется. Для классов,
+    переопределяющих `get_schema`, тело всегда строится из их схемы.
+    """
+
+    def __init__(
+        self,
+        debug: bool = False,
+        status_codes: Mapping[type[BusinessLogicException], int] = DEFAULT_STATUS_CODES,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self.debug = debug
+        self.status_codes = status_codes
+        self._errors = registry.counter(
+            "business_errors_total",
+            "Business logic exceptions answered by type and status",
+            ("type", "status"),
+        )
+        self._template = functools.cache(self._build_template)
+
+    async def __call__(self, request: Request, exc: Exception) -> Response:
+        if not isinstance(exc, BusinessLogicException):
+            raise TypeError(
+                f"{type(self).__name__} handles only BusinessLogicException, "
+                f"got {type(exc).__name__}"
+            )
+        status_code, prefix = self._template(type(exc))
+        self._errors.inc(type=exc.type, status=status_code)
+        return SchemaJSONResponse(self.render(exc, prefix), status_code=status_code)
+
+    def render(self, exc: BusinessLogicException, prefix: bytes | None) -> bytes:
+        """
+        Сериализуем тело ответа.
+        """
+        if self.debug or prefix is None:
+            return exc.get_schema(debug=self.debug).model_dump_json().encode()
+        body = prefix + to_json(exc.msg) + b',"traceback":null'
+        if extra_fields := exc.extra_fields:
+            body += b"," + to_json(extra_fields)[1:-1]
+        return body + b"}"
+
+    def _build_template(
+        self, exception_type: type[BusinessLogicException]
+    ) -> tuple[int, bytes | None]:
+        """
+        Статус ответа и начало тела ответа до значения `msg`.
+
+        Начала нет (None), если класс переопределяет `get_schema`.
+        """
+        status_code = next(
+            self.status_codes[cls]
+            for cls in exception_type.__mro__
+            if cls in self.status_codes
+        )
+        if exception_type.get_schema is not BusinessLogicException.get_schema:
+            return status_code, None
+        return (
+            status_code,
+            b'{"type":' + to_json(exception_type._type_name) + b',"msg":',
+        )
@@ -1,7 +1,7 @@
 import traceback
 from abc import ABC, abstractmethod
 
-from typing import Iterable
+from typing import Any, ClassVar, Iterable
 
 from src.core.utils import to_snake_case
 from src.core.enums import ModelActionEnum
@@ -17,12 +17,23 @@ class BusinessLogicException(Exception, ABC):
     Базовое исключение бизнес-логики.
     """
 
+    # Тип ошибки, вычисляется один раз при объявлении класса
+    _type_name: str
+    # Схема ответа, дополнительные поля схемы берутся из `extra_fields`
+    schema_type: ClassVar[type[BusinessLogicExceptionSchema]] = (
+        BusinessLogicExceptionSchema
+    )
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._type_name = to_snake_case(cls.__name__.replace("Error", ""))
+
     @property
     def type(self) -> str:
         """
         Тип ошибки.
         """
-        return to_snake_case(type(self).__name__.replace("Error", ""))
+        return self._type_name
 
     @property
     @abstractmethod
@@ -32,25 +43,34 @@ class BusinessLogicException(Exception, ABC):
         """
         ...
 
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        """
+        Дополнительные поля схемы исключения (после `traceback`).
+        """
+        return {}
+
     def __str__(self) -> str:
         return self.msg
 
     def get_schema(self, debug: bool) -> BusinessLogicExceptionSchema:
         """
         Получаем схему исключения.
+
+        Трассировка форматируется только в режиме отладки.
         """
-        return BusinessLogicExceptionSchema(
-            type=self.type,
+        return self.schema_type(
+            type=self._type_name,
             msg=self.msg,
-            traceback=(
-                "".join(
-                    traceback.format_exception(type(self), self, self.__traceback__)
-                )
-                if debug
-                else None
-            ),
+            traceback=self._traceback(debug),
+            **self.extra_fields,
         )
 
+    def _traceback(self, debug: bool) -> str | None:
+        if not debug:
+            return None
+        return "".join(traceback.format_exception(type(self), self, self.__traceback__))
+
 
 class ModelNotFoundError(BusinessLogicException):
     """
@@ -94,6 +114,8 @@ class ModelAlreadyExistsError(BusinessLogicException):
     Ошибка, возникающая при попытке создать модель с существующим уникальным полем.
     """
 
+    schema_type = ModelAlreadyExistsErrorSchema
+
     def __init__(self, field: str, message: str, *args: object) -> None:
         super().__init__(*args)
         self.field = field
@@ -103,10 +125,9 @@ class ModelAlreadyExistsError(BusinessLogicException):
     def msg(self) -> str:
         return self.message
 
-    def get_schema(self, debug: bool) -> BusinessLogicExceptionSchema:
-        return ModelAlreadyExistsErrorSchema.model_validate(
-            {**super().get_schema(debug).model_dump(), "field": self.field}
-        )
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        return {"field": self.field}
 
 
 class ModelIntegrityError(BusinessLogicException):
@@ -119,10 +140,12 @@ class ModelIntegrityError(BusinessLogicException):
         model: type[ModelType] | str,
         action: ModelActionEnum,
         *args: object,
+        chunk: int | None = None,
     ) -> None:
         super().__init__(*args)
         self.model = model
         self.action = action
+        self.chunk = chunk
 
     @property
     def msg(self) -> str:
@@ -140,4 +163,59 @@ class ModelIntegrityError(BusinessLogicException):
                 msg += f" при создании или изменении модели {model_name}"
             case ModelActionEnum.DELETE:
                 msg += f" при удалении модели {model_name}"
+        if self.chunk is not None:
+            msg += f" (порция {self.chunk})"
         return msg
+
+
+class ModelConflictError(BusinessLogicException):
+    """
+    Ошибка, возникающая при изменении модели, измененной параллельно
+    (версия не совпала) или не удовлетворяющей условию изменения.
+    """
+
+    def __init__(
+        self,
+        model: type[ModelType] | str,
+        model_id: IdType | Iterable[IdType],
+        *args: object,
+        expected_version: int | None = None,
+        actual_version: int | None = None,
+    ) -> None:
+        super().__init__(*args)
+        self.model = model
+        self.model_id = model_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+    @property
+    def msg(self) -> str:
+        model_name = self.model if isinstance(self.model, str) else self.model.__name__
+        if isinstance(self.model_id, Iterable):
+            return (
+                f"Версия одной из моделей {model_name} по идентификаторам: "
+                f'[{", ".join(map(str, self.model_id))}] не совпала'
+            )
+        if self.expected_version is None:
+            return (
+                f"Модель {model_name} с идентификатором {self.model_id} "
+                "не удовлетворяет условию изменения"
+            )
+        return (
+            f"Модель {model_name} с идентификатором {self.model_id} была изменена: "
+            f"ожидалась версия {self.expected_version}, текущая {self.actual_version}"
+        )
+
+
+class InvalidPaginationError(BusinessLogicException):
+    """
+    Ошибка, возникающая при некорректных параметрах пагинации.
+    """
+
+    def __init__(self, message: str, *args: object) -> None:
+        super().__init__(*args)
+        self.message = message
+
+    @property
+    def msg(self) -> str:
+        return self.message
@@ -0,0 +1,137 @@
+import atexit
+import copy
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import Any, Literal
+
+from src.core.metrics import MetricsRegistry, metrics
+
+QueuePolicy = Literal["drop", "block"]
+
+# Стандартные атрибуты LogRecord: все остальные пришли из `extra`
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))
+) | {"message", "asctime", "taskName"}
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Обработчик, передающий записи в очередь для `QueueListener`.
+
+    В потоке вызова только подставляются аргументы сообщения, форматирование
+    и вывод выполняются в потоке слушателя. При переполненной ограниченной
+    очереди запись отбрасывается (`drop`) или ожидает место не дольше
+    `block_timeout` секунд (`block`).
+    """
+
+    def __init__(
+        self,
+        queue: Queue[logging.LogRecord],
+        policy: QueuePolicy = "drop",
+        block_timeout: float = 0.05,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        super().__init__(queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._dropped = registry.counter(
+            "logging_dropped_records_total",
+            "Log records dropped because the logging queue was full",
+            ("policy",),
+        )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Фиксируем текст сообщения без форматирования записи.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except Full:
+            self._dropped.inc(policy=self.policy)
+
+    @property
+    def dropped(self) -> float:
+        return self._dropped.value(policy=self.policy)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Форматирование записи в одну JSON строку, включая поля из `extra`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.funcName}:{record.lineno}",
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускаем долю `rate` записей уровня не выше `max_level`.
+
+    Более важные записи проходят всегда.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.1,
+        max_level: int | str = logging.DEBUG,
+        name: str = "",
+    ) -> None:
+        super().__init__(name)
+        self.rate = rate
+        self.max_level = (
+            logging.getLevelName(max_level) if isinstance(max_level, str) else max_level
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > self.max_level or random.random() < self.rate
+
+
+def start_queue_listeners() -> list[QueueListener]:
+    """
+    Запускаем слушатели очередей, созданные `dictConfig` для `QueueHandler`.
+
+    Слушатели останавливаются (с выводом оставшихся записей) при выходе.
+    """
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    started = []
+    for handler in {handler for logger in loggers for handler in logger.handlers}:
+        listener = getattr(handler, "listener", None)
+        if isinstance(listener, QueueListener) and listener not in started:
+            listener.start()
+            atexit.register(listener.stop)
+            started.append(listener)
+    return started
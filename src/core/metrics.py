@@ -0,0 +1,239 @@
+import bisect
+import math
+from typing import Callable, Iterable, Mapping, TypeVar
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Metric:
+    """
+    Базовая метрика с именованными метками.
+    """
+
+    type: str
+
+    def __init__(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+    def _label_values(self, labels: Mapping[str, object]) -> LabelValues:
+        if labels.keys() != set(self.labels):
+            raise ValueError(
+                f"{self.name} expects labels {self.labels}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _format_labels(self, values: LabelValues, **extra: str) -> str:
+        pairs = [*zip(self.labels, values), *extra.items()]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """
+    Монотонно растущий счетчик.
+    """
+
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """
+    Мгновенное значение. Может вычисляться при сборе через `callback`,
+    возвращающий значения по кортежам меток.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Mapping[LabelValues, float]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        self._values[self._label_values(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        key = self._label_values(labels)
+        if self.callback is not None:
+            return self.callback().get(key, 0.0)
+        return self._values.get(key, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        values = self.callback() if self.callback is not None else self._values
+        for key, value in values.items():
+            yield f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    """
+    Гистограмма наблюдений с кумулятивными корзинами.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # По меткам: счетчики корзин (последняя - +Inf), сумма наблюдений
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = state
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, **labels: object) -> int:
+        state = self._values.get(self._label_values(labels))
+        return sum(state[0]) if state is not None else 0
+
+    def samples(self) -> Iterable[str]:
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = self._format_labels(key, le=_format_value(bound))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{self._format_labels(key)} {_format_value(total[0])}"
+            yield f"{self.name}_count{self._format_labels(key)} {cumulative}"
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """
+    In-process реестр метрик с выводом в текстовом формате Prometheus.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Mapping[LabelValues, float]] | None = None,
+    ) -> Gauge:
+        gauge = self._register(Gauge(name, documentation, labels, callback))
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+    def _register(self, metric: MetricT) -> MetricT:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labels != metric.labels:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            return existing  # type: ignore[return-value]
+        self._metrics[metric.name] = metric
+        return metric
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,18 @@
+from .admission import (
+    AdmissionControlMiddleware as AdmissionControlMiddleware,
+    remaining_time as remaining_time,
+)
+from .compression import (
+    BrotliCodec as BrotliCodec,
+    Codec as Codec,
+    CompressionMiddleware as CompressionMiddleware,
+    Compressor as Compressor,
+    GzipCodec as GzipCodec,
+    ZstdCodec as ZstdCodec,
+)
+from .http_cache import (
+    HTTPCacheMiddleware as HTTPCacheMiddleware,
+    cache_response as cache_response,
+)
+from .timing import ProcessTimeMiddleware as ProcessTimeMiddleware
+from .tracing import QueryTracingMiddleware as QueryTracingMiddleware
@@ -0,0 +1,256 @@
+import asyncio
+import time
+from collections import deque
+from typing import Literal, Mapping
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.deadlines import deadline_expired, request_deadline
+from src.core.metrics import MetricsRegistry, metrics
+
+PriorityClass = Literal["high", "normal", "low"]
+
+# Ожидающие запросы с меньшим рангом допускаются первыми
+PRIORITY_RANKS: dict[PriorityClass, int] = {"high": 0, "normal": 1, "low": 2}
+
+# Ключ в состоянии запроса: `time.monotonic()`, к которому запрос должен завершиться
+DEADLINE_KEY = "deadline"
+
+
+def remaining_time(connection: HTTPConnection) -> float | None:
+    """
+    Секунды до дедлайна, установленного `AdmissionControlMiddleware`,
+    или None, если у запроса нет дедлайна.
+    """
+    deadline = getattr(connection.state, DEADLINE_KEY, None)
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware, ограничивающий число одновременно обрабатываемых запросов.
+
+    Одновременно выполняется до `max_concurrency` запросов, следующие
+    `max_queue` ждут освобождения слота не дольше `queue_timeout` секунд
+    (и не дольше своего дедлайна). Ожидающие допускаются по классу приоритета
+    (`priorities` сопоставляет классы префиксам путей), затем в порядке
+    поступления; при заполненной очереди запрос может вытеснить ожидающий
+    запрос более низкого класса. Отклоненные запросы сразу получают 503
+    с `Retry-After` вместо ожидания соединения с базой.
+
+    При заданном `request_timeout` дедлайн запроса (монотонное время)
+    сохраняется в состоянии запроса (см. `remaining_time`) и ограничивает
+    операции репозиториев (см. `src.core.deadlines`). Если запрос не успел
+    начать ответ до дедлайна, клиент получает 503.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int,
+        max_queue: int = 100,
+        queue_timeout: float = 1.0,
+        request_timeout: float | None = None,
+        retry_after: int = 1,
+        priorities: Mapping[str, PriorityClass] | None = None,
+        default_priority: PriorityClass = "normal",
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.request_timeout = request_timeout
+        self.retry_after = retry_after
+        # Сначала самые длинные префиксы, чтобы совпал наиболее точный
+        self.priorities = sorted(
+            (priorities or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.default_priority = default_priority
+        self.in_flight = 0
+        self._waiters: dict[PriorityClass, deque[asyncio.Future[bool]]] = {
+            priority: deque()
+            for priority in sorted(PRIORITY_RANKS, key=PRIORITY_RANKS.__getitem__)
+        }
+        registry.gauge(
+            "http_admission_in_flight",
+            "Requests admitted and being processed",
+            callback=lambda: {(): self.in_flight},
+        )
+        registry.gauge(
+            "http_admission_queue_depth",
+            "Requests waiting for admission by priority class",
+            ("priority",),
+            callback=lambda: {
+                (priority,): len(waiters) for priority, waiters in self._waiters.items()
+            },
+        )
+        self._rejected = registry.counter(
+            "http_admission_rejected_total",
+            "Requests shed with 503 by reason",
+            ("priority", "reason"),
+        )
+        self._wait = registry.histogram(
+            "http_admission_wait_seconds",
+            "Time requests waited in the admission queue",
+            ("priority",),
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.monotonic()
+        deadline = None
+        if self.request_timeout is not None:
+            deadline = arrived + self.request_timeout
+            scope.setdefault("state", {})[DEADLINE_KEY] = deadline
+
+        priority = self._priority(scope["path"])
+        if self.in_flight < self.max_concurrency and not self.queue_depth:
+            self.in_flight += 1
+        else:
+            reason = await self._wait_for_slot(priority, arrived, deadline)
+            if reason is not None:
+                self._rejected.inc(priority=priority, reason=reason)
+                await self._reject(send)
+                return
+
+        try:
+            if deadline is None:
+                await self.app(scope, receive, send)
+            else:
+                await self._call_with_deadline(scope, receive, send, priority, deadline)
+        finally:
+            self._release()
+
+    async def _call_with_deadline(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        priority: PriorityClass,
+        deadline: float,
+    ) -> None:
+        """
+        Обрабатываем запрос с дедлайном: операции репозиториев прерываются
+        `TimeoutError`, который до начала ответа превращается в 503.
+        """
+        response_started = False
+
+        async def send_with_state(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        with request_deadline(deadline):
+            try:
+                await self.app(scope, receive, send_with_state)
+            except TimeoutError:
+                if response_started or not deadline_expired():
+                    raise
+                self._rejected.inc(priority=priority, reason="deadline")
+                await self._reject(send)
+
+    def _priority(self, path: str) -> PriorityClass:
+        for prefix, priority in self.priorities:
+            if path.startswith(prefix):
+                return priority
+        return self.default_priority
+
+    async def _wait_for_slot(
+        self,
+        priority: PriorityClass,
+        arrived: float,
+        deadline: float | None,
+    ) -> str | None:
+        """
+        Ставим запрос в очередь до передачи ему слота.
+
+        Возвращаем причину отказа или None, если запрос допущен.
+        """
+        if self.queue_depth >= self.max_queue and not self._displace(priority):
+            return "queue_full"
+
+        timeout = self.queue_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - arrived)
+        # True - запрос допущен, False - вытеснен
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            admitted = await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            if self._abandon(priority, waiter):
+                return None
+            return "timeout"
+        except BaseException:
+            # Клиент ушел во время ожидания: отдаем дальше уже переданный слот
+            if self._abandon(priority, waiter):
+                self._release()
+            raise
+        finally:
+            self._wait.observe(time.monotonic() - arrived, priority=priority)
+        return None if admitted else "displaced"
+
+    def _displace(self, priority: PriorityClass) -> bool:
+        """
+        Отклоняем последний ожидающий запрос класса ниже `priority`.
+        """
+        for waiter_priority in reversed(self._waiters):
+            if PRIORITY_RANKS[waiter_priority] <= PRIORITY_RANKS[priority]:
+                break
+            waiters = self._waiters[waiter_priority]
+            if waiters:
+                waiters.pop().set_result(False)
+                return True
+        return False
+
+    def _abandon(self, priority: PriorityClass, waiter: asyncio.Future[bool]) -> bool:
+        """
+        Удаляем запрос, переставший ждать.
+
+        Возвращаем True, если слот был передан ему до этого.
+        """
+        if waiter in self._waiters[priority]:
+            self._waiters[priority].remove(waiter)
+        return waiter.done() and not waiter.cancelled() and waiter.result()
+
+    def _release(self) -> None:
+        """
+        Передаем слот завершенного запроса первому ожидающему, если он есть.
+        """
+        for waiters in self._waiters.values():
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(True)
+                    return
+        self.in_flight -= 1
+
+    async def _reject(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"retry-after", str(self.retry_after).encode()),
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b'{"detail":"Service is overloaded, retry later"}',
+            }
+        )
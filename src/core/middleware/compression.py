@@ -0,0 +1,255 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Iterable, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class Compressor(ABC):
+    """
+    Потоковый компрессор тела одного ответа.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Сжимаем порцию и сбрасываем буфер, чтобы клиент мог декодировать
+        порцию потокового ответа, не дожидаясь конца тела.
+        """
+        ...
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """
+        Получаем окончание сжатого потока.
+        """
+        ...
+
+
+class Codec(ABC):
+    """
+    Кодирование содержимого, поддерживаемое `CompressionMiddleware`.
+    """
+
+    # Обозначение кодирования в Accept-Encoding / Content-Encoding
+    encoding: str
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Установлена ли необязательная зависимость кодека.
+        """
+        return True
+
+    @abstractmethod
+    def compressor(self) -> Compressor: ...
+
+
+class _ZlibCompressor(Compressor):
+    def __init__(self, level: int, wbits: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class GzipCodec(Codec):
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compressor(self) -> Compressor:
+        return _ZlibCompressor(self.level, zlib.MAX_WBITS | 16)
+
+
+class _BrotliCompressor(Compressor):
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class BrotliCodec(Codec):
+    """
+    Кодек Brotli, требует пакет `brotli`.
+    """
+
+    encoding = "br"
+
+    def __init__(self, quality: int = 4) -> None:
+        self.quality = quality
+
+    @classmethod
+    def available(cls) -> bool:
+        return brotli is not None
+
+    def compressor(self) -> Compressor:
+        return _BrotliCompressor(self.quality)
+
+
+class _ZstdCompressor(Compressor):
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ZstdCodec(Codec):
+    """
+    Кодек Zstandard, требует пакет `zstandard`.
+    """
+
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        self.level = level
+
+    @classmethod
+    def available(cls) -> bool:
+        return zstandard is not None
+
+    def compressor(self) -> Compressor:
+        return _ZstdCompressor(self.level)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware, сжимающий тела ответов.
+
+    Используется первый из `codecs` (в порядке предпочтения сервера) кодек,
+    принимаемый клиентом. Тела меньше `minimum_size`, уже закодированные
+    ответы и типы содержимого вне `content_types` (префиксы media type)
+    отправляются как есть. Потоковые ответы сжимаются по мере формирования
+    порций.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        codecs: Sequence[Codec] = (GzipCodec(),),
+        minimum_size: int = 500,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+    ) -> None:
+        self.app = app
+        self.codecs = [codec for codec in codecs if codec.available()]
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        codec = None
+        if scope["type"] == "http":
+            codec = self._select_codec(Headers(scope=scope).get("accept-encoding", ""))
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        compressor: Compressor | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor
+            if message["type"] == "http.response.start":
+                if self._should_compress(message):
+                    start_message = message
+                else:
+                    await send(message)
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+                compressor = codec.compressor()
+                headers = MutableHeaders(scope=start_message)
+                headers["content-encoding"] = codec.encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    body = compressor.compress(body) + compressor.finish()
+                    headers["content-length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+
+            body = compressor.compress(body) if body else b""
+            if not more_body:
+                body += compressor.finish()
+            if body or not more_body:
+                await send(
+                    {"type": "http.response.body", "body": body, "more_body": more_body}
+                )
+
+        await self.app(scope, receive, send_compressed)
+
+    def _select_codec(self, accept_encoding: str) -> Codec | None:
+        accepted: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            coding, *params = (part.strip() for part in item.split(";"))
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if coding:
+                accepted[coding.lower()] = quality
+        for codec in self.codecs:
+            if accepted.get(codec.encoding, accepted.get("*", 0.0)) > 0:
+                return codec
+        return None
+
+    def _should_compress(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip()
+        return media_type.startswith(self.content_types)
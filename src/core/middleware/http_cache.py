@@ -0,0 +1,292 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, TypeVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.cache import CacheBackend, MemoryCacheBackend
+from src.core.metrics import MetricsRegistry, metrics
+from src.core.middleware.timing import ROUTE_TEMPLATE_KEY, route_template
+
+HTTP_CACHE_ATTRIBUTE = "__http_cache__"
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+# Заголовки с учетными данными: ответы на такие запросы по умолчанию
+# не кэшируются (RFC 9111, 3.5)
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+# Заголовки ответа 200, повторяемые в ответе 304 (RFC 9110, 15.4.5)
+NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "vary",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """
+    Параметры кэширования маршрута, задаются `cache_response`.
+    """
+
+    ttl: float | None
+    store: bool
+    cache_control: str | None
+    credentials: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    # Шаблон маршрута для метрик ответов из кэша, которые не проходят роутинг
+    route: str
+
+
+def cache_response(
+    ttl: float | None = 60.0,
+    *,
+    store: bool = True,
+    cache_control: str | None = None,
+    credentials: bool = False,
+) -> Callable[[EndpointT], EndpointT]:
+    """
+    Включаем `HTTPCacheMiddleware` для GET маршрута.
+
+    Ответы получают строгий ETag, на условные запросы отвечаем 304.
+    При `store` ответ также хранится в кэше middleware `ttl` секунд
+    (или `max-age` самого ответа). `cache_control` устанавливается ответам
+    без собственного `Cache-Control`. Ответы на запросы с `Authorization`
+    или `Cookie` сохраняются только при `credentials`, отдельно для каждого
+    значения этих заголовков.
+
+    Применяется под декоратором роутера::
+
+        @router.get("/items")
+        @cache_response(ttl=30)
+        async def get_items() -> list[ItemSchema]: ...
+    """
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        setattr(
+            endpoint,
+            HTTP_CACHE_ATTRIBUTE,
+            CachePolicy(ttl, store, cache_control, credentials),
+        )
+        return endpoint
+
+    return decorator
+
+
+class HTTPCacheMiddleware:
+    """
+    ASGI middleware: ETag, условные GET запросы и кэш ответов в памяти
+    для маршрутов с `cache_response`.
+
+    Ключ записи кэша - путь, строка запроса, заголовки запроса из `vary`
+    и заголовки с учетными данными (`Authorization`, `Cookie`), поэтому
+    ответ одному пользователю не отдается другому. Ответы на запросы
+    с учетными данными сохраняются, только если маршрут разрешил это
+    (`cache_response(credentials=True)`). Запросы с `Cache-Control: no-cache`
+    не читают кэш, с `no-store` - также не сохраняются в него. Ответы
+    с `no-store`, `private` или `Set-Cookie` не сохраняются никогда.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: CacheBackend | None = None,
+        vary: Iterable[str] = ("accept-encoding",),
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self.app = app
+        self.cache = cache if cache is not None else MemoryCacheBackend(maxsize=1024)
+        self.vary = tuple(header.lower() for header in vary)
+        self.requests = registry.counter(
+            "http_cache_requests_total",
+            "HTTP cache lookups by result",
+            ("result",),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        request_directives = _directives(request_headers.get("cache-control", ""))
+        key = self._key(scope, request_headers)
+        if (
+            "no-cache" not in request_directives
+            and "no-store" not in request_directives
+        ):
+            cached: CachedResponse | None = await self.cache.get(key)
+            if cached is not None:
+                scope[ROUTE_TEMPLATE_KEY] = cached.route
+                if _etag_matches(request_headers, cached.etag):
+                    self.requests.inc(result="not_modified")
+                    await _send_not_modified(send, cached.headers)
+                else:
+                    self.requests.inc(result="hit")
+                    await _send_cached(send, cached)
+                return
+
+        start_message: Message | None = None
+        policy: CachePolicy | None = None
+        body: list[bytes] = []
+
+        async def send_with_cache(message: Message) -> None:
+            nonlocal start_message, policy
+            if message["type"] == "http.response.start":
+                # Роутер сохраняет найденный обработчик в общем scope
+                policy = getattr(scope.get("endpoint"), HTTP_CACHE_ATTRIBUTE, None)
+                if policy is None or message["status"] != 200:
+                    policy = None
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if policy is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._respond(
+                send,
+                key,
+                route_template(scope),
+                policy,
+                start_message,
+                b"".join(body),
+                request_headers,
+                request_directives,
+            )
+
+        await self.app(scope, receive, send_with_cache)
+
+    async def _respond(
+        self,
+        send: Send,
+        key: tuple[Any, ...],
+        route: str,
+        policy: CachePolicy,
+        start_message: Message,
+        body: bytes,
+        request_headers: Headers,
+        request_directives: dict[str, str | None],
+    ) -> None:
+        headers = MutableHeaders(scope=start_message)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        headers["etag"] = etag
+        if policy.cache_control is not None and "cache-control" not in headers:
+            headers["cache-control"] = policy.cache_control
+        response = CachedResponse(
+            start_message["status"], headers.raw, body, etag, route
+        )
+
+        credentialed = any(header in request_headers for header in CREDENTIAL_HEADERS)
+        ttl = self._store_ttl(policy, headers, request_directives, credentialed)
+        if ttl is not None:
+            await self.cache.set(key, response, ttl)
+            self.requests.inc(result="miss")
+        else:
+            self.requests.inc(result="bypass")
+
+        if _etag_matches(request_headers, etag):
+            await _send_not_modified(send, response.headers)
+        else:
+            await _send_cached(send, response)
+
+    @staticmethod
+    def _store_ttl(
+        policy: CachePolicy,
+        headers: MutableHeaders,
+        request_directives: dict[str, str | None],
+        credentialed: bool,
+    ) -> float | None:
+        """
+        Время хранения ответа в кэше или None, если ответ не сохраняется.
+        """
+        directives = _directives(headers.get("cache-control", ""))
+        if (
+            not policy.store
+            or (credentialed and not policy.credentials)
+            or "no-store" in request_directives
+            or "no-store" in directives
+            or "private" in directives
+            or "set-cookie" in headers
+        ):
+            return None
+        max_age = directives.get("s-maxage") or directives.get("max-age")
+        if max_age is not None:
+            try:
+                return float(max_age) or None
+            except ValueError:
+                return None
+        return policy.ttl
+
+    def _key(self, scope: Scope, headers: Headers) -> tuple[Any, ...]:
+        return (
+            scope["path"],
+            scope["query_string"],
+            *(headers.get(header) for header in self.vary),
+            *(headers.get(header) for header in CREDENTIAL_HEADERS),
+        )
+
+
+def _directives(cache_control: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _etag_matches(headers: Headers, etag: str) -> bool:
+    """
+    Слабое сравнение `If-None-Match` с ETag ответа.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def _send_cached(send: Send, response: CachedResponse) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response.status,
+            "headers": response.headers,
+        }
+    )
+    await send({"type": "http.response.body", "body": response.body})
+
+
+async def _send_not_modified(send: Send, headers: list[tuple[bytes, bytes]]) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [
+                (name, value)
+                for name, value in headers
+                if name.decode("latin-1") in NOT_MODIFIED_HEADERS
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": b""})
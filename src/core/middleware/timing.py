@@ -0,0 +1,69 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import MetricsRegistry, metrics
+
+UNMATCHED_ROUTE = "<unmatched>"
+# Ключ в scope: шаблон маршрута ответа, отданного без роутинга (из HTTP кэша)
+ROUTE_TEMPLATE_KEY = "route_template"
+
+
+class ProcessTimeMiddleware:
+    """
+    ASGI middleware: добавляет заголовок `X-Process-Time` и записывает
+    длительность запросов по шаблону маршрута (`/items/{item_id}`, а не пути).
+
+    В отличие от `BaseHTTPMiddleware` не оборачивает приложение в отдельные
+    задачи и потоки в памяти, поэтому потоковые ответы сохраняют backpressure.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Process-Time",
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self.app = app
+        self.header_name = header_name
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template",
+            ("method", "route", "status"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(self.header_name, f"{time.perf_counter() - started:.5f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_process_time)
+        finally:
+            self.latency.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route_template(scope),
+                status=status_code,
+            )
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Шаблон маршрута запроса для меток метрик.
+    """
+    # Роутер сохраняет найденный маршрут в общем scope
+    route = getattr(scope.get("route"), "path_format", None)
+    return route or scope.get(ROUTE_TEMPLATE_KEY) or UNMATCHED_ROUTE
@@ -0,0 +1,51 @@
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.tracing import trace_request
+
+
+class QueryTracingMiddleware:
+    """
+    ASGI middleware: связывает запросы к базе с идентификатором HTTP запроса
+    и сообщает их число и общее время в заголовке `Server-Timing`.
+
+    Идентификатор берется из заголовка запроса `request_id_header`
+    (или генерируется) и возвращается в ответе.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        request_id_header: str = "X-Request-ID",
+        server_timing: bool = True,
+    ) -> None:
+        self.app = app
+        self.request_id_header = request_id_header
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.request_id_header)
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        with trace_request(request_id) as trace:
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[self.request_id_header] = request_id
+                    if self.server_timing:
+                        headers.append(
+                            "Server-Timing",
+                            f"db;dur={trace.db_time * 1000:.3f};"
+                            f'desc="{trace.query_count} queries"',
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
@@ -1,5 +1,7 @@
 __all__ = (
     "Base",
+    "VersionMixin",
 )
 
 from .base import Base
+from .mixins import VersionMixin
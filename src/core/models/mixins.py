@@ -0,0 +1,24 @@
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+__all__ = ("VersionMixin",)
+
+
+class VersionMixin:
+    """
+    Версия строки для оптимистичной блокировки.
+
+    Версия увеличивается при каждом изменении: при flush ORM (`version_id_col`)
+    и в `CrudBaseRepository.update`, который проверяет переданную версию
+    в том же запросе UPDATE вместо `SELECT ... FOR UPDATE`.
+    """
+
+    version: Mapped[int] = mapped_column(
+        nullable=False, default=1, server_default=text("1")
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"version_id_col": cls.version}
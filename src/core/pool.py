@@ -0,0 +1,105 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+from src.core.metrics import LabelValues, MetricsRegistry, metrics
+
+CONNECT_TIME_KEY = "connected_at"
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, замеряющий ожидание выдачи соединения и таймауты.
+
+    Метка пула в метриках - `pool_logging_name` движка.
+    """
+
+    registry: MetricsRegistry = metrics
+
+    def connect(self) -> Any:
+        labels = {"pool": self._orig_logging_name or "default"}
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.registry.counter(
+                "db_pool_checkout_timeouts_total",
+                "Checkouts that timed out waiting for a connection",
+                ("pool",),
+            ).inc(**labels)
+            raise
+        self.registry.histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pooled connection",
+            ("pool",),
+        ).observe(time.perf_counter() - started, **labels)
+        return connection
+
+
+class PoolMetrics:
+    """
+    Метрики пулов соединений движков: ожидание, использование и возраст соединений.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics) -> None:
+        self.registry = registry
+        self._engines: dict[str, AsyncEngine] = {}
+        self._connection_age = registry.histogram(
+            "db_pool_connection_age_seconds",
+            "Age of pooled connections at checkout",
+            ("pool",),
+            buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200),
+        )
+        self._connects = registry.counter(
+            "db_pool_connects_total",
+            "New DBAPI connections opened by the pool",
+            ("pool",),
+        )
+        for name, documentation, stat in (
+            ("db_pool_connections_in_use", "Connections checked out", "checkedout"),
+            ("db_pool_connections_idle", "Connections idle in the pool", "checkedin"),
+            ("db_pool_connections_overflow", "Overflow connections", "overflow"),
+        ):
+            registry.gauge(
+                name,
+                documentation,
+                ("pool",),
+                callback=lambda stat=stat: self._collect(stat),
+            )
+
+    def instrument(self, name: str, engine: AsyncEngine) -> None:
+        """
+        Подключаем метрики к пулу движка.
+        """
+        self._engines[name] = engine
+        labels = {"pool": name}
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+            record.info[CONNECT_TIME_KEY] = time.monotonic()
+            self._connects.inc(**labels)
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def on_checkout(
+            dbapi_connection: Any,
+            record: ConnectionPoolEntry,
+            proxy: Any,
+        ) -> None:
+            connected_at = record.info.get(CONNECT_TIME_KEY)
+            if connected_at is not None:
+                self._connection_age.observe(time.monotonic() - connected_at, **labels)
+
+    def _collect(self, stat: str) -> dict[LabelValues, float]:
+        values = {}
+        for name, engine in self._engines.items():
+            pool: Pool = engine.pool
+            method = getattr(pool, stat, None)
+            if method is not None:
+                values[(name,)] = max(method(), 0)
+        return values
+
+
+pool_metrics = PoolMetrics()
@@ -0,0 +1,136 @@
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Any, Literal, Sequence
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, SessionTransactionOrigin
+
+ReplicaBalancing = Literal["round_robin", "least_connections"]
+
+# Ключ в `Session.info`: все запросы сессии направляются на primary.
+FORCE_PRIMARY_SESSION_KEY = "force_primary"
+# Ключ в `Session.info`: текущая транзакция выполняется на primary
+# (открыта явно или в ней уже была запись).
+PRIMARY_TRANSACTION_KEY = "primary_transaction"
+
+# Время последней записи (`time.monotonic()`) в текущем контексте: у каждого
+# HTTP запроса (задачи asyncio) свое окно read-your-writes.
+_last_write_at: ContextVar[float] = ContextVar("last_write_at", default=float("-inf"))
+
+
+class ReplicaRouter:
+    """
+    Выбор движка для запроса: primary или одна из реплик.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        balancing: ReplicaBalancing = "round_robin",
+        read_your_writes_window: float = 0.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.balancing = balancing
+        self.read_your_writes_window = read_your_writes_window
+        self._round_robin = itertools.cycle(self.replicas)
+
+    def for_write(self) -> Engine:
+        """
+        Движок для записи. Запоминаем время записи для окна read-your-writes
+        текущего контекста: записи других запросов на него не влияют.
+        """
+        _last_write_at.set(time.monotonic())
+        return self.primary.sync_engine
+
+    def for_read(self) -> Engine:
+        """
+        Движок для чтения вне пишущей транзакции.
+        """
+        if not self.replicas or self._in_read_your_writes_window():
+            return self.primary.sync_engine
+        if self.balancing == "least_connections":
+            replica = min(self.replicas, key=self._checked_out)
+        else:
+            replica = next(self._round_robin)
+        return replica.sync_engine
+
+    def _in_read_your_writes_window(self) -> bool:
+        return time.monotonic() - _last_write_at.get() < self.read_your_writes_window
+
+    @staticmethod
+    def _checked_out(engine: AsyncEngine) -> int:
+        checkedout = getattr(engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
+
+
+class RoutingSession(Session):
+    """
+    Сессия, направляющая чтение на реплики, а запись - на primary.
+
+    На primary остаются: запись (flush, INSERT/UPDATE/DELETE, текстовые
+    запросы), `SELECT ... FOR UPDATE`, все запросы явно открытой транзакции
+    (`session.begin()`), чтения после записи в той же транзакции и все
+    запросы сессий с `FORCE_PRIMARY_SESSION_KEY`.
+    """
+
+    def __init__(
+        self, *args: Any, router: ReplicaRouter | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(
+        self, mapper: Any = None, *, clause: Any = None, **kwargs: Any
+    ) -> Engine:
+        router = self.router
+        if router is None or not router.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or not _is_read(clause):
+            self.info[PRIMARY_TRANSACTION_KEY] = True
+            return router.for_write()
+        if self.info.get(FORCE_PRIMARY_SESSION_KEY) or self.info.get(
+            PRIMARY_TRANSACTION_KEY
+        ):
+            return router.primary.sync_engine
+        return router.for_read()
+
+
+@event.listens_for(RoutingSession, "after_transaction_create")
+def _pin_explicit_transaction(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # Чтения пишущей транзакции до ее первой записи тоже идут на primary
+    if transaction.parent is None and (
+        transaction.origin is SessionTransactionOrigin.BEGIN
+    ):
+        session.info[PRIMARY_TRANSACTION_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_primary_transaction(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    if transaction.parent is None:
+        session.info.pop(PRIMARY_TRANSACTION_KEY, None)
+
+
+def _is_read(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    Направляем все запросы сессии на primary.
+    """
+    session.info[FORCE_PRIMARY_SESSION_KEY] = True
+
+
+def use_primary_transaction(session: AsyncSession) -> None:
+    """
+    Направляем на primary все дальнейшие запросы текущей транзакции сессии.
+    """
+    session.info[PRIMARY_TRANSACTION_KEY] = True
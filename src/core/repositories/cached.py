@@ -0,0 +1,182 @@
+import functools
+from typing import Any, ClassVar, Hashable, Iterable, Mapping, Sequence
+
+from sqlalchemy import ColumnElement
+
+from src.core.cache import CacheBackend
+from src.core.repositories.crud import CrudBaseRepository
+from src.core.unit_of_work import UnitOfWork
+from src.core.type_vars import (
+    ModelType,
+    CreateSchemaBaseType,
+    UpdateSchemaBaseType,
+    ReadSchemaBaseType,
+    IdType,
+)
+
+
+class CachedCrudRepository(
+    CrudBaseRepository[
+        ModelType,
+        ReadSchemaBaseType,
+        CreateSchemaBaseType,
+        UpdateSchemaBaseType,
+        IdType,
+    ]
+):
+    """
+    CRUD репозиторий с read-through кэшем схем по ключу
+    `(model_type, read_schema_type, id)`.
+
+    `get`, `get_one_or_none` и `get_by_ids` сначала читают кэш, в базу уходят
+    только отсутствующие идентификаторы. Операции записи инвалидируют
+    затронутые ключи всех схем чтения модели (репозиториев, использующих
+    то же хранилище). Схемы из кэша разделяются между вызовами
+    и не должны изменяться.
+    """
+
+    cache: ClassVar[CacheBackend]
+    # Время жизни записей в секундах, None - значение по умолчанию хранилища.
+    cache_ttl: ClassVar[float | None] = None
+    # Схемы чтения кэширующих репозиториев каждой модели.
+    _read_schema_types: ClassVar[dict[type[Any], set[type[Any]]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model_type = getattr(cls, "model_type", None)
+        read_schema_type = getattr(cls, "read_schema_type", None)
+        if model_type is not None and read_schema_type is not None:
+            cls._read_schema_types.setdefault(model_type, set()).add(read_schema_type)
+
+    async def get(self, id: IdType) -> ReadSchemaBaseType:
+        key = self._cache_key(id)
+        cached = await self.cache.get_many((key,))
+        if key in cached:
+            return cached[key]
+        schema = await super().get(id)
+        await self._store({key: schema})
+        return schema
+
+    async def get_by_ids(
+        self,
+        ids: Sequence[IdType],
+        *,
+        strict: bool = False,
+    ) -> list[ReadSchemaBaseType]:
+        keys = {id: self._cache_key(id) for id in ids}
+        cached = await self.cache.get_many(keys.values())
+        missing = [id for id, key in keys.items() if key not in cached]
+        schemas = [cached[key] for key in keys.values() if key in cached]
+        if missing:
+            fetched = await super().get_by_ids(missing)
+            await self._store(
+                {self._cache_key(schema.id): schema for schema in fetched}
+            )
+            schemas += fetched
+        self._check_get_by_ids_strict(ids, schemas, strict)
+        return schemas
+
+    async def create(self, create_obj: CreateSchemaBaseType) -> ReadSchemaBaseType:
+        schema = await super().create(create_obj)
+        await self._invalidate((schema.id,))
+        return schema
+
+    async def update(self, update_obj: UpdateSchemaBaseType) -> ReadSchemaBaseType:
+        try:
+            return await super().update(update_obj)
+        finally:
+            await self._invalidate((update_obj.id,))
+
+    async def update_where(
+        self,
+        id: IdType,
+        values: Mapping[str, Any],
+        *where: ColumnElement[bool],
+    ) -> ReadSchemaBaseType:
+        try:
+            return await super().update_where(id, values, *where)
+        finally:
+            await self._invalidate((id,))
+
+    async def delete(self, id: IdType) -> None:
+        try:
+            await super().delete(id)
+        finally:
+            await self._invalidate((id,))
+
+    async def create_many(
+        self,
+        create_objs: Sequence[CreateSchemaBaseType],
+        **kwargs: Any,
+    ) -> list[ReadSchemaBaseType]:
+        schemas = await super().create_many(create_objs, **kwargs)
+        await self._invalidate(schema.id for schema in schemas)
+        return schemas
+
+    async def update_many(
+        self,
+        update_objs: Sequence[UpdateSchemaBaseType],
+        **kwargs: Any,
+    ) -> list[ReadSchemaBaseType]:
+        try:
+            return await super().update_many(update_objs, **kwargs)
+        finally:
+            await self._invalidate(update_obj.id for update_obj in update_objs)
+
+    async def upsert_many(
+        self,
+        create_objs: Sequence[CreateSchemaBaseType],
+        **kwargs: Any,
+    ) -> list[ReadSchemaBaseType]:
+        schemas = await super().upsert_many(create_objs, **kwargs)
+        await self._invalidate(schema.id for schema in schemas)
+        return schemas
+
+    async def delete_many(self, ids: Sequence[IdType], **kwargs: Any) -> None:
+        try:
+            await super().delete_many(ids, **kwargs)
+        finally:
+            await self._invalidate(ids)
+
+    def _cache_key(
+        self,
+        id: IdType,
+        read_schema_type: type[Any] | None = None,
+    ) -> Hashable:
+        """
+        Ключ кэша для модели в схеме чтения (по умолчанию - схеме репозитория).
+        """
+        return self.model_type, read_schema_type or self.read_schema_type, id
+
+    async def _store(self, items: dict[Hashable, ReadSchemaBaseType]) -> None:
+        """
+        Сохраняем схемы в кэш.
+
+        Внутри единицы работы - только после коммита, чтобы не закэшировать
+        незафиксированные данные.
+        """
+        unit_of_work = UnitOfWork.of(self._session)
+        if unit_of_work is not None and self._session.in_transaction():
+            unit_of_work.on_commit(
+                functools.partial(self.cache.set_many, items, self.cache_ttl)
+            )
+        else:
+            await self.cache.set_many(items, self.cache_ttl)
+
+    async def _invalidate(self, ids: Iterable[IdType]) -> None:
+        """
+        Удаляем модели из кэша во всех схемах чтения модели.
+        """
+        read_schema_types = self._read_schema_types.get(
+            self.model_type, {self.read_schema_type}
+        )
+        keys = [
+            self._cache_key(id, read_schema_type)
+            for id in ids
+            for read_schema_type in read_schema_types
+        ]
+        await self.cache.delete_many(keys)
+        unit_of_work = UnitOfWork.of(self._session)
+        if unit_of_work is not None and self._session.in_transaction():
+            # До коммита конкурентное чтение может вернуть в кэш старое значение
+            unit_of_work.on_commit(functools.partial(self.cache.delete_many, keys))
@@ -0,0 +1,59 @@
+import json
+from typing import Any
+
+from sqlalchemy import BigInteger, Dialect, Select, cast, column, func, select
+from sqlalchemy import table as table_clause
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Статистика таблиц, обновляемая ANALYZE/autovacuum (-1 — еще не собрана)
+_PG_CLASS = table_clause("pg_class", column("oid"), column("reltuples"))
+
+
+def reltuples_query(table: Any, dialect: Dialect) -> Select[Any]:
+    """
+    Запрос оценки числа строк таблицы из `pg_class`.
+
+    Имя таблицы экранируется диалектом, а `to_regclass` для ненайденной
+    таблицы возвращает NULL вместо ошибки, которая прервала бы транзакцию.
+    """
+    name = dialect.identifier_preparer.format_table(table)
+    return select(cast(_PG_CLASS.c.reltuples, BigInteger)).where(
+        _PG_CLASS.c.oid == func.to_regclass(name)
+    )
+
+
+async def estimate_count(
+    session: AsyncSession,
+    table: Any,
+    query: Select[Any],
+    filtered: bool,
+) -> int | None:
+    """
+    Оценка числа строк запроса планировщиком PostgreSQL.
+
+    Без условий берем `pg_class.reltuples` таблицы, с условиями — оценку
+    строк из `EXPLAIN`. Для других СУБД и при отсутствии статистики
+    возвращаем None. Оба запроса выполняются как чтение (на реплике,
+    если она есть) и не считаются записью.
+    """
+    dialect = session.get_bind(clause=query).dialect
+    if dialect.name != "postgresql":
+        return None
+    if not filtered:
+        estimate = (
+            await session.execute(reltuples_query(table, dialect))
+        ).scalar_one_or_none()
+        return estimate if estimate is not None and estimate >= 0 else None
+    try:
+        sql = query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    except CompileError:
+        return None
+    # Запрос передаем драйверу как есть: в литералах могут встречаться двоеточия
+    connection = await session.connection(bind_arguments={"clause": query})
+    plan = (
+        await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    ).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
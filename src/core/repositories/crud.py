@@ -1,15 +1,62 @@
 import contextlib
-from typing import Generic, Sequence, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
-from sqlalchemy import select, insert, update, delete
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    Row,
+    Select,
+    bindparam,
+    func,
+    inspect,
+    literal,
+    select,
+    insert,
+    tuple_,
+    update,
+    delete,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.exc import StaleDataError
 
-from src.core.enums import ModelActionEnum
+from src.core.cache import CacheBackend
+from src.core.deadlines import deadline_timeout
+from src.core.enums import CountStrategyEnum, ModelActionEnum
 from src.core.exceptions import (
+    ModelConflictError,
     ModelNotFoundError,
     ModelIntegrityError,
+    InvalidPaginationError,
+)
+from src.core.models import VersionMixin
+from src.core.repositories.counts import estimate_count
+from src.core.repositories.filters import (
+    UnindexedPolicy,
+    check_indexed,
+    compile_filters,
+    get_filter_columns,
 )
+from src.core.repositories.loader import RepositoryLoader
+from src.core.repositories.plans import SchemaPlan, get_schema_plan
+from src.core.replicas import use_primary_transaction
+from src.core.schemas import CountSchema, FilterSchema, PageSchema
+from src.core.statements import StatementT, statement_cache
+from src.core.tracing import trace_operation
 from src.core.type_vars import (
     ModelType,
     CreateSchemaBaseType,
@@ -17,6 +64,9 @@ from src.core.type_vars import (
     ReadSchemaBaseType,
     IdType,
 )
+from src.core.utils import encode_cursor, decode_cursor
+
+ItemType = TypeVar("ItemType")
 
 
 class CrudBaseRepository(
@@ -30,6 +80,52 @@ class CrudBaseRepository(
 ):
     model_type: type[ModelType]
     read_schema_type: type[ReadSchemaBaseType]
+    # Поля, по которым разрешена keyset-пагинация (должны быть индексированы
+    # и NOT NULL).
+    sortable_fields: ClassVar[tuple[str, ...]] = ("id",)
+    max_page_size: ClassVar[int] = 100
+    # Размер порции при потоковом чтении через серверный курсор.
+    stream_chunk_size: ClassVar[int] = 1000
+    # Размер порции для массовых операций (строк на один запрос).
+    bulk_chunk_size: ClassVar[int] = 1000
+    # Объединять конкурентные вызовы `get` в один запрос `get_by_ids`.
+    coalesce_gets: ClassVar[bool] = False
+    # Быстрое чтение: только колонки схемы и сборка схем без валидации.
+    fast_read: ClassVar[bool] = False
+    # Схема фильтрации `get_page`, проверяется при объявлении репозитория.
+    filter_schema: ClassVar[type[FilterSchema] | None] = None
+    # Фильтры и сортировки по колонкам без индекса: allow, warn или reject.
+    unindexed_policy: ClassVar[UnindexedPolicy] = "warn"
+    # Подсчет моделей в `count`: стратегия, граница точного подсчета
+    # (для CAPPED и ESTIMATED) и кэш результатов с TTL.
+    count_strategy: ClassVar[CountStrategyEnum] = CountStrategyEnum.EXACT
+    count_cap: ClassVar[int] = 1000
+    count_cache: ClassVar[CacheBackend | None] = None
+    count_cache_ttl: ClassVar[float | None] = 60.0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model_type = getattr(cls, "model_type", None)
+        if model_type is None:
+            return
+        check_indexed(
+            model_type, cls.sortable_fields, cls.unindexed_policy, cls.__name__
+        )
+        # Сравнение ключа с NULL дает NULL: такие строки выпали бы из страниц
+        column_attrs = inspect(model_type).column_attrs
+        nullable = [
+            field
+            for field in cls.sortable_fields
+            if column_attrs[field].columns[0].nullable
+        ]
+        if nullable:
+            raise TypeError(
+                f"{cls.__name__}: sortable fields {nullable} of "
+                f"{model_type.__name__} are nullable, keyset pagination "
+                "requires NOT NULL columns"
+            )
+        if cls.filter_schema is not None:
+            get_filter_columns(model_type, cls.filter_schema, cls.unindexed_policy)
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -38,12 +134,23 @@ class CrudBaseRepository(
         """
         Получаем модель по идентификатору.
         """
-        query = select(self.model_type).where(self.model_type.id == id)
-        async with self._session as s:
-            model = (await s.execute(query)).scalar_one_or_none()
-            if model is None:
+        if self.coalesce_gets:
+            return await self.loader.load(id)
+        query = self._statement(
+            "get", lambda: self._select().where(self.model_type.id == bindparam("id"))
+        )
+        async with self._reading("get") as s:
+            row = (await s.execute(query, {"id": id})).one_or_none()
+            if row is None:
                 raise ModelNotFoundError(self.model_type, model_id=id)
-            return self._model_validate(model)
+            return self._validate_rows((row,))[0]
+
+    @property
+    def loader(self) -> RepositoryLoader[ReadSchemaBaseType, IdType]:
+        """
+        Загрузчик репозитория, общий для всех вызовов в рамках сессии запроса.
+        """
+        return RepositoryLoader.for_repository(self)
 
     async def get_one_or_none(self, id: IdType) -> ReadSchemaBaseType | None:
         """
@@ -62,20 +169,167 @@ class CrudBaseRepository(
         """
         Получаем список моделей по идентификаторам.
         """
-        query = select(self.model_type).where(self.model_type.id.in_(ids))
-        async with self._session as s:
-            models = (await s.execute(query)).scalars().all()
-            self._check_get_by_ids_strict(ids, models, strict)
-            return [self._model_validate(model) for model in models]
+        async with self._reading("get_by_ids") as s:
+            result = await s.execute(self._select_by_ids(), {"ids": ids})
+            schemas = self._validate_rows(result.all())
+            self._check_get_by_ids_strict(ids, schemas, strict)
+            return schemas
 
     async def get_all(self) -> list[ReadSchemaBaseType]:
         """
         Получаем список всех моделей.
         """
-        query = select(self.model_type)
-        async with self._session as s:
-            models = (await s.execute(query)).scalars().all()
-            return [self._model_validate(model) for model in models]
+        query = self._statement("get_all", self._select)
+        async with self._reading("get_all") as s:
+            return self._validate_rows((await s.execute(query)).all())
+
+    async def stream_all(
+        self,
+        *,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[list[ReadSchemaBaseType]]:
+        """
+        Потоково получаем все модели порциями по `chunk_size`.
+        """
+        query = self._statement("get_all", self._select)
+        async for chunk in self._stream(query, {}, chunk_size, "stream_all"):
+            yield chunk
+
+    async def stream_by_ids(
+        self,
+        ids: Sequence[IdType],
+        *,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[list[ReadSchemaBaseType]]:
+        """
+        Потоково получаем модели по идентификаторам порциями по `chunk_size`.
+        """
+        query = self._select_by_ids()
+        async for chunk in self._stream(
+            query, {"ids": ids}, chunk_size, "stream_by_ids"
+        ):
+            yield chunk
+
+    async def get_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+        where: Sequence[ColumnElement[bool]] = (),
+        filters: FilterSchema | None = None,
+    ) -> PageSchema[ReadSchemaBaseType]:
+        """
+        Получаем страницу моделей (keyset-пагинация).
+
+        Вместо OFFSET страница начинается строго после ключа `(order_by, id)`
+        последней модели предыдущей страницы, поэтому стоимость запроса
+        не зависит от глубины курсора. Условия `filters` добавляются
+        к `where` в том же запросе.
+        """
+        if not 1 <= limit <= self.max_page_size:
+            raise InvalidPaginationError(
+                f"Размер страницы должен быть от 1 до {self.max_page_size}"
+            )
+        if filters is not None:
+            where = [
+                *where,
+                *compile_filters(self.model_type, filters, self.unindexed_policy),
+            ]
+        column = self._get_sort_column(order_by)
+        pk = self.model_type.id
+        keys = (column, pk) if column is not pk else (pk,)
+        # Ключ сортировки выбираем отдельными колонками в конце строки для курсора
+        query = (
+            self._select(*keys)
+            .where(*where)
+            .order_by(*(key.desc() if descending else key.asc() for key in keys))
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            last = self._decode_page_cursor(cursor, keys, order_by, descending)
+            row = tuple_(*keys)
+            bound = tuple_(*(literal(v, key.type) for v, key in zip(last, keys)))
+            query = query.where(row < bound if descending else row > bound)
+        async with self._reading("get_page") as s:
+            rows = (await s.execute(query)).all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_cursor(
+                    {
+                        "o": order_by,
+                        "d": descending,
+                        "k": list(rows[-1][-len(keys) :]),
+                    }
+                )
+            return PageSchema[self.read_schema_type](
+                items=self._validate_rows(rows),
+                next_cursor=next_cursor,
+            )
+
+    async def count(
+        self,
+        *,
+        where: Sequence[ColumnElement[bool]] = (),
+        filters: FilterSchema | None = None,
+        strategy: CountStrategyEnum | None = None,
+    ) -> CountSchema:
+        """
+        Считаем модели, удовлетворяющие условиям.
+
+        Стратегия по умолчанию — `count_strategy` репозитория:
+        - EXACT — `count(*)`;
+        - CAPPED — считаем не больше `count_cap + 1` строк, большее
+          количество возвращается как нижняя граница `count_cap` ("N+");
+        - ESTIMATED — оценка планировщика PostgreSQL; оценки меньше
+          `count_cap` и недоступные оценки (другие СУБД, нет статистики)
+          уточняются точным подсчетом.
+
+        При заданном `count_cache` результат кэшируется на `count_cache_ttl`
+        секунд и не сбрасывается при записи.
+        """
+        strategy = strategy or self.count_strategy
+        if filters is not None:
+            where = [
+                *where,
+                *compile_filters(self.model_type, filters, self.unindexed_policy),
+            ]
+        query = select(self.model_type.id).where(*where)
+        key = None
+        if self.count_cache is not None:
+            compiled = query.compile()
+            key = (self.model_type, strategy, str(compiled), repr(compiled.params))
+            cached = await self.count_cache.get(key)
+            if cached is not None:
+                return cached
+
+        async with self._reading("count") as s:
+            result = None
+            if strategy == CountStrategyEnum.ESTIMATED:
+                estimate = await estimate_count(
+                    s, self.model_type.__table__, query, bool(where)
+                )
+                if estimate is not None and estimate >= self.count_cap:
+                    result = CountSchema(total=estimate, exact=False)
+            elif strategy == CountStrategyEnum.CAPPED:
+                limited = query.limit(self.count_cap + 1).subquery()
+                total = (
+                    await s.execute(select(func.count()).select_from(limited))
+                ).scalar_one()
+                if total > self.count_cap:
+                    result = CountSchema(total=self.count_cap, exact=False, capped=True)
+                else:
+                    result = CountSchema(total=total)
+            if result is None:
+                exact = select(func.count()).select_from(self.model_type).where(*where)
+                total = (await s.execute(exact)).scalar_one()
+                result = CountSchema(total=total)
+
+        if key is not None:
+            await self.count_cache.set(key, result, self.count_cache_ttl)
+        return result
 
     async def create(self, create_obj: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
@@ -86,7 +340,7 @@ class CrudBaseRepository(
             .values(**create_obj.model_dump(exclude={"id"}))
             .returning(self.model_type)
         )
-        async with self._session as s, s.begin():
+        async with self._writing("create") as s:
             try:
                 model = (await s.execute(statement)).scalar_one()
                 return self._model_validate(model)
@@ -99,33 +353,429 @@ class CrudBaseRepository(
     async def update(self, update_obj: UpdateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Обновляем модель по идентификатору.
+
+        Для моделей с `VersionMixin` версия увеличивается, а если схема
+        передает `version`, модель изменяется только при совпадении версии
+        (иначе `ModelConflictError`).
+        """
+        values = update_obj.model_dump(exclude={"id"}, exclude_unset=True)
+        where = []
+        expected_version = values.pop("version", None) if self._versioned else None
+        if expected_version is not None:
+            where.append(self.model_type.version == expected_version)
+        return await self._update(
+            "update", update_obj.id, values, where, expected_version
+        )
+
+    async def update_where(
+        self,
+        id: IdType,
+        values: Mapping[str, Any],
+        *where: ColumnElement[bool],
+    ) -> ReadSchemaBaseType:
+        """
+        Обновляем модель одним запросом, если она удовлетворяет условиям
+        (compare-and-set). Значения могут быть SQL выражениями::
+
+            await repository.update_where(
+                item_id, {"stock": Item.stock - 1}, Item.stock > 0
+            )
+
+        Если условия не выполнены, возникает `ModelConflictError`.
+        """
+        return await self._update("update_where", id, dict(values), where)
+
+    async def delete(self, id: IdType) -> None:
+        """
+        Удаляем модель по идентификатору.
+        """
+        statement = self._statement(
+            "delete",
+            lambda: delete(self.model_type).where(
+                self.model_type.id == bindparam("id")
+            ),
+        )
+        async with self._writing("delete") as s:
+            await s.execute(statement, {"id": id})
+
+    async def _update(
+        self,
+        operation: str,
+        id: IdType,
+        values: dict[str, Any],
+        where: Sequence[ColumnElement[bool]],
+        expected_version: int | None = None,
+    ) -> ReadSchemaBaseType:
+        """
+        UPDATE ... WHERE id = :id AND <условия> RETURNING с увеличением версии.
         """
-        pk = update_obj.id
+        if self._versioned:
+            values["version"] = self.model_type.version + 1
         statement = (
             update(self.model_type)
-            .where(self.model_type.id == pk)
-            .values(**update_obj.model_dump(exclude={"id"}, exclude_unset=True))
+            .where(self.model_type.id == id, *where)
+            .values(**values)
             .returning(self.model_type)
         )
-        async with self._session as s, s.begin():
+        async with self._writing(operation) as s:
             try:
                 model = (await s.execute(statement)).scalar_one_or_none()
-                if model is None:
-                    raise ModelNotFoundError(self.model_type, model_id=update_obj.id)
-                return self._model_validate(model)
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(
                     self.model_type,
                     ModelActionEnum.UPDATE,
                 ) from integrity_error
+            if model is None:
+                raise await self._update_error(s, id, expected_version)
+            return self._model_validate(model)
 
-    async def delete(self, id: IdType) -> None:
+    async def _update_error(
+        self,
+        session: AsyncSession,
+        id: IdType,
+        expected_version: int | None,
+    ) -> ModelNotFoundError | ModelConflictError:
         """
-        Удаляем модель по идентификатору.
+        Ошибка изменения, не затронувшего ни одной строки.
+        """
+        column = self.model_type.version if self._versioned else self.model_type.id
+        query = select(column).where(self.model_type.id == id)
+        current = (await session.execute(query)).scalar_one_or_none()
+        if current is None:
+            return ModelNotFoundError(self.model_type, model_id=id)
+        if expected_version is None:
+            return ModelConflictError(self.model_type, id)
+        return ModelConflictError(
+            self.model_type,
+            id,
+            expected_version=expected_version,
+            actual_version=current,
+        )
+
+    async def _stream(
+        self,
+        query: Select[Any],
+        params: dict[str, Any],
+        chunk_size: int | None,
+        operation: str,
+    ) -> AsyncIterator[list[ReadSchemaBaseType]]:
+        """
+        Читаем результат запроса через серверный курсор, не загружая его целиком.
+        """
+        # Операция помечается только на время выборки порции: пока генератор
+        # приостановлен, вызывающий код может выполнять свои запросы
+        name = self._operation_name(operation)
+        async with self._read_session() as s:
+            with trace_operation(name):
+                async with deadline_timeout():
+                    result = await s.stream(
+                        query,
+                        params,
+                        execution_options={
+                            "yield_per": chunk_size or self.stream_chunk_size
+                        },
+                    )
+            partitions = result.partitions()
+            while True:
+                with trace_operation(name):
+                    async with deadline_timeout():
+                        rows = await anext(partitions, None)
+                if rows is None:
+                    return
+                yield self._validate_rows(rows)
+
+    async def create_many(
+        self,
+        create_objs: Sequence[CreateSchemaBaseType],
+        *,
+        chunk_size: int | None = None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Массово создаем модели в одной транзакции.
+        """
+        statement = insert(self.model_type).returning(
+            self.model_type,
+            sort_by_parameter_order=True,
+        )
+        rows = [create_obj.model_dump(exclude={"id"}) for create_obj in create_objs]
+        async with self._writing("create_many") as s:
+            return await self._execute_many(
+                s, statement, rows, ModelActionEnum.INSERT, chunk_size
+            )
+
+    async def update_many(
+        self,
+        update_objs: Sequence[UpdateSchemaBaseType],
+        *,
+        chunk_size: int | None = None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Массово обновляем модели по идентификаторам в одной транзакции.
+
+        Версии моделей с `VersionMixin` проверяются так же, как в `update`.
+        """
+        rows = [
+            update_obj.model_dump(exclude_unset=True) | {"id": update_obj.id}
+            for update_obj in update_objs
+        ]
+        ids = [row["id"] for row in rows]
+        rows = [row for row in rows if len(row) > 1]
+        stale_chunk: Sequence[dict[str, Any]] | None = None
+        async with self._writing("update_many") as s:
+            if self._versioned:
+                await self._fill_versions(s, rows)
+            for index, chunk in self._chunks(rows, chunk_size):
+                try:
+                    await s.execute(update(self.model_type), chunk)
+                except IntegrityError as integrity_error:
+                    raise ModelIntegrityError(
+                        self.model_type,
+                        ModelActionEnum.UPDATE,
+                        chunk=index,
+                    ) from integrity_error
+                except StaleDataError:
+                    # Часть идентификаторов порции не найдена или версии
+                    # не совпали, уточняем
+                    stale_chunk = chunk
+                    break
+            query = select(self.model_type).where(self.model_type.id.in_(ids))
+            models = (await s.execute(query)).scalars().all()
+            self._check_get_by_ids_strict(ids, models, strict=True)
+            if stale_chunk is not None:
+                raise ModelConflictError(
+                    self.model_type, [row["id"] for row in stale_chunk]
+                )
+            return [self._model_validate(model) for model in models]
+
+    async def _fill_versions(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """
+        Подставляем текущие версии в строки без версии: массовое обновление
+        ORM всегда сравнивает и увеличивает версию. Вызывается внутри
+        `_writing`, поэтому версии читаются с primary.
+        """
+        ids = [row["id"] for row in rows if row.get("version") is None]
+        if not ids:
+            return
+        query = select(self.model_type.id, self.model_type.version).where(
+            self.model_type.id.in_(ids)
+        )
+        versions = dict((await session.execute(query)).all())
+        for row in rows:
+            if row.get("version") is None:
+                # Ненайденные модели не совпадут с версией 0
+                row["version"] = versions.get(row["id"], 0)
+
+    async def upsert_many(
+        self,
+        create_objs: Sequence[CreateSchemaBaseType],
+        *,
+        index_elements: Sequence[str] = ("id",),
+        chunk_size: int | None = None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Массово создаем или обновляем модели (INSERT ... ON CONFLICT DO UPDATE).
+
+        При конфликте по `index_elements` обновляются все переданные поля,
+        кроме самих `index_elements`, а версия модели увеличивается.
+        """
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for create_obj in create_objs:
+            row = create_obj.model_dump(
+                exclude={"id"} if create_obj.id is None else None
+            )
+            groups.setdefault(frozenset(row), []).append(row)
+        result: list[ReadSchemaBaseType] = []
+        async with self._writing("upsert_many") as s:
+            for keys, rows in groups.items():
+                statement = self._dialect_insert()
+                values = {
+                    key: statement.excluded[key]
+                    for key in keys
+                    if key not in index_elements
+                }
+                if self._versioned:
+                    values["version"] = self.model_type.version + 1
+                statement = statement.on_conflict_do_update(
+                    index_elements=index_elements, set_=values
+                ).returning(self.model_type, sort_by_parameter_order=True)
+                result += await self._execute_many(
+                    s, statement, rows, ModelActionEnum.UPSERT, chunk_size
+                )
+        return result
+
+    async def delete_many(
+        self,
+        ids: Sequence[IdType],
+        *,
+        chunk_size: int | None = None,
+    ) -> None:
+        """
+        Массово удаляем модели по идентификаторам в одной транзакции.
+        """
+        async with self._writing("delete_many") as s:
+            for index, chunk in self._chunks(ids, chunk_size):
+                statement = delete(self.model_type).where(self.model_type.id.in_(chunk))
+                try:
+                    await s.execute(statement)
+                except IntegrityError as integrity_error:
+                    raise ModelIntegrityError(
+                        self.model_type,
+                        ModelActionEnum.DELETE,
+                        chunk=index,
+                    ) from integrity_error
+
+    async def _execute_many(
+        self,
+        session: AsyncSession,
+        statement: Insert,
+        rows: Sequence[dict[str, Any]],
+        action: ModelActionEnum,
+        chunk_size: int | None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Выполняем INSERT ... RETURNING порциями (executemany) в текущей транзакции.
+        """
+        result: list[ReadSchemaBaseType] = []
+        for index, chunk in self._chunks(rows, chunk_size):
+            try:
+                models = (await session.scalars(statement, chunk)).all()
+            except IntegrityError as integrity_error:
+                raise ModelIntegrityError(
+                    self.model_type,
+                    action,
+                    chunk=index,
+                ) from integrity_error
+            result += [self._model_validate(model) for model in models]
+        return result
+
+    def _chunks(
+        self,
+        items: Sequence[ItemType],
+        chunk_size: int | None,
+    ) -> Iterator[tuple[int, Sequence[ItemType]]]:
+        """
+        Делим последовательность на порции для массовых операций.
+        """
+        size = chunk_size or self.bulk_chunk_size
+        for index, start in enumerate(range(0, len(items), size)):
+            yield index, items[start : start + size]
+
+    def _dialect_insert(self) -> postgresql.Insert | sqlite.Insert:
+        """
+        Получаем INSERT с поддержкой ON CONFLICT для диалекта сессии.
+        """
+        match self._session.get_bind().dialect.name:
+            case "postgresql":
+                return postgresql.insert(self.model_type)
+            case "sqlite":
+                return sqlite.insert(self.model_type)
+            case dialect:
+                raise NotImplementedError(f"Upsert is not supported for {dialect}")
+
+    @contextlib.asynccontextmanager
+    async def _reading(self, operation: str) -> AsyncIterator[AsyncSession]:
+        """
+        Сессия для чтения в рамках операции `operation` (для трассировки).
+
+        Внутри открытой транзакции (единица работы запроса) используем ее,
+        иначе сессия закрывается после вызова. Операция прерывается
+        `TimeoutError` по дедлайну HTTP запроса.
+        """
+        with trace_operation(self._operation_name(operation)):
+            async with deadline_timeout(), self._read_session() as s:
+                yield s
+
+    @contextlib.asynccontextmanager
+    async def _read_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Сессия для чтения без пометки операции (см. `_reading`).
+        """
+        if self._session.in_transaction():
+            yield self._session
+        else:
+            async with self._session as s:
+                yield s
+
+    @contextlib.asynccontextmanager
+    async def _writing(self, operation: str) -> AsyncIterator[AsyncSession]:
         """
-        async with self._session as s, s.begin():
-            statement = delete(self.model_type).where(self.model_type.id == id)
-            await s.execute(statement)
+        Сессия для записи в рамках операции `operation` (для трассировки).
+
+        Внутри открытой транзакции присоединяемся к ней (фиксирует ее владелец),
+        иначе выполняем запись в собственной транзакции. Чтения операции
+        до ее первой записи тоже выполняются на primary: отстающая реплика
+        вернула бы устаревшие версии и ключи. Как и чтение, прерывается
+        по дедлайну HTTP запроса (собственная транзакция откатывается).
+        """
+        with trace_operation(self._operation_name(operation)):
+            async with deadline_timeout():
+                if self._session.in_transaction():
+                    use_primary_transaction(self._session)
+                    yield self._session
+                else:
+                    async with self._session as s, s.begin():
+                        yield s
+
+    def _operation_name(self, operation: str) -> str:
+        return f"{type(self).__name__}.{operation}"
+
+    def _select(self, *extra: ColumnElement[Any]) -> Select[Any]:
+        """
+        Запрос чтения моделей. Дополнительные колонки добавляются в конец строки.
+
+        При `fast_read` выбираются только колонки, нужные схеме чтения.
+        """
+        if self.fast_read:
+            return select(*self._schema_plan.columns, *extra)
+        return select(self.model_type, *extra)
+
+    def _select_by_ids(self) -> Select[Any]:
+        """
+        Запрос чтения моделей по списку идентификаторов (параметр `ids`).
+        """
+        return self._statement(
+            "get_by_ids",
+            lambda: self._select().where(
+                self.model_type.id.in_(bindparam("ids", expanding=True))
+            ),
+        )
+
+    def _statement(self, operation: str, build: Callable[[], StatementT]) -> StatementT:
+        """
+        Получаем готовый запрос операции из кэша запросов.
+
+        Запрос зависит только от класса репозитория (он может переопределять
+        `_select`), модели, схемы чтения и режима чтения, значения передаются
+        параметрами при выполнении.
+        """
+        key = (
+            type(self),
+            self.model_type,
+            self.read_schema_type,
+            self.fast_read,
+            operation,
+        )
+        return statement_cache.get(key, operation, build)
+
+    def _validate_rows(self, rows: Sequence[Row[Any]]) -> list[ReadSchemaBaseType]:
+        """
+        Приводим строки запроса `_select` к схемам.
+        """
+        if self.fast_read:
+            return self._schema_plan.build(rows)
+        return [self._model_validate(row[0]) for row in rows]
+
+    @property
+    def _versioned(self) -> bool:
+        return issubclass(self.model_type, VersionMixin)
+
+    @property
+    def _schema_plan(self) -> SchemaPlan[ReadSchemaBaseType]:
+        return get_schema_plan(self.model_type, self.read_schema_type)
 
     def _model_validate(self, model: ModelType, **kwargs) -> ReadSchemaBaseType:
         """
@@ -137,10 +787,57 @@ class CrudBaseRepository(
             **kwargs,
         )
 
+    def _get_sort_column(self, order_by: str) -> InstrumentedAttribute[Any]:
+        """
+        Получаем колонку для сортировки страницы.
+        """
+        if order_by not in self.sortable_fields:
+            raise InvalidPaginationError(
+                f"Сортировка по полю {order_by} недоступна, "
+                f"допустимые поля: {', '.join(self.sortable_fields)}"
+            )
+        if order_by not in inspect(self.model_type).column_attrs:
+            raise InvalidPaginationError(f"Поле {order_by} не является колонкой")
+        return getattr(self.model_type, order_by)
+
+    def _decode_page_cursor(
+        self,
+        cursor: str,
+        keys: Sequence[InstrumentedAttribute[Any]],
+        order_by: str,
+        descending: bool,
+    ) -> list[Any]:
+        """
+        Декодируем курсор и приводим значения ключа к типам колонок.
+        """
+        try:
+            payload = decode_cursor(cursor)
+            if payload.get("o") != order_by or payload.get("d") != descending:
+                raise ValueError("Cursor does not match sort order")
+            values = payload["k"]
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise ValueError("Cursor does not match sort keys")
+            return [
+                self._cursor_value_adapter(key).validate_python(value)
+                for value, key in zip(values, keys)
+            ]
+        except (ValueError, KeyError) as error:
+            raise InvalidPaginationError("Некорректный курсор страницы") from error
+
+    @staticmethod
+    def _cursor_value_adapter(key: InstrumentedAttribute[Any]) -> TypeAdapter[Any]:
+        """
+        Получаем адаптер для восстановления значения ключа из JSON.
+        """
+        try:
+            return TypeAdapter(key.type.python_type)
+        except NotImplementedError:
+            return TypeAdapter(Any)
+
     def _check_get_by_ids_strict(
         self,
         ids: Sequence[IdType],
-        models: Sequence[ModelType],
+        models: Sequence[ModelType | ReadSchemaBaseType],
         strict: bool,
     ) -> None:
         """
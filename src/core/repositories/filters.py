@@ -0,0 +1,121 @@
+import functools
+import logging
+from typing import Any, Callable, Literal, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+    inspect,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.core.schemas import FilterSchema
+from src.core.schemas.filters import FilterOperator
+
+logger = logging.getLogger(__name__)
+
+# Что делать с фильтрами и сортировками по колонкам без индекса
+UnindexedPolicy = Literal["allow", "warn", "reject"]
+
+OPERATORS: dict[
+    FilterOperator, Callable[[InstrumentedAttribute[Any], Any], ColumnElement[bool]]
+] = {
+    "eq": lambda column, value: column == value,
+    "in": lambda column, values: column.in_(values),
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "prefix": lambda column, value: column.startswith(value, autoescape=True),
+    "is_null": lambda column, value: column.is_(None) if value else column.isnot(None),
+}
+
+
+@functools.cache
+def indexed_columns(model_type: type[Any]) -> frozenset[str]:
+    """
+    Атрибуты модели, по которым возможен поиск по индексу: первые колонки
+    индексов, уникальных ограничений и первичного ключа.
+    """
+    table = model_type.__table__
+    keys = [
+        *table.indexes,
+        *(
+            constraint
+            for constraint in table.constraints
+            if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+        ),
+    ]
+    first_columns = {key.columns[0] for key in keys if len(key.columns)}
+    mapper = inspect(model_type)
+    return frozenset(
+        key
+        for key, column_property in mapper.column_attrs.items()
+        if column_property.columns[0] in first_columns
+    )
+
+
+def check_indexed(
+    model_type: type[Any],
+    columns: Sequence[str],
+    policy: UnindexedPolicy,
+    owner: str,
+) -> None:
+    """
+    Проверяем, что колонки фильтров и сортировок `owner` индексированы.
+
+    Колонки без индекса записываются в лог (`warn`) или запрещаются (`reject`).
+    """
+    mapper = inspect(model_type)
+    unknown = [column for column in columns if column not in mapper.column_attrs]
+    if unknown:
+        raise TypeError(f"{owner}: {unknown} are not columns of {model_type.__name__}")
+    if policy == "allow":
+        return
+    unindexed = sorted(set(columns) - indexed_columns(model_type))
+    if not unindexed:
+        return
+    message = (
+        f"{owner}: columns {unindexed} of {model_type.__name__} are not indexed, "
+        "filtering or sorting by them scans the whole table"
+    )
+    if policy == "reject":
+        raise TypeError(message)
+    logger.warning(message)
+
+
+@functools.cache
+def get_filter_columns(
+    model_type: type[Any],
+    filter_schema: type[FilterSchema],
+    policy: UnindexedPolicy = "warn",
+) -> dict[str, InstrumentedAttribute[Any]]:
+    """
+    Колонки модели для условий схемы фильтрации (проверяются один раз).
+    """
+    check_indexed(
+        model_type,
+        [spec.column for spec in filter_schema.__filters__.values()],
+        policy,
+        filter_schema.__name__,
+    )
+    return {
+        spec.column: getattr(model_type, spec.column)
+        for spec in filter_schema.__filters__.values()
+    }
+
+
+def compile_filters(
+    model_type: type[Any],
+    filters: FilterSchema,
+    policy: UnindexedPolicy = "warn",
+) -> list[ColumnElement[bool]]:
+    """
+    Условия WHERE для переданных значений фильтров.
+    """
+    columns = get_filter_columns(model_type, type(filters), policy)
+    return [
+        OPERATORS[spec.op](columns[spec.column], value)
+        for spec, value in filters.active_filters()
+    ]
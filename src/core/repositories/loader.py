@@ -0,0 +1,88 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Generic
+
+from src.core.exceptions import ModelNotFoundError
+from src.core.type_vars import ReadSchemaBaseType, IdType
+
+if TYPE_CHECKING:
+    from src.core.repositories.crud import CrudBaseRepository
+
+# Ключ в `AsyncSession.info`, под которым хранятся загрузчики запроса.
+LOADERS_SESSION_KEY = "repository_loaders"
+
+
+class RepositoryLoader(Generic[ReadSchemaBaseType, IdType]):
+    """
+    Загрузчик, объединяющий вызовы `load` в один запрос `get_by_ids`.
+
+    Все идентификаторы, запрошенные за один тик цикла событий, собираются
+    в пачку без повторов и загружаются одним `SELECT ... WHERE id IN (...)`.
+    Загрузчик живет в `session.info`, поэтому его время жизни совпадает
+    с сессией запроса (`SessionDep`).
+    """
+
+    def __init__(
+        self,
+        repository: "CrudBaseRepository[Any, ReadSchemaBaseType, Any, Any, IdType]",
+    ) -> None:
+        self._repository = repository
+        self._pending: dict[IdType, asyncio.Future[ReadSchemaBaseType]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def for_repository(
+        cls,
+        repository: "CrudBaseRepository[Any, ReadSchemaBaseType, Any, Any, IdType]",
+    ) -> "RepositoryLoader[ReadSchemaBaseType, IdType]":
+        """
+        Получаем загрузчик репозитория в рамках его сессии.
+        """
+        loaders = repository._session.info.setdefault(LOADERS_SESSION_KEY, {})
+        loader = loaders.get(type(repository))
+        if loader is None:
+            loader = loaders[type(repository)] = cls(repository)
+        return loader
+
+    async def load(self, id: IdType) -> ReadSchemaBaseType:
+        """
+        Получаем модель по идентификатору в составе общей пачки.
+        """
+        future = self._pending.get(id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[id] = loop.create_future()
+        # shield: отмена одного ожидающего не должна отменять общий результат
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """
+        Отправляем накопленную пачку идентификаторов.
+        """
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._load_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self,
+        pending: dict[IdType, asyncio.Future[ReadSchemaBaseType]],
+    ) -> None:
+        try:
+            schemas = await self._repository.get_by_ids(list(pending))
+        except Exception as error:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        by_id = {schema.id: schema for schema in schemas}
+        for id, future in pending.items():
+            if future.done():
+                continue
+            if id in by_id:
+                future.set_result(by_id[id])
+            else:
+                future.set_exception(
+                    ModelNotFoundError(self._repository.model_type, model_id=id)
+                )
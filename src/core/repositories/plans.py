@@ -0,0 +1,79 @@
+import functools
+from typing import Any, Generic, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Row, inspect
+
+from src.core.type_vars import ReadSchemaBaseType
+
+_object_setattr = object.__setattr__
+
+
+class SchemaPlan(Generic[ReadSchemaBaseType]):
+    """
+    Предвычисленный план сборки схемы чтения из строк запроса.
+
+    Выбирает только колонки, нужные схеме, и собирает схемы из кортежей
+    без валидации (значения из базы считаются доверенными), в обход
+    `model_validate(..., from_attributes=True)`.
+    """
+
+    def __init__(
+        self,
+        model_type: type[Any],
+        schema_type: type[ReadSchemaBaseType],
+    ) -> None:
+        column_attrs = inspect(model_type).column_attrs
+        missing = [
+            name for name in schema_type.model_fields if name not in column_attrs
+        ]
+        if missing:
+            raise TypeError(
+                f"{schema_type.__name__} fields {missing} are not columns "
+                f"of {model_type.__name__}, fast read path is not applicable"
+            )
+        self.schema_type = schema_type
+        self.fields: tuple[str, ...] = tuple(schema_type.model_fields)
+        self.columns: tuple[ColumnElement[Any], ...] = tuple(
+            getattr(model_type, name) for name in self.fields
+        )
+        # Схемы с post_init или приватными атрибутами собираем штатным model_construct
+        self._trusted = not (
+            schema_type.__pydantic_post_init__
+            or schema_type.__private_attributes__
+            or schema_type.__pydantic_root_model__
+        )
+
+    def build(
+        self, rows: Sequence[Row[Any] | tuple[Any, ...]]
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Собираем схемы из строк. Колонки сверх плана в конце строки игнорируются.
+        """
+        fields, schema_type = self.fields, self.schema_type
+        if not self._trusted:
+            return [
+                schema_type.model_construct(**dict(zip(fields, row))) for row in rows
+            ]
+        new = schema_type.__new__
+        fields_set = set(fields)
+        result = []
+        for row in rows:
+            schema = new(schema_type)
+            _object_setattr(schema, "__dict__", dict(zip(fields, row)))
+            _object_setattr(schema, "__pydantic_fields_set__", fields_set.copy())
+            _object_setattr(schema, "__pydantic_extra__", None)
+            _object_setattr(schema, "__pydantic_private__", None)
+            result.append(schema)
+        return result
+
+
+@functools.cache
+def get_schema_plan(
+    model_type: type[Any],
+    schema_type: type[BaseModel],
+) -> SchemaPlan[Any]:
+    """
+    Получаем (и кэшируем) план для пары модель/схема.
+    """
+    return SchemaPlan(model_type, schema_type)
@@ -0,0 +1,89 @@
+from typing import Any, AsyncIterable, AsyncIterator, Sequence
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse, StreamingResponse
+
+SchemaChunks = AsyncIterable[Sequence[BaseModel]]
+
+
+class SchemaJSONResponse(JSONResponse):
+    """
+    JSON ответ, сериализуемый pydantic-core сразу в байты.
+
+    Уже готовые байты (см. `SchemaResponseRoute`) отдаются как есть,
+    схемы сериализуются по алиасам.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content, by_alias=True)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Потоковый ответ в формате NDJSON: по одной схеме на строку.
+
+    Принимает порции схем (например, из `CrudBaseRepository.stream_all`)
+    и сериализует их по мере поступления.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        chunks: SchemaChunks,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(
+            self._render(chunks),
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
+
+    @staticmethod
+    async def _render(chunks: SchemaChunks) -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            if chunk:
+                yield b"".join(
+                    item.model_dump_json(by_alias=True).encode() + b"\n"
+                    for item in chunk
+                )
+
+
+class JSONArrayStreamingResponse(StreamingResponse):
+    """
+    Потоковый ответ в виде JSON-массива схем.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        chunks: SchemaChunks,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(
+            self._render(chunks),
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
+
+    @staticmethod
+    async def _render(chunks: SchemaChunks) -> AsyncIterator[bytes]:
+        separator = b"["
+        async for chunk in chunks:
+            if chunk:
+                yield separator + b",".join(
+                    item.model_dump_json(by_alias=True).encode() for item in chunk
+                )
+                separator = b","
+        yield b"[]" if separator == b"[" else b"]"
@@ -0,0 +1,99 @@
+import functools
+import inspect
+from typing import Any, Callable, get_args, get_origin
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.responses import SchemaJSONResponse
+
+
+class SchemaResponseRoute(APIRoute):
+    """
+    Маршрут, отдающий схемы ответа без повторной валидации.
+
+    Если обработчик вернул ровно `response_model` (схему или список схем
+    этого типа), ответ сериализуется pydantic-core сразу в байты вместо
+    валидации, `jsonable_encoder` и `json.dumps`. Действует только для
+    асинхронных обработчиков с `SchemaJSONResponse`, без параметров
+    `response_model_*` и без `Response` в зависимостях. Остальные ответы
+    обрабатываются FastAPI как обычно.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, endpoint, **kwargs)
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        schema_type = self._direct_schema_type(response_class)
+        if schema_type is not None:
+            self.dependant.call = self._serialize_directly(
+                self.dependant.call, response_class, schema_type
+            )
+
+    def _direct_schema_type(
+        self,
+        response_class: type[Response],
+    ) -> type[BaseModel] | None:
+        """
+        Получаем тип схемы, если ответы маршрута можно сериализовать напрямую.
+        """
+        if (
+            self.response_model is None
+            or not inspect.iscoroutinefunction(self.dependant.call)
+            or not issubclass(response_class, SchemaJSONResponse)
+            or self.response_model_include is not None
+            or self.response_model_exclude is not None
+            or not self.response_model_by_alias
+            or self.response_model_exclude_unset
+            or self.response_model_exclude_defaults
+            or self.response_model_exclude_none
+            or _uses_response_param(self.dependant)
+        ):
+            return None
+        schema_type = self.response_model
+        if get_origin(schema_type) is list:
+            (schema_type,) = get_args(schema_type)
+        if isinstance(schema_type, type) and issubclass(schema_type, BaseModel):
+            return schema_type
+        return None
+
+    def _serialize_directly(
+        self,
+        call: Callable[..., Any],
+        response_class: type[Response],
+        schema_type: type[BaseModel],
+    ) -> Callable[..., Any]:
+        """
+        Оборачиваем обработчик: ответ точного типа сразу превращаем в байты.
+        """
+        adapter = TypeAdapter(self.response_model)
+        many = get_origin(self.response_model) is list
+        status = {"status_code": self.status_code} if self.status_code else {}
+
+        def is_exact(result: Any) -> bool:
+            if not many:
+                return type(result) is schema_type
+            return type(result) is list and all(
+                type(item) is schema_type for item in result
+            )
+
+        @functools.wraps(call)
+        async def endpoint(*args: Any, **kwargs: Any) -> Any:
+            result = await call(*args, **kwargs)
+            if is_exact(result):
+                return response_class(
+                    adapter.dump_json(result, by_alias=True), **status
+                )
+            return result
+
+        return endpoint
+
+
+def _uses_response_param(dependant: Dependant) -> bool:
+    return dependant.response_param_name is not None or any(
+        _uses_response_param(dependency) for dependency in dependant.dependencies
+    )
@@ -12,3 +12,10 @@ from .request_response import StatusOKResponseSchema as StatusOKResponseSchema
 
 from .exceptions import BusinessLogicExceptionSchema as BusinessLogicExceptionSchema
 from .exceptions import ModelAlreadyExistsErrorSchema as ModelAlreadyExistsErrorSchema
+
+from .pagination import PageSchema as PageSchema
+from .pagination import PageRequestSchema as PageRequestSchema
+from .pagination import CountSchema as CountSchema
+
+from .filters import Filter as Filter
+from .filters import FilterSchema as FilterSchema
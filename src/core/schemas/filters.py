@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import Any, ClassVar, Literal
+
+from .request_response import RequestSchema
+
+FilterOperator = Literal["eq", "in", "gt", "gte", "lt", "lte", "prefix", "is_null"]
+
+
+@dataclass(frozen=True, slots=True)
+class Filter:
+    """
+    Условие фильтрации поля `FilterSchema`.
+
+    `column` — колонка модели (по умолчанию одноименная полю), `op` — оператор:
+    `eq`, `in` (список значений), `gt`/`gte`/`lt`/`lte` (границы диапазона),
+    `prefix` (начало строки) или `is_null` (True — IS NULL, False — IS NOT NULL).
+    """
+
+    column: str | None = None
+    op: FilterOperator = "eq"
+
+
+class FilterSchema(RequestSchema):
+    """
+    Параметры фильтрации запроса.
+
+    Поля со значением None не фильтруют. Условия задаются метаданными::
+
+        class ItemFilterSchema(FilterSchema):
+            name: Annotated[str | None, Filter(op="prefix")] = None
+            rank_from: Annotated[int | None, Filter("rank", "gte")] = None
+            ids: Annotated[list[int] | None, Filter("id", "in")] = None
+    """
+
+    # Условия полей, собираются при объявлении схемы
+    __filters__: ClassVar[dict[str, Filter]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        filters = {}
+        for name, field in cls.model_fields.items():
+            spec = next(
+                (item for item in field.metadata if isinstance(item, Filter)), Filter()
+            )
+            filters[name] = Filter(spec.column or name, spec.op)
+        cls.__filters__ = filters
+
+    def active_filters(self) -> list[tuple[Filter, Any]]:
+        """
+        Условия полей, значения которых переданы.
+        """
+        return [
+            (spec, value)
+            for name, spec in self.__filters__.items()
+            if (value := getattr(self, name)) is not None
+        ]
@@ -0,0 +1,45 @@
+from typing import Generic, TypeVar
+
+from pydantic import Field, computed_field
+
+from .request_response import RequestSchema, ResponseSchema
+
+ItemType = TypeVar("ItemType")
+
+
+class PageRequestSchema(RequestSchema):
+    """
+    Параметры запроса страницы (keyset-пагинация).
+    """
+
+    limit: int = Field(default=50, ge=1)
+    cursor: str | None = None
+    order_by: str = "id"
+    descending: bool = False
+
+
+class PageSchema(ResponseSchema, Generic[ItemType]):
+    """
+    Страница моделей с курсором на следующую страницу.
+    """
+
+    items: list[ItemType]
+    next_cursor: str | None = None
+
+
+class CountSchema(ResponseSchema):
+    """
+    Количество моделей.
+
+    `exact` — значение точное; иначе это оценка или нижняя граница
+    (`capped`, отображается как "N+").
+    """
+
+    total: int
+    exact: bool = True
+    capped: bool = False
+
+    @computed_field
+    @property
+    def display(self) -> str:
+        return f"{self.total}+" if self.capped else str(self.total)
@@ -0,0 +1,95 @@
+from typing import Any, Callable, Hashable, TypeVar
+from uuid import uuid4
+
+from sqlalchemy import Executable, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.metrics import MetricsRegistry, metrics
+
+StatementT = TypeVar("StatementT", bound=Executable)
+
+
+class StatementCache:
+    """
+    Кэш готовых конструкций запросов репозиториев.
+
+    Запросы строятся один раз на ключ (репозиторий, модель, схема, операция)
+    с `bindparam` вместо значений. Повторное использование одного объекта
+    запроса избавляет от сборки конструкции и пересчета ключа кэша компиляции
+    SQLAlchemy, а одинаковый SQL позволяет драйверу переиспользовать
+    подготовленные выражения.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics) -> None:
+        self._statements: dict[Hashable, Executable] = {}
+        self._lookups = registry.counter(
+            "repository_statement_cache_total",
+            "Repository statement cache lookups",
+            ("operation", "result"),
+        )
+        self._compiled_lookups = registry.counter(
+            "db_compiled_cache_total",
+            "SQLAlchemy compiled statement cache lookups",
+            ("pool", "result"),
+        )
+
+    def get(
+        self,
+        key: Hashable,
+        operation: str,
+        build: Callable[[], StatementT],
+    ) -> StatementT:
+        """
+        Получаем запрос из кэша или строим его.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            self._lookups.inc(operation=operation, result="miss")
+            statement = self._statements[key] = build()
+        else:
+            self._lookups.inc(operation=operation, result="hit")
+        return statement  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+    def instrument(self, name: str, engine: AsyncEngine) -> None:
+        """
+        Считаем попадания в кэш компиляции SQLAlchemy для движка.
+        """
+
+        @event.listens_for(engine.sync_engine, "after_cursor_execute")
+        def after_cursor_execute(
+            connection: Any,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: Any,
+            executemany: bool,
+        ) -> None:
+            cache_hit = getattr(context, "cache_hit", None)
+            if cache_hit is not None:
+                self._compiled_lookups.inc(pool=name, result=cache_hit.name.lower())
+
+
+def asyncpg_connect_args(
+    prepared_statement_cache_size: int,
+    pgbouncer: bool,
+) -> dict[str, Any]:
+    """
+    Параметры подключения asyncpg для кэша подготовленных выражений.
+
+    PgBouncer в режиме транзакций не сохраняет именованные выражения между
+    транзакциями, поэтому отключаем кэш asyncpg и даем выражениям
+    уникальные имена.
+    """
+    if pgbouncer:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": prepared_statement_cache_size}
+
+
+statement_cache = StatementCache()
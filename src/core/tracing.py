@@ -0,0 +1,210 @@
+import contextlib
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.metrics import MetricsRegistry, metrics
+
+logger = logging.getLogger(__name__)
+
+# Ключ в `Connection.info`: время начала выполняемых запросов.
+QUERY_STARTED_KEY = "query_started"
+UNKNOWN_OPERATION = "<unknown>"
+
+
+@dataclass
+class RequestTrace:
+    """
+    Агрегаты запросов к базе в рамках одного HTTP запроса.
+    """
+
+    request_id: str
+    query_count: int = 0
+    db_time: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    reported_statements: set[str] = field(default_factory=set)
+
+
+_request_trace: ContextVar[RequestTrace | None] = ContextVar(
+    "request_trace", default=None
+)
+_repository_operation: ContextVar[str | None] = ContextVar(
+    "repository_operation", default=None
+)
+
+
+@contextlib.contextmanager
+def trace_request(request_id: str) -> Iterator[RequestTrace]:
+    """
+    Собираем запросы к базе, выполненные внутри блока, в `RequestTrace`.
+    """
+    trace = RequestTrace(request_id)
+    token = _request_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _request_trace.reset(token)
+
+
+@contextlib.contextmanager
+def trace_operation(name: str) -> Iterator[None]:
+    """
+    Помечаем запросы внутри блока операцией репозитория (`ItemRepository.get`).
+    """
+    token = _repository_operation.set(name)
+    try:
+        yield
+    finally:
+        _repository_operation.reset(token)
+
+
+class QueryTracer:
+    """
+    Трассировка запросов через события движка.
+
+    Для каждого запроса фиксируются длительность, число строк, операция
+    репозитория и идентификатор HTTP запроса. Медленные запросы пишутся
+    в лог с замаскированными параметрами, а повтор одного и того же
+    запроса больше `n_plus_one_threshold` раз за HTTP запрос считается
+    признаком N+1.
+    """
+
+    def __init__(
+        self,
+        slow_query_threshold: float | None = 0.5,
+        n_plus_one_threshold: int | None = 10,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self.slow_query_threshold = slow_query_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._duration = registry.histogram(
+            "db_query_duration_seconds",
+            "Database query duration by repository operation",
+            ("pool", "operation"),
+        )
+        self._slow_queries = registry.counter(
+            "db_slow_queries_total",
+            "Queries slower than the slow query threshold",
+            ("pool", "operation"),
+        )
+        self._n_plus_one = registry.counter(
+            "db_n_plus_one_total",
+            "Statements repeated above the N+1 threshold within a request",
+            ("operation",),
+        )
+
+    def instrument(self, name: str, engine: AsyncEngine) -> None:
+        """
+        Подключаем трассировку к движку.
+        """
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def before_cursor_execute(connection: Any, *args: Any) -> None:
+            connection.info.setdefault(QUERY_STARTED_KEY, []).append(
+                time.perf_counter()
+            )
+
+        @event.listens_for(engine.sync_engine, "after_cursor_execute")
+        def after_cursor_execute(
+            connection: Any,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: Any,
+            executemany: bool,
+        ) -> None:
+            started = connection.info[QUERY_STARTED_KEY].pop()
+            self.record(
+                name,
+                statement,
+                parameters,
+                time.perf_counter() - started,
+                getattr(cursor, "rowcount", -1),
+            )
+
+        @event.listens_for(engine.sync_engine, "handle_error")
+        def handle_error(context: Any) -> None:
+            connection = context.connection
+            if connection is not None and connection.info.get(QUERY_STARTED_KEY):
+                connection.info[QUERY_STARTED_KEY].pop()
+
+    def record(
+        self,
+        pool: str,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        rowcount: int,
+    ) -> None:
+        """
+        Учитываем выполненный запрос.
+        """
+        operation = _repository_operation.get() or UNKNOWN_OPERATION
+        trace = _request_trace.get()
+        self._duration.observe(duration, pool=pool, operation=operation)
+
+        def query() -> dict[str, Any]:
+            return {
+                "duration_ms": round(duration * 1000, 3),
+                "rows": rowcount if rowcount >= 0 else None,
+                "operation": operation,
+                "request_id": trace.request_id if trace is not None else None,
+                "pool": pool,
+            }
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query executed: %s", statement, extra={"query": query()})
+
+        if self.slow_query_threshold is not None and (
+            duration >= self.slow_query_threshold
+        ):
+            self._slow_queries.inc(pool=pool, operation=operation)
+            logger.warning(
+                "Slow query (%.1f ms, %s): %s; parameters: %s",
+                duration * 1000,
+                operation,
+                statement,
+                redact_parameters(parameters),
+                extra={"query": query()},
+            )
+
+        if trace is None:
+            return
+        trace.query_count += 1
+        trace.db_time += duration
+        trace.statements[statement] += 1
+        if (
+            self.n_plus_one_threshold is not None
+            and trace.statements[statement] > self.n_plus_one_threshold
+            and statement not in trace.reported_statements
+        ):
+            trace.reported_statements.add(statement)
+            self._n_plus_one.inc(operation=operation)
+            logger.warning(
+                "Possible N+1: statement executed more than %d times "
+                "in request %s (%s): %s",
+                self.n_plus_one_threshold,
+                trace.request_id,
+                operation,
+                statement,
+                extra={"query": query()},
+            )
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Маскируем значения параметров запроса, сохраняя их структуру.
+    """
+    if isinstance(parameters, dict):
+        return {key: "***" for key in parameters}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} parameter sets>"
+        return ["***"] * len(parameters)
+    return "***"
@@ -0,0 +1,88 @@
+from typing import Any, Awaitable, Callable, Coroutine
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.routing import SchemaResponseRoute
+
+# Ключ в `AsyncSession.info`, под которым хранится единица работы запроса.
+UNIT_OF_WORK_SESSION_KEY = "unit_of_work"
+
+CommitHook = Callable[[], Awaitable[None]]
+
+
+class UnitOfWork:
+    """
+    Единица работы: одна транзакция на весь запрос.
+
+    Пока транзакция сессии открыта, методы `CrudBaseRepository` присоединяются
+    к ней вместо того, чтобы открывать собственную, поэтому все вызовы
+    репозиториев в обработчике атомарны и выполняются на одном соединении.
+    Соединение берется из пула лениво, при первом запросе к базе.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._commit_hooks: list[CommitHook] = []
+        session.info[UNIT_OF_WORK_SESSION_KEY] = self
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> "UnitOfWork | None":
+        """
+        Получаем единицу работы, к которой привязана сессия.
+        """
+        return session.info.get(UNIT_OF_WORK_SESSION_KEY)
+
+    async def begin(self) -> None:
+        await self.session.begin()
+
+    def on_commit(self, hook: CommitHook) -> None:
+        """
+        Регистрируем действие, выполняемое после успешного коммита.
+        """
+        self._commit_hooks.append(hook)
+
+    async def commit(self) -> None:
+        """
+        Фиксируем транзакцию (если она еще открыта) и выполняем хуки коммита.
+        """
+        if not self.session.in_transaction():
+            return
+        await self.session.commit()
+        hooks, self._commit_hooks = self._commit_hooks, []
+        for hook in hooks:
+            await hook()
+
+    async def rollback(self) -> None:
+        self._commit_hooks.clear()
+        if self.session.in_transaction():
+            await self.session.rollback()
+
+    def close(self) -> None:
+        self.session.info.pop(UNIT_OF_WORK_SESSION_KEY, None)
+
+
+class UnitOfWorkRoute(SchemaResponseRoute):
+    """
+    Маршрут, фиксирующий единицу работы запроса до отправки ответа.
+
+    Код завершения зависимостей с `yield` выполняется уже после отправки
+    ответа, поэтому коммит в зависимости не позволил бы вернуть клиенту
+    ошибку коммита. Роутеры, использующие `TransactionDep`, должны
+    создаваться с `route_class=UnitOfWorkRoute`. Ответы сериализуются
+    так же, как в `SchemaResponseRoute`.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            response = await handler(request)
+            unit_of_work: UnitOfWork | None = getattr(
+                request.state, UNIT_OF_WORK_SESSION_KEY, None
+            )
+            if unit_of_work is not None:
+                await unit_of_work.commit()
+            return response
+
+        return unit_of_work_handler
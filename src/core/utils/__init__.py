@@ -1 +1,3 @@
 from .case_converter import to_snake_case as to_snake_case
+from .cursor import encode_cursor as encode_cursor
+from .cursor import decode_cursor as decode_cursor
@@ -1,22 +1,19 @@
+import functools
 import re
 
+# Границы слов: строчная буква или цифра перед заглавной, последняя заглавная
+# аббревиатуры перед словом (HTTPResponse) и строчная буква перед цифрой
+_WORD_BOUNDARY = re.compile(
+    r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|(?<=[a-z])(?=[0-9])"
+)
 
+
+@functools.lru_cache(maxsize=1024)
 def to_snake_case(string: str) -> str:
     """
     Преобразует строку в snake_case.
+
+    Результаты кэшируются: преобразуются в основном имена классов и полей.
     """
-    # Handle the sequence of uppercase letters followed by a lowercase letter
-    snake = re.sub(
-        r"([A-Z]+)([A-Z][a-z])",
-        lambda m: f"{m.group(1)}_{m.group(2)}",
-        string,
-    )
-    # Insert an underscore between a lowercase letter and an uppercase letter
-    snake = re.sub(r"([a-z])([A-Z])", lambda m: f"{m.group(1)}_{m.group(2)}", snake)
-    # Insert an underscore between a digit and an uppercase letter
-    snake = re.sub(r"([0-9])([A-Z])", lambda m: f"{m.group(1)}_{m.group(2)}", snake)
-    # Insert an underscore between a lowercase letter and a digit
-    snake = re.sub(r"([a-z])([0-9])", lambda m: f"{m.group(1)}_{m.group(2)}", snake)
     # Replace hyphens with underscores to handle kebab-case
-    snake = snake.replace("-", "_")
-    return snake.lower()
+    return _WORD_BOUNDARY.sub("_", string).replace("-", "_").lower()
@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """
+    Кодирует состояние курсора в непрозрачный url-safe токен.
+    """
+    raw = json.dumps(
+        to_jsonable_python(payload),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    """
+    Декодирует токен курсора.
+
+    Raises ValueError, если токен поврежден.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError("Invalid cursor token") from error
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor token")
+    return payload
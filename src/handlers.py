@@ -0,0 +1,17 @@
+from fastapi import FastAPI
+
+from src.core.exceptions import BusinessExceptionHandler, BusinessLogicException
+from src.settings import settings
+
+
+def apply_exception_handlers(app: FastAPI) -> FastAPI:
+    """
+    Applies exception handlers to FastAPI application.
+
+    Business logic exceptions are answered with 404 (not found),
+    409 (already exists, conflicts, integrity errors) or 422 and their schema.
+    """
+    app.add_exception_handler(
+        BusinessLogicException, BusinessExceptionHandler(debug=settings.debug)
+    )
+    return app
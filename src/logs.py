@@ -1,13 +1,22 @@
+import functools
 import logging
 import logging.config
 
 import yaml
 from pathlib import Path
 
+from src.core.logs import start_queue_listeners
 from src.settings import settings
 
 
+@functools.cache
 def setup_logging(base_dir: Path) -> None:
+    """
+    Configures logging from the YAML file in `base_dir`.
+
+    Runs once per process: apps created later (tests, benchmarks) reuse
+    the configuration and its queue listeners.
+    """
     if not settings.debug:
         # Set libraries loggers level to WARNING
         for loud in (
@@ -27,7 +36,12 @@ def setup_logging(base_dir: Path) -> None:
             with open(ls_file, "rt") as f:
                 config = yaml.safe_load(f.read())
             logging.config.dictConfig(config)
+            # Queue handlers write through listeners running in background threads
+            start_queue_listeners()
             break
     else:
-        print(f"Missing configuration logging files: {', '.join(files)}")
-        exit(0)
+        logging.basicConfig(level=logging.DEBUG if settings.debug else logging.INFO)
+        logging.getLogger(__name__).warning(
+            "Missing configuration logging files: %s, using basic configuration",
+            ", ".join(files),
+        )
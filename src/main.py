@@ -11,4 +11,11 @@ if __name__ == "__main__":
         host=settings.run.host,
         port=settings.run.port,
         reload=settings.debug,
+        workers=settings.workers,
+        loop=settings.run.loop,
+        http=settings.run.http,
+        timeout_keep_alive=settings.run.timeout_keep_alive,
+        backlog=settings.run.backlog,
+        limit_concurrency=settings.run.limit_concurrency,
+        timeout_graceful_shutdown=settings.run.timeout_graceful_shutdown,
     )
@@ -1,33 +1,59 @@
-import time
-from typing import Awaitable, Callable
-
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.core.cache import MemoryCacheBackend
+from src.core.middleware import (
+    AdmissionControlMiddleware,
+    BrotliCodec,
+    Codec,
+    CompressionMiddleware,
+    GzipCodec,
+    HTTPCacheMiddleware,
+    ProcessTimeMiddleware,
+    QueryTracingMiddleware,
+    ZstdCodec,
+)
 from src.settings import settings
 
 
-async def calc_process_time(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """
-    Calculate process time middleware
-    """
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time = time.perf_counter() - start_time
-    response.headers["X-Process-Time"] = f"{process_time:.5f}"
-    return response
-
-
 def apply_middleware(app: FastAPI) -> FastAPI:
     """
     Applies middlewares to FastAPI application.
     Notice: Last added middleware will be called first.
     """
-    app.add_middleware(BaseHTTPMiddleware, dispatch=calc_process_time)
+    if settings.compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            codecs=get_compression_codecs(),
+            minimum_size=settings.compression.minimum_size,
+        )
+    if settings.admission.enabled:
+        # Inside the cache, so that cached responses skip admission
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            max_concurrency=get_admission_limit(),
+            max_queue=settings.admission.max_queue,
+            queue_timeout=settings.admission.queue_timeout,
+            request_timeout=settings.admission.request_timeout,
+            retry_after=settings.admission.retry_after,
+            priorities={
+                settings.metrics.path: "high",
+                **settings.admission.priorities,
+            },
+            default_priority=settings.admission.default_priority,
+        )
+    if settings.http_cache.enabled:
+        app.add_middleware(
+            HTTPCacheMiddleware,
+            cache=MemoryCacheBackend(maxsize=settings.http_cache.max_entries),
+        )
+    if settings.tracing.enabled:
+        app.add_middleware(
+            QueryTracingMiddleware,
+            request_id_header=settings.tracing.request_id_header,
+            server_timing=settings.tracing.server_timing,
+        )
+    app.add_middleware(ProcessTimeMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
@@ -36,3 +62,28 @@ def apply_middleware(app: FastAPI) -> FastAPI:
         allow_headers=["*"],
     )
     return app
+
+
+def get_compression_codecs() -> list[Codec]:
+    """
+    Builds response compression codecs in the configured preference order.
+    """
+    codecs: dict[str, Codec] = {
+        "zstd": ZstdCodec(level=settings.compression.zstd_level),
+        "br": BrotliCodec(quality=settings.compression.brotli_quality),
+        "gzip": GzipCodec(level=settings.compression.gzip_level),
+    }
+    return [codecs[encoding] for encoding in settings.compression.encodings]
+
+
+def get_admission_limit() -> int:
+    """
+    Returns the number of requests a worker processes at once.
+
+    Defaults to the worker's share of the primary connection pool, so that
+    admitted requests do not wait for a connection.
+    """
+    if settings.admission.max_concurrency is not None:
+        return settings.admission.max_concurrency
+    pool_size, max_overflow = settings.worker_pool_limits
+    return pool_size + max_overflow
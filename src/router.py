@@ -1,5 +1,6 @@
 from fastapi import FastAPI, APIRouter
 
+from src.api.metrics import router_metrics
 from src.api.v1 import router_v1
 from src.settings import settings
 
@@ -11,4 +12,7 @@ def apply_routes(app: FastAPI) -> FastAPI:
     router.include_router(router_v1)
     # Include main router
     app.include_router(router)
+    # Include service routers
+    if settings.metrics.enabled:
+        app.include_router(router_metrics)
     return app
@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +12,20 @@ BASE_DIR = Path(__file__).resolve().parent.parent  # backend
 class RunConfig(BaseModel):
     host: str = "127.0.0.1"
     port: int = 8000
+    # Worker processes (ignored in debug mode, which runs one reloading process)
+    # Defaults to the CPUs this process may use (container and affinity aware)
+    workers: int = Field(default_factory=lambda: os.process_cpu_count() or 1, ge=1)
+    # auto picks uvloop and httptools when they are installed
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
+    timeout_keep_alive: int = 5
+    backlog: int = 2048
+    # Maximum concurrent connections per worker before responding with 503
+    limit_concurrency: int | None = None
+    # Seconds to wait for in-flight requests on shutdown
+    timeout_graceful_shutdown: int | None = 30
+    # Warn when create_app to the end of startup takes longer (seconds)
+    startup_budget: float | None = 5.0
 
 
 class APIConfigV1(BaseModel):
@@ -31,14 +47,89 @@ class DatabaseConfig(BaseModel):
 
     echo: bool = False
     echo_pool: bool = False
+    # Pool limits for the whole server, split evenly across worker processes
     max_overflow: int = 10
     pool_size: int = 50
+    # Lower bounds of the limits of each worker after the split
+    min_worker_pool_size: int = Field(default=2, ge=1)
+    min_worker_max_overflow: int = Field(default=1, ge=0)
+    pool_timeout: float = 30.0
+    # Recycle connections older than N seconds (-1 disables)
+    pool_recycle: int = -1
+    # Test connections with a lightweight ping on checkout
+    pool_pre_ping: bool = False
+    # Open pool_size connections on startup
+    pool_warm_up: bool = False
+
+    # SQLAlchemy compiled statement cache entries per engine
+    query_cache_size: int = 500
+    # asyncpg prepared statements cached per connection
+    prepared_statement_cache_size: int = 100
+    # Behind PgBouncer in transaction mode: unique, uncached prepared statements
+    pgbouncer: bool = False
+
+    # Read replicas: reads go to replicas, writes stay on the primary
+    replicas: list[str] = []
+    replica_balancing: Literal["round_robin", "least_connections"] = "round_robin"
+    # Seconds after a write during which reads of the same request stay on
+    # the primary
+    read_your_writes_window: float = 0.0
 
     @property
     def dsn(self) -> str:
         return f"{self.provider}://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
+class MetricsConfig(BaseModel):
+    enabled: bool = True
+    path: str = "/metrics"
+
+
+class CompressionConfig(BaseModel):
+    enabled: bool = True
+    # Codings in server preference order; br and zstd need brotli/zstandard
+    encodings: list[Literal["zstd", "br", "gzip"]] = ["zstd", "br", "gzip"]
+    # Smaller bodies are sent uncompressed
+    minimum_size: int = 500
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = True
+    # Log queries slower than N seconds with redacted parameters
+    slow_query_threshold: float | None = 0.5
+    # Warn when one statement runs more than N times in a request
+    n_plus_one_threshold: int | None = 10
+    # Report query count and DB time in the Server-Timing header
+    server_timing: bool = True
+    request_id_header: str = "X-Request-ID"
+
+
+class HTTPCacheConfig(BaseModel):
+    enabled: bool = True
+    # Responses kept by the in-memory cache of routes with @cache_response
+    max_entries: int = 1024
+
+
+class AdmissionConfig(BaseModel):
+    enabled: bool = True
+    # Requests processed at once per worker; by default the worker's share
+    # of the primary pool (pool_size + max_overflow)
+    max_concurrency: int | None = Field(default=None, ge=1)
+    # Requests waiting for a slot before new ones are shed with 503
+    max_queue: int = 100
+    queue_timeout: float = 1.0
+    # Deadline of the request, seconds after arrival: bounds repository calls,
+    # requests that miss it before responding get 503
+    request_timeout: float | None = 10.0
+    retry_after: int = 1
+    # Path prefix -> priority class, the metrics endpoint is always "high"
+    priorities: dict[str, Literal["high", "normal", "low"]] = {}
+    default_priority: Literal["high", "normal", "low"] = "normal"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -53,6 +144,25 @@ class Settings(BaseSettings):
     run: RunConfig = RunConfig()
     api: APIConfig = APIConfig()
     db: DatabaseConfig
+    metrics: MetricsConfig = MetricsConfig()
+    tracing: TracingConfig = TracingConfig()
+    http_cache: HTTPCacheConfig = HTTPCacheConfig()
+    compression: CompressionConfig = CompressionConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+
+    @property
+    def workers(self) -> int:
+        return 1 if self.debug else self.run.workers
+
+    @property
+    def worker_pool_limits(self) -> tuple[int, int]:
+        """
+        Returns the (pool_size, max_overflow) of the primary pool of one worker.
+        """
+        return (
+            max(self.db.pool_size // self.workers, self.db.min_worker_pool_size),
+            max(self.db.max_overflow // self.workers, self.db.min_worker_max_overflow),
+        )
 
 
 settings = Settings()
@@ -0,0 +1,13 @@
+import os
+
+# Настройки приложения для тестов, чтобы не требовался файл .env
+for name, value in {
+    "DEBUG": "false",
+    "CORS_ORIGINS": '["*"]',
+    "DB__HOST": "localhost",
+    "DB__PORT": "5432",
+    "DB__USER": "postgres",
+    "DB__PASSWORD": "postgres",
+    "DB__NAME": "test",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,146 @@
+"""
+Модели, схемы и репозитории для тестов репозиториев на SQLite.
+"""
+
+import asyncio
+from typing import Annotated
+
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.cache import MemoryCacheBackend
+from src.core.models import Base, VersionMixin
+from src.core.repositories.cached import CachedCrudRepository
+from src.core.repositories.crud import CrudBaseRepository
+from src.core.schemas import (
+    CreateSchemaInt,
+    Filter,
+    FilterSchema,
+    ReadSchemaInt,
+    ResponseSchema,
+    UpdateSchemaInt,
+)
+
+
+class Item(Base):
+    __tablename__ = "test_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(64), index=True)
+    rank: Mapped[int] = mapped_column(index=True)
+
+
+class ItemReadSchema(ResponseSchema, ReadSchemaInt):
+    name: str
+    rank: int
+
+
+class ItemCreateSchema(CreateSchemaInt):
+    name: str
+    rank: int
+
+
+class ItemUpdateSchema(UpdateSchemaInt):
+    name: str | None = None
+    rank: int | None = None
+
+
+class ItemFilterSchema(FilterSchema):
+    name: Annotated[str | None, Filter(op="prefix")] = None
+    rank_from: Annotated[int | None, Filter("rank", "gte")] = None
+    rank_to: Annotated[int | None, Filter("rank", "lt")] = None
+    ids: Annotated[list[int] | None, Filter("id", "in")] = None
+
+
+class ItemRepository(
+    CrudBaseRepository[
+        Item,
+        ItemReadSchema,
+        ItemCreateSchema,
+        ItemUpdateSchema,
+        int,
+    ]
+):
+    model_type = Item
+    read_schema_type = ItemReadSchema
+    sortable_fields = ("id", "rank")
+    filter_schema = ItemFilterSchema
+
+
+class VersionedItem(VersionMixin, Base):
+    __tablename__ = "test_versioned_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(64))
+    stock: Mapped[int]
+
+
+class VersionedItemReadSchema(ResponseSchema, ReadSchemaInt):
+    name: str
+    stock: int
+    version: int
+
+
+class VersionedItemCreateSchema(CreateSchemaInt):
+    name: str
+    stock: int
+
+
+class VersionedItemUpdateSchema(UpdateSchemaInt):
+    name: str | None = None
+    stock: int | None = None
+    version: int | None = None
+
+
+class VersionedItemRepository(
+    CrudBaseRepository[
+        VersionedItem,
+        VersionedItemReadSchema,
+        VersionedItemCreateSchema,
+        VersionedItemUpdateSchema,
+        int,
+    ]
+):
+    model_type = VersionedItem
+    read_schema_type = VersionedItemReadSchema
+
+
+class CachedItemRepository(
+    CachedCrudRepository[
+        Item,
+        ItemReadSchema,
+        ItemCreateSchema,
+        ItemUpdateSchema,
+        int,
+    ]
+):
+    model_type = Item
+    read_schema_type = ItemReadSchema
+    cache = MemoryCacheBackend()
+
+
+def run(coro_factory, rows: int = 0, repository_type=ItemRepository):
+    """
+    Запускаем сценарий на свежей in-memory базе с `rows` моделями.
+    """
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            if rows:
+                await connection.execute(
+                    Item.__table__.insert(),
+                    [
+                        {"id": i, "name": f"item-{i}", "rank": i % 3}
+                        for i in range(1, rows + 1)
+                    ],
+                )
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await coro_factory(repository_type(session))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
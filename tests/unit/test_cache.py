@@ -0,0 +1,38 @@
+"""
+Модуль, содержащий тесты in-process кэша.
+"""
+
+import asyncio
+
+from src.core.cache import MemoryCacheBackend
+
+
+def test_memory_cache_evicts_least_recently_used():
+    async def scenario():
+        cache = MemoryCacheBackend(maxsize=2)
+        await cache.set_many({"a": 1, "b": 2})
+        assert await cache.get("a") == 1
+        await cache.set("c", 3)
+        return await cache.get_many(("a", "b", "c"))
+
+    assert asyncio.run(scenario()) == {"a": 1, "c": 3}
+
+
+def test_memory_cache_expires_entries():
+    async def scenario():
+        cache = MemoryCacheBackend(ttl=60)
+        await cache.set_many({"a": 1})
+        await cache.set_many({"b": 2}, ttl=0)
+        return await cache.get_many(("a", "b")), len(cache)
+
+    assert asyncio.run(scenario()) == ({"a": 1}, 1)
+
+
+def test_memory_cache_delete():
+    async def scenario():
+        cache = MemoryCacheBackend()
+        await cache.set_many({"a": 1, "b": 2})
+        await cache.delete_many(("a", "missing"))
+        return await cache.get_many(("a", "b"))
+
+    assert asyncio.run(scenario()) == {"b": 2}
@@ -11,6 +11,15 @@ from src.core.utils.case_converter import to_snake_case
         ("String", "string"),
         ("camelCaseString", "camel_case_string"),
         ("string", "string"),
+        ("HTTPResponse", "http_response"),
+        ("getHTTPResponseCode", "get_http_response_code"),
+        ("HTTPResponseCode2XXHandler", "http_response_code_2_xx_handler"),
+        ("version2", "version_2"),
+        ("IPv4Address", "i_pv_4_address"),
+        ("kebab-case-string", "kebab_case_string"),
+        ("already_snake_case", "already_snake_case"),
+        ("ABC", "abc"),
+        ("", ""),
     ),
 )
 def test_to_snake_case(input_string: str, output_string: str):
@@ -0,0 +1,609 @@
+"""
+Модуль, содержащий тесты базового CRUD репозитория на SQLite.
+"""
+
+import asyncio
+import logging
+from typing import Annotated
+
+import pytest
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, Table, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.core.cache import MemoryCacheBackend
+from src.core.enums import CountStrategyEnum
+from src.core.exceptions import (
+    InvalidPaginationError,
+    ModelConflictError,
+    ModelIntegrityError,
+    ModelNotFoundError,
+)
+from src.core.repositories.counts import reltuples_query
+from src.core.schemas import Filter, FilterSchema, ReadSchemaInt, ResponseSchema
+from src.core.statements import statement_cache
+from src.core.unit_of_work import UnitOfWork
+
+from tests.repositories import (
+    CachedItemRepository,
+    Item,
+    ItemCreateSchema,
+    ItemFilterSchema,
+    ItemReadSchema,
+    ItemRepository,
+    ItemUpdateSchema,
+    VersionedItem,
+    VersionedItemCreateSchema,
+    VersionedItemRepository,
+    VersionedItemUpdateSchema,
+    run,
+)
+
+
+def test_get_page_walks_all_rows_by_cursor():
+    """
+    Проверяем, что курсоры обходят все модели без пропусков и повторов.
+    """
+
+    async def scenario(repo: ItemRepository):
+        ids, cursor = [], None
+        while True:
+            page = await repo.get_page(limit=3, cursor=cursor, order_by="rank")
+            ids.extend(item.id for item in page.items)
+            if page.next_cursor is None:
+                return ids
+            cursor = page.next_cursor
+
+    ids = run(scenario, rows=10)
+    assert sorted(ids) == list(range(1, 11))
+    assert ids == sorted(ids, key=lambda i: (i % 3, i))
+
+
+def test_get_page_descending():
+    async def scenario(repo: ItemRepository):
+        first = await repo.get_page(limit=4, descending=True)
+        second = await repo.get_page(limit=4, descending=True, cursor=first.next_cursor)
+        return [i.id for i in first.items], [i.id for i in second.items]
+
+    assert run(scenario, rows=6) == ([6, 5, 4, 3], [2, 1])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"limit": 0},
+        {"order_by": "name"},
+        {"cursor": "not-a-cursor"},
+    ),
+)
+def test_get_page_rejects_invalid_params(kwargs: dict):
+    async def scenario(repo: ItemRepository):
+        with pytest.raises(InvalidPaginationError):
+            await repo.get_page(**kwargs)
+
+    run(scenario)
+
+
+def test_get_page_rejects_cursor_of_other_order():
+    async def scenario(repo: ItemRepository):
+        page = await repo.get_page(limit=1, order_by="rank")
+        with pytest.raises(InvalidPaginationError):
+            await repo.get_page(limit=1, cursor=page.next_cursor)
+
+    run(scenario, rows=3)
+
+
+def test_stream_all_yields_chunks():
+    """
+    Проверяем, что потоковое чтение отдает все модели порциями.
+    """
+
+    async def scenario(repo: ItemRepository):
+        return [
+            [item.id for item in chunk] async for chunk in repo.stream_all(chunk_size=4)
+        ]
+
+    assert run(scenario, rows=10) == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+
+def test_stream_by_ids():
+    async def scenario(repo: ItemRepository):
+        return [
+            item.id
+            async for chunk in repo.stream_by_ids([2, 5, 42], chunk_size=1)
+            for item in chunk
+        ]
+
+    assert sorted(run(scenario, rows=6)) == [2, 5]
+
+
+def test_bulk_create_update_upsert_delete():
+    """
+    Проверяем массовые операции в одной транзакции.
+    """
+
+    async def scenario(repo: ItemRepository):
+        created = await repo.create_many(
+            [ItemCreateSchema(name=f"new-{i}", rank=i) for i in range(5)],
+            chunk_size=2,
+        )
+        updated = await repo.update_many(
+            [ItemUpdateSchema(id=created[0].id, rank=100)], chunk_size=2
+        )
+        upserted = await repo.upsert_many(
+            [
+                ItemCreateSchema(id=created[1].id, name="upserted", rank=7),
+                ItemCreateSchema(name="inserted", rank=8),
+            ]
+        )
+        await repo.delete_many([item.id for item in created[2:]], chunk_size=2)
+        remaining = await repo.get_all()
+        return created, updated, upserted, remaining
+
+    created, updated, upserted, remaining = run(scenario)
+    assert [item.name for item in created] == [f"new-{i}" for i in range(5)]
+    assert [(item.name, item.rank) for item in updated] == [("new-0", 100)]
+    assert {(item.name, item.rank) for item in upserted} == {
+        ("upserted", 7),
+        ("inserted", 8),
+    }
+    assert sorted(item.name for item in remaining) == [
+        "inserted",
+        "new-0",
+        "upserted",
+    ]
+
+
+def test_update_many_missing_id():
+    async def scenario(repo: ItemRepository):
+        with pytest.raises(ModelNotFoundError):
+            await repo.update_many([ItemUpdateSchema(id=42, rank=1)])
+
+    run(scenario, rows=1)
+
+
+def test_create_many_reports_failed_chunk():
+    async def scenario(repo: ItemRepository):
+        with pytest.raises(ModelIntegrityError) as error:
+            await repo.create_many(
+                [ItemCreateSchema(name="a", rank=1)] * 2
+                + [ItemCreateSchema.model_construct(name=None, rank=1)],
+                chunk_size=2,
+            )
+        assert error.value.chunk == 1
+        assert await repo.get_all() == []
+
+    run(scenario)
+
+
+def test_cached_repository_serves_and_invalidates():
+    """
+    Проверяем чтение из кэша и инвалидацию при изменении модели.
+    """
+
+    async def scenario(repo: CachedItemRepository):
+        await repo.cache.clear()
+        assert (await repo.get(1)).name == "item-1"
+        async with repo._session as s, s.begin():
+            await s.execute(Item.__table__.update().values(name="changed"))
+        cached = [item.name for item in await repo.get_by_ids([1, 2], strict=True)]
+        await repo.update(ItemUpdateSchema(id=1, rank=5))
+        fresh = await repo.get_one_or_none(1)
+        await repo.delete(2)
+        return cached, fresh.name, await repo.get_one_or_none(2)
+
+    cached, fresh, deleted = run(scenario, rows=2, repository_type=CachedItemRepository)
+    assert sorted(cached) == ["changed", "item-1"]
+    assert fresh == "changed"
+    assert deleted is None
+
+
+def test_cached_repositories_keep_read_schemas_apart():
+    """
+    Проверяем, что репозитории одной модели с разными схемами чтения
+    не получают схемы друг друга и инвалидируются записью любого из них.
+    """
+
+    class ItemNameSchema(ResponseSchema, ReadSchemaInt):
+        name: str
+
+    class CachedItemNameRepository(CachedItemRepository):
+        read_schema_type = ItemNameSchema
+
+    async def scenario(repo: CachedItemRepository):
+        await repo.cache.clear()
+        names = CachedItemNameRepository(repo._session)
+        full, short = await repo.get(1), await names.get(1)
+        await repo.update(ItemUpdateSchema(id=1, name="renamed"))
+        return type(full), type(short), (await names.get(1)).name
+
+    assert run(scenario, rows=1, repository_type=CachedItemRepository) == (
+        ItemReadSchema,
+        ItemNameSchema,
+        "renamed",
+    )
+
+
+def test_cached_repository_strict_get_by_ids():
+    async def scenario(repo: CachedItemRepository):
+        await repo.cache.clear()
+        await repo.get(1)
+        with pytest.raises(ModelNotFoundError) as error:
+            await repo.get_by_ids([1, 42], strict=True)
+        return error.value.model_id
+
+    assert run(scenario, rows=1, repository_type=CachedItemRepository) == {42}
+
+
+class CoalescingItemRepository(ItemRepository):
+    coalesce_gets = True
+
+
+def test_coalesced_gets_share_one_query():
+    """
+    Проверяем, что конкурентные `get` объединяются в один запрос без повторов.
+    """
+    statements: list[str] = []
+
+    async def scenario(repo: CoalescingItemRepository):
+        event.listen(
+            repo._session.bind.sync_engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        results = await asyncio.gather(
+            repo.get(1),
+            repo.get(2),
+            repo.get(1),
+            repo.get_one_or_none(42),
+            return_exceptions=True,
+        )
+        return [getattr(result, "id", result) for result in results]
+
+    assert run(scenario, rows=3, repository_type=CoalescingItemRepository) == [
+        1,
+        2,
+        1,
+        None,
+    ]
+    assert len(statements) == 1
+
+
+class FastItemRepository(ItemRepository):
+    fast_read = True
+
+
+def test_fast_read_matches_orm_path():
+    """
+    Проверяем, что быстрый путь чтения собирает те же схемы, что и ORM.
+    """
+
+    async def scenario(repo: ItemRepository):
+        page = await repo.get_page(limit=2, order_by="rank")
+        return (
+            await repo.get(2),
+            await repo.get_by_ids([1, 3]),
+            await repo.get_all(),
+            page,
+            await repo.get_page(limit=2, order_by="rank", cursor=page.next_cursor),
+            [chunk async for chunk in repo.stream_all(chunk_size=2)],
+        )
+
+    orm = run(scenario, rows=5)
+    fast = run(scenario, rows=5, repository_type=FastItemRepository)
+    assert fast == orm
+    assert fast[0].model_dump(by_alias=True) == {"id": 2, "name": "item-2", "rank": 2}
+
+
+def test_repository_joins_unit_of_work_transaction():
+    """
+    Проверяем, что внутри единицы работы вызовы используют одну транзакцию.
+    """
+    checkouts: list[object] = []
+
+    async def scenario(repo: ItemRepository):
+        event.listen(
+            repo._session.bind.sync_engine.pool,
+            "checkout",
+            lambda *args: checkouts.append(args[0]),
+        )
+        unit_of_work = UnitOfWork(repo._session)
+        await unit_of_work.begin()
+        created = await repo.create(ItemCreateSchema(name="new", rank=1))
+        await repo.update(ItemUpdateSchema(id=created.id, name="renamed"))
+        await repo.delete(1)
+        inside = await repo.get_by_ids([1, created.id])
+        await unit_of_work.rollback()
+        unit_of_work.close()
+        return inside, await repo.get_by_ids([1, created.id])
+
+    inside, after_rollback = run(scenario, rows=1)
+    assert [item.name for item in inside] == ["renamed"]
+    assert [item.name for item in after_rollback] == ["item-1"]
+    assert len(checkouts) == 2
+
+
+def test_repository_statements_are_cached():
+    """
+    Проверяем, что запросы операций строятся один раз и выполняются с параметрами.
+    """
+    lookups = statement_cache._lookups
+
+    async def scenario(repo: ItemRepository):
+        first = repo._select_by_ids()
+        hits = lookups.value(operation="get", result="hit")
+        items = [await repo.get(1), await repo.get(2)]
+        await repo.delete(1)
+        return (
+            first is repo._select_by_ids(),
+            lookups.value(operation="get", result="hit") - hits,
+            items,
+            await repo.get_by_ids([1, 2]),
+            await repo.get_by_ids([]),
+        )
+
+    same, hits, items, remaining, empty = run(scenario, rows=2)
+    assert same
+    assert hits >= 1
+    assert [item.id for item in items] == [1, 2]
+    assert [item.id for item in remaining] == [2]
+    assert empty == []
+
+
+def test_statements_are_cached_per_repository_class():
+    """
+    Проверяем, что запросы репозитория с собственным `_select` не попадают
+    в кэш другого репозитория той же модели.
+    """
+
+    class RankedItemRepository(ItemRepository):
+        def _select(self, *extra):
+            return super()._select(*extra).where(Item.rank > 0)
+
+    async def scenario(repo: ItemRepository):
+        ranked = RankedItemRepository(repo._session)
+        return (
+            [item.id for item in await ranked.get_by_ids([1, 2, 3])],
+            [item.id for item in await repo.get_by_ids([1, 2, 3])],
+            [item.id for item in await repo.get_all()],
+            [item.id for item in await ranked.get_all()],
+        )
+
+    assert run(scenario, rows=3) == ([1, 2], [1, 2, 3], [1, 2, 3], [1, 2])
+
+
+def test_update_checks_and_increments_version():
+    async def scenario(repo: VersionedItemRepository):
+        (item,) = await repo.create_many([VersionedItemCreateSchema(name="a", stock=1)])
+        updated = await repo.update(
+            VersionedItemUpdateSchema(id=item.id, name="b", version=1)
+        )
+        with pytest.raises(ModelConflictError) as conflict:
+            await repo.update(
+                VersionedItemUpdateSchema(id=item.id, name="c", version=1)
+            )
+        with pytest.raises(ModelNotFoundError):
+            await repo.update(VersionedItemUpdateSchema(id=100, name="c", version=1))
+        unchecked = await repo.update(VersionedItemUpdateSchema(id=item.id, stock=5))
+        return item, updated, conflict.value, unchecked
+
+    item, updated, conflict, unchecked = run(
+        scenario, repository_type=VersionedItemRepository
+    )
+
+    assert item.version == 1
+    assert (updated.name, updated.version) == ("b", 2)
+    assert (conflict.expected_version, conflict.actual_version) == (1, 2)
+    assert conflict.type == "model_conflict"
+    assert (unchecked.name, unchecked.stock, unchecked.version) == ("b", 5, 3)
+
+
+def test_upsert_increments_version():
+    async def scenario(repo: VersionedItemRepository):
+        (item,) = await repo.create_many([VersionedItemCreateSchema(name="a", stock=1)])
+        upserted = await repo.upsert_many(
+            [
+                VersionedItemCreateSchema(id=item.id, name="b", stock=2),
+                VersionedItemCreateSchema(name="new", stock=3),
+            ]
+        )
+        with pytest.raises(ModelConflictError):
+            await repo.update(
+                VersionedItemUpdateSchema(id=item.id, name="c", version=1)
+            )
+        return upserted
+
+    updated, created = run(scenario, repository_type=VersionedItemRepository)
+
+    assert (updated.name, updated.version) == ("b", 2)
+    assert (created.name, created.version) == ("new", 1)
+
+
+def test_update_where_compare_and_set():
+    async def scenario(repo: VersionedItemRepository):
+        (item,) = await repo.create_many([VersionedItemCreateSchema(name="a", stock=2)])
+        stocks = []
+        for _ in range(3):
+            try:
+                updated = await repo.update_where(
+                    item.id,
+                    {"stock": VersionedItem.stock - 1},
+                    VersionedItem.stock > 0,
+                )
+                stocks.append((updated.stock, updated.version))
+            except ModelConflictError as conflict:
+                stocks.append(conflict.msg)
+        with pytest.raises(ModelNotFoundError):
+            await repo.update_where(100, {"stock": 0})
+        return stocks
+
+    stocks = run(scenario, repository_type=VersionedItemRepository)
+
+    assert stocks[:2] == [(1, 2), (0, 3)]
+    assert "не удовлетворяет условию изменения" in stocks[2]
+
+
+def test_update_many_checks_versions():
+    async def scenario(repo: VersionedItemRepository):
+        items = await repo.create_many(
+            [VersionedItemCreateSchema(name=f"item-{i}", stock=i) for i in range(3)]
+        )
+        updated = await repo.update_many(
+            [VersionedItemUpdateSchema(id=item.id, stock=10) for item in items]
+        )
+        with pytest.raises(ModelConflictError):
+            await repo.update_many(
+                [
+                    VersionedItemUpdateSchema(id=items[0].id, stock=20, version=2),
+                    VersionedItemUpdateSchema(id=items[1].id, stock=20, version=1),
+                ]
+            )
+        return updated
+
+    updated = run(scenario, repository_type=VersionedItemRepository)
+
+    assert [(item.stock, item.version) for item in updated] == [(10, 2)] * 3
+
+
+def test_get_page_applies_filters():
+    async def scenario(repo: ItemRepository):
+        await repo.create_many([ItemCreateSchema(name="item_%", rank=1)])
+        pages = []
+        for filters in (
+            ItemFilterSchema(name="item-1"),
+            ItemFilterSchema.model_validate(
+                {"rankFrom": 1, "rankTo": 2, "ids": [1, 2, 3, 4, 5]}
+            ),
+            ItemFilterSchema(name="item_%"),
+        ):
+            page = await repo.get_page(limit=2, order_by="rank", filters=filters)
+            ids = [item.id for item in page.items]
+            while page.next_cursor is not None:
+                page = await repo.get_page(
+                    limit=2, order_by="rank", cursor=page.next_cursor, filters=filters
+                )
+                ids += [item.id for item in page.items]
+            pages.append(ids)
+        return pages
+
+    assert run(scenario, rows=12) == [[12, 1, 10, 11], [1, 4], [13]]
+
+
+def test_filters_are_checked_against_indexes(caplog):
+    class StockFilterSchema(FilterSchema):
+        stock_from: Annotated[int | None, Filter("stock", "gte")] = None
+
+    def declare(policy: str, filters: type[FilterSchema]) -> type:
+        class StockRepository(VersionedItemRepository):
+            filter_schema = filters
+            unindexed_policy = policy
+
+        return StockRepository
+
+    with pytest.raises(TypeError, match="not indexed"):
+        declare("reject", StockFilterSchema)
+    with caplog.at_level(logging.WARNING):
+        declare("warn", StockFilterSchema)
+    assert "['stock'] of VersionedItem are not indexed" in caplog.text
+
+    class MissingFilterSchema(FilterSchema):
+        color: str | None = None
+
+    with pytest.raises(TypeError, match="not columns"):
+        declare("allow", MissingFilterSchema)
+
+
+def test_nullable_sortable_fields_are_rejected():
+    class NullableBase(DeclarativeBase):
+        pass
+
+    class Task(NullableBase):
+        __tablename__ = "tasks"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        due: Mapped[int | None] = mapped_column(index=True)
+
+    with pytest.raises(TypeError, match=r"\['due'\] of Task are nullable"):
+
+        class TaskRepository(ItemRepository):
+            model_type = Task
+            sortable_fields = ("id", "due")
+            filter_schema = None
+
+
+def test_filter_schema_from_query_params():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def get_items(filters: Annotated[ItemFilterSchema, Query()]) -> list[str]:
+        return [
+            f"{spec.column} {spec.op} {value}"
+            for spec, value in filters.active_filters()
+        ]
+
+    response = TestClient(app).get("/items", params={"rankFrom": 1, "ids": [1, 2]})
+
+    assert response.json() == ["rank gte 1", "id in [1, 2]"]
+
+
+def test_count_strategies():
+    async def scenario(repo: ItemRepository):
+        filters = ItemFilterSchema.model_validate({"rankFrom": 2})
+        return [
+            await repo.count(),
+            await repo.count(filters=filters),
+            await repo.count(strategy=CountStrategyEnum.CAPPED),
+            await repo.count(filters=filters, strategy=CountStrategyEnum.CAPPED),
+            # Оценка недоступна на SQLite, считаем точно
+            await repo.count(strategy=CountStrategyEnum.ESTIMATED),
+        ]
+
+    class CappedItemRepository(ItemRepository):
+        count_cap = 5
+
+    counts = run(scenario, rows=9, repository_type=CappedItemRepository)
+
+    assert [(count.total, count.exact) for count in counts] == [
+        (9, True),
+        (3, True),
+        (5, False),
+        (3, True),
+        (9, True),
+    ]
+    assert counts[2].display == "5+"
+    assert counts[2].model_dump(by_alias=True)["display"] == "5+"
+
+
+def test_reltuples_query_quotes_table_name():
+    table = Table("MixedCase", MetaData(), Column("id", Integer), schema="Data")
+    dialect = postgresql.dialect()
+
+    sql = str(
+        reltuples_query(table, dialect).compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert 'to_regclass(\'"Data"."MixedCase"\')' in sql
+
+
+def test_count_is_cached_with_ttl():
+    class CountCachedItemRepository(ItemRepository):
+        count_cache = MemoryCacheBackend()
+
+    async def scenario(repo: ItemRepository):
+        first = await repo.count()
+        await repo.create(ItemCreateSchema(name="new", rank=0))
+        cached = await repo.count()
+        exact = await repo.count(strategy=CountStrategyEnum.CAPPED)
+        await repo.count_cache.clear()
+        return first.total, cached.total, exact.total, (await repo.count()).total
+
+    assert run(scenario, rows=3, repository_type=CountCachedItemRepository) == (
+        3,
+        3,
+        4,
+        4,
+    )
@@ -0,0 +1,90 @@
+"""
+Модуль, содержащий тесты провайдера базы данных.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.core import database
+from src.core.database import DatabaseProvider, SessionDep, get_db_provider
+from src.settings import RunConfig, settings
+
+def test_reset_after_fork_replaces_pools():
+    provider = DatabaseProvider(
+        "sqlite+aiosqlite:///:memory:",
+        pool_size=2,
+        replica_urls=["sqlite+aiosqlite:///:memory:"],
+    )
+    pools = [provider.engine.pool, provider.replica_engines[0].pool]
+
+    provider.reset_after_fork()
+
+    assert provider.engine.pool is not pools[0]
+    assert provider.replica_engines[0].pool is not pools[1]
+    assert provider.engine.pool.size() == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires os.fork")
+def test_forked_child_gets_own_pool():
+    provider = DatabaseProvider("sqlite+aiosqlite:///:memory:")
+    parent_pool = id(provider.engine.pool)
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        os.write(write, b"1" if id(provider.engine.pool) != parent_pool else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b"1"
+    assert id(provider.engine.pool) == parent_pool
+
+
+def test_run_config_defaults_to_cpu_count():
+    assert RunConfig().workers == (os.process_cpu_count() or 1)
+    assert settings.model_copy(update={"debug": True}).workers == 1
+
+
+def test_worker_pool_limits_are_split_with_floor():
+    db = settings.db.model_copy(update={"pool_size": 50, "max_overflow": 10})
+    run = RunConfig(workers=4)
+    split = settings.model_copy(update={"debug": False, "db": db, "run": run})
+    crowded = split.model_copy(update={"run": RunConfig(workers=64)})
+
+    assert split.worker_pool_limits == (12, 2)
+    assert crowded.worker_pool_limits == (2, 1)
+
+
+def test_db_provider_is_created_lazily():
+    get_db_provider.cache_clear()
+    assert get_db_provider.cache_info().currsize == 0
+
+    provider = database.db_provider
+
+    assert provider is get_db_provider()
+    assert provider.engine.url.render_as_string(hide_password=False) == settings.db.dsn
+    asyncio.run(provider.dispose())
+    get_db_provider.cache_clear()
+
+
+def test_session_dependency_uses_current_provider(monkeypatch):
+    provider = DatabaseProvider("sqlite+aiosqlite:///:memory:", pool_size=1)
+    monkeypatch.setattr(database, "create_db_provider", lambda settings: provider)
+    get_db_provider.cache_clear()
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(session: SessionDep) -> int:
+        return (await session.execute(text("SELECT 1"))).scalar_one()
+
+    try:
+        with TestClient(app) as client:
+            assert client.get("/").json() == 1
+        assert get_db_provider() is provider
+    finally:
+        asyncio.run(provider.dispose())
+        get_db_provider.cache_clear()
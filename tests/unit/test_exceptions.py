@@ -0,0 +1,133 @@
+"""
+Модуль, содержащий тесты исключений бизнес-логики.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.enums import ModelActionEnum
+from src.core.exceptions import (
+    BusinessExceptionHandler,
+    BusinessLogicException,
+    InvalidPaginationError,
+    ModelAlreadyExistsError,
+    ModelIntegrityError,
+    ModelNotFoundError,
+)
+from src.core.metrics import MetricsRegistry
+from src.core.schemas import BusinessLogicExceptionSchema
+
+
+class CustomHTTPError(BusinessLogicException):
+    @property
+    def msg(self) -> str:
+        return "custom"
+
+
+class RateLimitSchema(BusinessLogicExceptionSchema):
+    limit: int
+
+
+class RateLimitError(BusinessLogicException):
+    @property
+    def msg(self) -> str:
+        return "rate limited"
+
+    def get_schema(self, debug: bool) -> BusinessLogicExceptionSchema:
+        return RateLimitSchema(
+            type=self.type, msg=self.msg, traceback=self._traceback(debug), limit=10
+        )
+
+
+def test_exception_type_is_computed_per_class():
+    assert ModelNotFoundError._type_name == "model_not_found"
+    assert ModelAlreadyExistsError("title", "exists").type == "model_already_exists"
+    assert InvalidPaginationError("bad").type == "invalid_pagination"
+    assert CustomHTTPError().type == "custom_http"
+
+
+def test_exception_schema_formats_traceback_only_in_debug():
+    try:
+        raise ModelAlreadyExistsError("title", "exists")
+    except ModelAlreadyExistsError as exc:
+        error = exc
+
+    schema = error.get_schema(debug=False)
+    assert schema.model_dump() == {
+        "type": "model_already_exists",
+        "msg": "exists",
+        "traceback": None,
+        "field": "title",
+    }
+    assert "raise ModelAlreadyExistsError" in error.get_schema(debug=True).traceback
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    (
+        (ModelNotFoundError("Item", model_id=[1, 2]), 404),
+        (ModelAlreadyExistsError("title", 'Название "x" занято'), 409),
+        (ModelIntegrityError("Item", ModelActionEnum.UPDATE), 409),
+        (InvalidPaginationError("bad cursor"), 422),
+        (CustomHTTPError(), 422),
+        (RateLimitError(), 422),
+    ),
+)
+def test_business_exception_handler(error: BusinessLogicException, status_code: int):
+    registry = MetricsRegistry()
+    app = FastAPI()
+    app.add_exception_handler(
+        BusinessLogicException, BusinessExceptionHandler(registry=registry)
+    )
+
+    @app.get("/")
+    async def endpoint() -> None:
+        raise error
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == status_code
+    assert response.content == error.get_schema(debug=False).model_dump_json().encode()
+    errors = registry.get("business_errors_total")
+    assert errors.value(type=error.type, status=status_code) == 1
+
+
+def test_business_exception_handler_debug_includes_traceback():
+    handler = BusinessExceptionHandler(debug=True, registry=MetricsRegistry())
+    app = FastAPI()
+    app.add_exception_handler(BusinessLogicException, handler)
+
+    @app.get("/")
+    async def endpoint() -> None:
+        raise ModelNotFoundError("Item", model_id=1)
+
+    body = TestClient(app).get("/").json()
+
+    assert body["type"] == "model_not_found"
+    assert "raise ModelNotFoundError" in body["traceback"]
+
+
+@pytest.mark.parametrize("debug", (False, True))
+def test_business_exception_handler_uses_overridden_schema(debug: bool):
+    handler = BusinessExceptionHandler(debug=debug, registry=MetricsRegistry())
+    app = FastAPI()
+    app.add_exception_handler(BusinessLogicException, handler)
+
+    @app.get("/")
+    async def endpoint() -> None:
+        raise RateLimitError()
+
+    body = TestClient(app).get("/").json()
+
+    assert body["limit"] == 10
+    assert (body["traceback"] is not None) is debug
+
+
+def test_business_exception_handler_rejects_other_exceptions():
+    handler = BusinessExceptionHandler(registry=MetricsRegistry())
+
+    with pytest.raises(TypeError):
+        asyncio.run(handler(None, ValueError("not business")))  # type: ignore[arg-type]
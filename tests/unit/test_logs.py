@@ -0,0 +1,74 @@
+"""
+Модуль, содержащий тесты конвейера логирования.
+"""
+
+import json
+import logging
+import logging.config
+import sys
+from pathlib import Path
+from queue import Queue
+
+import pytest
+import yaml
+
+from src.core.logs import (
+    JSONFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    start_queue_listeners,
+)
+from src.core.metrics import MetricsRegistry
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+def make_record(msg: str, *args, level: int = logging.INFO, **extra):
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.parametrize("policy", ("drop", "block"))
+def test_queue_handler_drops_records_when_queue_is_full(policy: str):
+    queue: Queue = Queue(maxsize=1)
+    handler = NonBlockingQueueHandler(
+        queue, policy=policy, block_timeout=0.001, registry=MetricsRegistry()
+    )
+    for i in range(3):
+        handler.handle(make_record("value %s", i))
+
+    record = queue.get_nowait()
+    assert (record.msg, record.args) == ("value 0", None)
+    assert handler.dropped == 2
+
+
+def test_json_formatter_includes_extra_fields():
+    line = JSONFormatter().format(make_record("hello %s", "world", query={"rows": 1}))
+    payload = json.loads(line)
+    assert payload["message"] == "hello world"
+    assert payload["level"] == "INFO"
+    assert payload["query"] == {"rows": 1}
+
+
+def test_sampling_filter_keeps_important_records():
+    sampling = SamplingFilter(rate=0.0, max_level="DEBUG")
+    assert not sampling.filter(make_record("query", level=logging.DEBUG))
+    assert sampling.filter(make_record("slow query", level=logging.WARNING))
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="QueueHandler dictConfig requires 3.12"
+)
+@pytest.mark.parametrize("file", (".logging.yaml", ".logging.dev.yaml"))
+def test_logging_config_uses_queue_listener(file: str):
+    config = yaml.safe_load((BASE_DIR / file).read_text())
+    logging.config.dictConfig(config)
+    listeners = start_queue_listeners()
+    try:
+        assert len(listeners) == 1
+        assert isinstance(logging.getHandlerByName("queue"), NonBlockingQueueHandler)
+    finally:
+        for listener in listeners:
+            listener.stop()
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
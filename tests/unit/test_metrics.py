@@ -0,0 +1,66 @@
+"""
+Модуль, содержащий тесты реестра метрик и метрик пула соединений.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core.database import DatabaseProvider
+from src.core.metrics import MetricsRegistry, metrics
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ("method",)).inc(method="GET")
+    registry.gauge("in_flight", "In flight").set(3)
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{method="GET"} 1',
+        "# HELP in_flight In flight",
+        "# TYPE in_flight gauge",
+        "in_flight 3",
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+    ]
+
+
+def test_registry_returns_existing_metric():
+    registry = MetricsRegistry()
+    counter = registry.counter("total", "Total")
+    assert registry.counter("total", "Total") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("total", "Total")
+
+
+def test_pool_metrics_and_warm_up(tmp_path: Path):
+    async def scenario():
+        provider = DatabaseProvider(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            pool_size=3,
+        )
+        wait = metrics.get("db_pool_checkout_wait_seconds")
+        checkouts = wait.count(pool="primary") if wait else 0
+        try:
+            await provider.warm_up()
+            idle = metrics.get("db_pool_connections_idle").value(pool="primary")
+            async with provider.engine.connect():
+                in_use = metrics.get("db_pool_connections_in_use").value(pool="primary")
+            waited = metrics.get("db_pool_checkout_wait_seconds").count(pool="primary")
+            return idle, in_use, waited - checkouts
+        finally:
+            await provider.dispose()
+
+    assert asyncio.run(scenario()) == (3, 1, 4)
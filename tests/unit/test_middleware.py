@@ -0,0 +1,359 @@
+"""
+Модуль, содержащий тесты ASGI middleware.
+"""
+
+import asyncio
+import time
+import zlib
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.cache import MemoryCacheBackend
+from src.core.deadlines import deadline_timeout, request_deadline
+from src.core.metrics import MetricsRegistry
+from src.core.middleware import (
+    AdmissionControlMiddleware,
+    CompressionMiddleware,
+    GzipCodec,
+    HTTPCacheMiddleware,
+    ProcessTimeMiddleware,
+    cache_response,
+    remaining_time,
+)
+
+from tests.repositories import ItemRepository, run
+
+
+def test_process_time_middleware_records_route_template():
+    registry = MetricsRegistry()
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    app.add_middleware(ProcessTimeMiddleware, registry=registry)
+    client = TestClient(app)
+
+    responses = [client.get("/items/1"), client.get("/items/2"), client.get("/nope")]
+
+    assert all("x-process-time" in response.headers for response in responses)
+    latency = registry.get("http_request_duration_seconds")
+    assert latency.count(method="GET", route="/items/{item_id}", status=200) == 2
+    assert latency.count(method="GET", route="<unmatched>", status=404) == 1
+
+
+def create_cached_app(registry: MetricsRegistry) -> tuple[FastAPI, list[int]]:
+    calls: list[int] = []
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    @cache_response(ttl=30, cache_control="public, max-age=30")
+    async def get_item(item_id: int) -> dict[str, int]:
+        calls.append(item_id)
+        return {"id": item_id}
+
+    @app.get("/etag-only")
+    @cache_response(store=False)
+    async def get_etag_only() -> dict[str, int]:
+        calls.append(0)
+        return {"id": 0}
+
+    @app.get("/plain")
+    async def get_plain() -> dict[str, int]:
+        calls.append(-1)
+        return {"id": -1}
+
+    app.add_middleware(
+        HTTPCacheMiddleware, cache=MemoryCacheBackend(), registry=registry
+    )
+    return app, calls
+
+
+def test_http_cache_middleware_stores_and_revalidates():
+    registry = MetricsRegistry()
+    app, calls = create_cached_app(registry)
+    client = TestClient(app)
+
+    first = client.get("/items/1")
+    etag = first.headers["etag"]
+    assert first.json() == {"id": 1}
+    assert first.headers["cache-control"] == "public, max-age=30"
+
+    cached = client.get("/items/1")
+    not_modified = client.get("/items/1", headers={"If-None-Match": f"W/{etag}"})
+    refreshed = client.get("/items/1", headers={"Cache-Control": "no-cache"})
+
+    assert cached.content == first.content and cached.headers["etag"] == etag
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert "content-type" not in not_modified.headers
+    assert refreshed.json() == {"id": 1}
+    # Разные значения Accept-Encoding кэшируются отдельно
+    client.get("/items/1", headers={"Accept-Encoding": "identity"})
+    assert calls == [1, 1, 1]
+
+    requests = registry.get("http_cache_requests_total")
+    assert requests.value(result="hit") == 1
+    assert requests.value(result="not_modified") == 1
+    assert requests.value(result="miss") == 3
+
+
+def test_http_cache_hits_keep_route_template():
+    registry = MetricsRegistry()
+    app, calls = create_cached_app(registry)
+    app.add_middleware(ProcessTimeMiddleware, registry=registry)
+    client = TestClient(app)
+
+    etag = client.get("/items/1").headers["etag"]
+    client.get("/items/1")
+    client.get("/items/1", headers={"If-None-Match": etag})
+
+    assert calls == [1]
+    latency = registry.get("http_request_duration_seconds")
+    assert latency.count(method="GET", route="/items/{item_id}", status=200) == 2
+    assert latency.count(method="GET", route="/items/{item_id}", status=304) == 1
+    assert latency.count(method="GET", route="<unmatched>", status=200) == 0
+
+
+def test_http_cache_middleware_etag_only_and_plain_routes():
+    app, calls = create_cached_app(MetricsRegistry())
+    client = TestClient(app)
+
+    etag = client.get("/etag-only").headers["etag"]
+    not_modified = client.get("/etag-only", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert "etag" not in client.get("/plain").headers
+    client.get("/plain")
+    assert calls == [0, 0, -1, -1]
+
+
+def test_http_cache_middleware_separates_credentials():
+    registry = MetricsRegistry()
+    app = FastAPI()
+
+    def user(request: Request) -> dict[str, str | None]:
+        return {"user": request.headers.get("authorization")}
+
+    @app.get("/me")
+    @cache_response(ttl=30)
+    async def get_me(request: Request) -> dict[str, str | None]:
+        return user(request)
+
+    @app.get("/me/shared")
+    @cache_response(ttl=30, credentials=True)
+    async def get_me_shared(request: Request) -> dict[str, str | None]:
+        return user(request)
+
+    app.add_middleware(
+        HTTPCacheMiddleware, cache=MemoryCacheBackend(), registry=registry
+    )
+    client = TestClient(app)
+    alice, bob = {"Authorization": "alice"}, {"Cookie": "session=bob"}
+
+    for path in ("/me", "/me/shared"):
+        assert client.get(path, headers=alice).json() == {"user": "alice"}
+        assert client.get(path).json() == {"user": None}
+        assert client.get(path, headers=bob).json() == {"user": None}
+        assert client.get(path, headers=alice).json() == {"user": "alice"}
+
+    requests = registry.get("http_cache_requests_total")
+    # /me: сохраняется только ответ анонимному запросу, /me/shared: все три
+    assert requests.value(result="bypass") == 3
+    assert requests.value(result="miss") == 4
+    assert requests.value(result="hit") == 1
+
+
+def create_compressed_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def get_large() -> list[dict[str, int]]:
+        return [{"value": i} for i in range(200)]
+
+    @app.get("/small")
+    async def get_small() -> dict[str, int]:
+        return {"value": 1}
+
+    @app.get("/binary")
+    async def get_binary() -> PlainTextResponse:
+        return PlainTextResponse(b"x" * 1000, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def get_stream() -> StreamingResponse:
+        async def lines():
+            for i in range(3):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(
+        CompressionMiddleware, codecs=[GzipCodec(level=1)], minimum_size=100
+    )
+    return app
+
+
+def test_compression_middleware():
+    client = TestClient(create_compressed_app())
+
+    large = client.get("/large", headers={"Accept-Encoding": "br;q=1, gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert int(large.headers["content-length"]) < len(large.content)
+    assert large.json()[-1] == {"value": 199}
+
+    identity = client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in identity.headers
+    for path in ("/small", "/binary"):
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert stream.headers["content-encoding"] == "gzip"
+    assert "content-length" not in stream.headers
+    assert stream.content == b"0\n1\n2\n"
+
+
+def test_gzip_compressor_flushes_each_chunk():
+    compressor = GzipCodec().compressor()
+    first = compressor.compress(b"first chunk")
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    assert decompressor.decompress(first) == b"first chunk"
+    rest = compressor.compress(b", second") + compressor.finish()
+    assert decompressor.decompress(rest) == b", second"
+
+
+def create_admission_app(
+    registry: MetricsRegistry, **options: Any
+) -> tuple[FastAPI, asyncio.Event]:
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow(request: Request) -> dict[str, float | None]:
+        await release.wait()
+        return {"remaining": remaining_time(request)}
+
+    @app.get("/health")
+    async def health() -> dict[str, bool]:
+        return {"ok": True}
+
+    app.add_middleware(AdmissionControlMiddleware, registry=registry, **options)
+    return app, release
+
+
+def test_admission_control_sheds_when_queue_is_full():
+    registry = MetricsRegistry()
+    app, release = create_admission_app(
+        registry, max_concurrency=1, max_queue=1, request_timeout=30
+    )
+
+    async def main() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            requests = [asyncio.create_task(client.get("/slow")) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            shed = await client.get("/slow")
+            depth = registry.get("http_admission_queue_depth")
+            assert depth.value(priority="normal") == 1
+            release.set()
+            return [shed, *await asyncio.gather(*requests)]
+
+    shed, *admitted = asyncio.run(main())
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert [response.status_code for response in admitted] == [200, 200]
+    assert 0 < admitted[0].json()["remaining"] <= 30
+    rejected = registry.get("http_admission_rejected_total")
+    assert rejected.value(priority="normal", reason="queue_full") == 1
+    assert registry.get("http_admission_in_flight").value() == 0
+
+
+def test_admission_control_priorities_and_queue_timeout():
+    registry = MetricsRegistry()
+    app, release = create_admission_app(
+        registry,
+        max_concurrency=1,
+        max_queue=1,
+        queue_timeout=0.2,
+        priorities={"/health": "high"},
+    )
+
+    async def main() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            running = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+            queued = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+            # Displaces the queued normal request, then times out in the queue
+            health = await client.get("/health")
+            release.set()
+            return [await running, await queued, health]
+
+    running, queued, health = asyncio.run(main())
+
+    assert running.status_code == 200
+    assert queued.status_code == 503
+    assert health.status_code == 503
+    rejected = registry.get("http_admission_rejected_total")
+    assert rejected.value(priority="normal", reason="displaced") == 1
+    assert rejected.value(priority="high", reason="timeout") == 1
+
+
+def test_admission_deadline_bounds_repository_calls():
+    registry = MetricsRegistry()
+
+    async def scenario(repo: ItemRepository) -> list[httpx.Response]:
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int, delay: float = 0.0) -> dict[str, str]:
+            await asyncio.sleep(delay)
+            return {"name": (await repo.get(item_id)).name}
+
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            max_concurrency=2,
+            request_timeout=0.1,
+            registry=registry,
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return [
+                await client.get("/items/1"),
+                # К вызову репозитория дедлайн запроса уже прошел
+                await client.get("/items/1", params={"delay": 0.2}),
+            ]
+
+    in_time, late = run(scenario, rows=1)
+
+    assert in_time.json() == {"name": "item-1"}
+    assert late.status_code == 503
+    assert late.headers["retry-after"] == "1"
+    rejected = registry.get("http_admission_rejected_total")
+    assert rejected.value(priority="normal", reason="deadline") == 1
+
+
+def test_deadline_timeout():
+    async def main() -> None:
+        async with deadline_timeout():
+            await asyncio.sleep(0)
+        with request_deadline(time.monotonic() + 0.01):
+            with pytest.raises(TimeoutError):
+                async with deadline_timeout():
+                    await asyncio.sleep(1)
+
+    asyncio.run(main())
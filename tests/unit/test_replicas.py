@@ -0,0 +1,158 @@
+"""
+Модуль, содержащий тесты маршрутизации запросов между primary и репликами.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core.database import DatabaseProvider
+from src.core.enums import CountStrategyEnum
+from src.core.models import Base
+from sqlalchemy import select
+
+from src.core.replicas import use_primary
+
+from tests.repositories import (
+    Item,
+    ItemCreateSchema,
+    ItemRepository,
+    VersionedItem,
+    VersionedItemRepository,
+    VersionedItemUpdateSchema,
+)
+
+def run_with_provider(tmp_path: Path, scenario, **kwargs):
+    """
+    Запускаем сценарий на провайдере с primary и двумя репликами (SQLite файлы).
+
+    В каждой базе лежит одна модель с именем базы, чтобы видеть, куда ушел запрос.
+    """
+
+    async def main():
+        names = ("primary", "replica-1", "replica-2")
+        urls = [f"sqlite+aiosqlite:///{tmp_path / name}.db" for name in names]
+        provider = DatabaseProvider(urls[0], replica_urls=urls[1:], **kwargs)
+        engines = [provider.engine, *provider.replica_engines]
+        for index, (name, engine) in enumerate(zip(names, engines)):
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                await connection.execute(
+                    Item.__table__.insert(), {"id": 1, "name": name, "rank": 0}
+                )
+                # Реплики отстают: на primary модель уже обновлена
+                await connection.execute(
+                    VersionedItem.__table__.insert(),
+                    {"id": 1, "name": name, "stock": 0, "version": 1 + (not index)},
+                )
+        try:
+            return await scenario(provider)
+        finally:
+            await provider.dispose()
+
+    return asyncio.run(main())
+
+
+async def read_name(provider: DatabaseProvider, primary: bool = False) -> str:
+    async with provider.session_factory() as session:
+        if primary:
+            use_primary(session)
+        return (await ItemRepository(session).get(1)).name
+
+
+def test_reads_are_balanced_round_robin(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        return [await read_name(provider) for _ in range(4)]
+
+    assert run_with_provider(tmp_path, scenario) == [
+        "replica-1",
+        "replica-2",
+        "replica-1",
+        "replica-2",
+    ]
+
+
+def test_writes_and_reads_after_write_use_primary(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        async with provider.session_factory() as session:
+            repo = ItemRepository(session)
+            async with session.begin():
+                created = await repo.create(ItemCreateSchema(name="new", rank=1))
+                in_transaction = await repo.get_by_ids([1, created.id])
+            return (
+                [item.name for item in in_transaction],
+                await read_name(provider, primary=True),
+                await read_name(provider),
+            )
+
+    assert run_with_provider(tmp_path, scenario) == (
+        ["primary", "new"],
+        "primary",
+        "replica-1",
+    )
+
+
+def test_reads_in_explicit_transaction_use_primary(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        async with provider.session_factory() as session:
+            async with session.begin():
+                in_transaction = (await ItemRepository(session).get(1)).name
+        return in_transaction, await read_name(provider)
+
+    assert run_with_provider(tmp_path, scenario) == ("primary", "replica-1")
+
+
+def test_read_your_writes_window(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        async with provider.session_factory() as session:
+            await ItemRepository(session).create(ItemCreateSchema(name="new", rank=1))
+        return await read_name(provider)
+
+    assert run_with_provider(tmp_path, scenario, read_your_writes_window=60) == (
+        "primary"
+    )
+
+
+def test_read_your_writes_window_is_per_context(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        async def write():
+            async with provider.session_factory() as session:
+                await ItemRepository(session).create(
+                    ItemCreateSchema(name="new", rank=1)
+                )
+
+        # Запись другого запроса (задачи) не переводит наши чтения на primary
+        await asyncio.create_task(write())
+        return await read_name(provider)
+
+    assert run_with_provider(tmp_path, scenario, read_your_writes_window=60) == (
+        "replica-1"
+    )
+
+
+def test_estimated_count_is_not_a_write(tmp_path: Path):
+    async def scenario(provider: DatabaseProvider):
+        async with provider.session_factory() as session:
+            await ItemRepository(session).count(strategy=CountStrategyEnum.ESTIMATED)
+        return await read_name(provider)
+
+    # Оценка не считается записью: следующее чтение по-прежнему идет на реплику
+    assert run_with_provider(tmp_path, scenario, read_your_writes_window=60) != (
+        "primary"
+    )
+
+
+@pytest.mark.parametrize("in_transaction", (False, True))
+def test_update_many_reads_versions_from_primary(tmp_path: Path, in_transaction):
+    async def scenario(provider: DatabaseProvider):
+        async with provider.session_factory() as session:
+            if in_transaction:
+                # Транзакция начата чтением с реплики
+                await session.execute(select(VersionedItem.id))
+            (updated,) = await VersionedItemRepository(session).update_many(
+                [VersionedItemUpdateSchema(id=1, stock=5)]
+            )
+            return updated.name, updated.version
+
+    assert run_with_provider(tmp_path, scenario) == ("primary", 3)
@@ -0,0 +1,105 @@
+"""
+Модуль, содержащий тесты ответов и сериализации схем.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.core.responses import (
+    JSONArrayStreamingResponse,
+    NDJSONStreamingResponse,
+    SchemaJSONResponse,
+)
+from src.core.routing import SchemaResponseRoute
+from src.core.schemas import ResponseSchema
+
+
+class ObjectSchema(ResponseSchema):
+    some_value: int
+
+
+async def chunks(*sizes: int):
+    start = 0
+    for size in sizes:
+        yield [ObjectSchema(some_value=i) for i in range(start, start + size)]
+        start += size
+
+
+def read_body(response) -> bytes:
+    async def collect():
+        return b"".join([part async for part in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("sizes", ((), (0,), (2,), (2, 0, 3)))
+def test_json_array_streaming_response(sizes: tuple[int, ...]):
+    body = read_body(JSONArrayStreamingResponse(chunks(*sizes)))
+    assert json.loads(body) == [{"someValue": i} for i in range(sum(sizes))]
+
+
+def test_ndjson_streaming_response():
+    body = read_body(NDJSONStreamingResponse(chunks(2, 1)))
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"someValue": 0},
+        {"someValue": 1},
+        {"someValue": 2},
+    ]
+
+
+class ExtendedObjectSchema(ObjectSchema):
+    secret: str = "hidden"
+
+
+def create_schema_app() -> FastAPI:
+    router = APIRouter(route_class=SchemaResponseRoute)
+
+    @router.get("/objects")
+    async def get_objects(count: int = 2) -> list[ObjectSchema]:
+        return [ObjectSchema(some_value=i) for i in range(count)]
+
+    @router.get("/objects/{some_value}", status_code=202)
+    async def get_object(some_value: int) -> ObjectSchema:
+        if some_value < 0:
+            return ExtendedObjectSchema(some_value=some_value)
+        return ObjectSchema(some_value=some_value)
+
+    @router.get("/dicts")
+    async def get_dicts() -> list[ObjectSchema]:
+        return [{"some_value": 1}]
+
+    @router.get("/headers")
+    async def get_with_headers(response: Response) -> ObjectSchema:
+        response.headers["X-Test"] = "1"
+        return ObjectSchema(some_value=1)
+
+    app = FastAPI(default_response_class=SchemaJSONResponse)
+    app.include_router(router)
+    return app
+
+
+def test_schema_response_route_serializes_schemas():
+    app = create_schema_app()
+    client = TestClient(app)
+    routes = {route.path: route for route in app.routes}
+    assert routes["/objects"].dependant.call is not routes["/objects"].endpoint
+    assert routes["/headers"].dependant.call is routes["/headers"].endpoint
+
+    objects = client.get("/objects", params={"count": 3})
+    assert objects.json() == [{"someValue": i} for i in range(3)]
+
+    single = client.get("/objects/5")
+    assert single.status_code == 202
+    assert single.content == b'{"someValue":5}'
+
+    # Подкласс схемы проходит через FastAPI и не раскрывает лишние поля
+    assert client.get("/objects/-1").json() == {"someValue": -1}
+    assert client.get("/dicts").json() == [{"someValue": 1}]
+
+    with_headers = client.get("/headers")
+    assert with_headers.headers["x-test"] == "1"
+    assert with_headers.json() == {"someValue": 1}
@@ -0,0 +1,104 @@
+"""
+Модуль, содержащий тесты трассировки запросов.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.core.metrics import MetricsRegistry
+from src.core.middleware import QueryTracingMiddleware
+from src.core.tracing import (
+    UNKNOWN_OPERATION,
+    QueryTracer,
+    redact_parameters,
+    trace_request,
+)
+
+from tests.repositories import ItemRepository, run
+
+def test_query_tracer_reports_slow_queries_and_n_plus_one(caplog):
+    registry = MetricsRegistry()
+    tracer = QueryTracer(
+        slow_query_threshold=0.0, n_plus_one_threshold=2, registry=registry
+    )
+
+    async def scenario(repo: ItemRepository):
+        tracer.instrument("test", repo._session.bind)
+        with trace_request("request-1") as trace:
+            for id in (1, 2, 3, 1):
+                await repo.get(id)
+            await repo.get_by_ids([1, 2])
+        return trace
+
+    with caplog.at_level(logging.WARNING, logger="src.core.tracing"):
+        trace = run(scenario, rows=3)
+
+    assert trace.query_count == 5
+    assert trace.db_time > 0
+    n_plus_one = [r for r in caplog.records if "N+1" in r.getMessage()]
+    assert len(n_plus_one) == 1
+    assert n_plus_one[0].query["request_id"] == "request-1"
+    assert n_plus_one[0].query["operation"] == "ItemRepository.get"
+    slow = [r for r in caplog.records if r.getMessage().startswith("Slow query")]
+    assert len(slow) == 5
+    assert "'***'" in slow[0].getMessage() and "item-" not in slow[0].getMessage()
+    duration = registry.get("db_query_duration_seconds")
+    assert duration.count(pool="test", operation="ItemRepository.get") == 4
+    assert duration.count(pool="test", operation="ItemRepository.get_by_ids") == 1
+
+
+def test_stream_marks_only_its_own_fetches():
+    """
+    Проверяем, что запросы вызывающего кода между порциями потокового чтения
+    не помечаются операцией репозитория.
+    """
+    registry = MetricsRegistry()
+    tracer = QueryTracer(registry=registry)
+
+    async def scenario(repo: ItemRepository):
+        engine = repo._session.bind
+        tracer.instrument("test", engine)
+        async for _ in repo.stream_all(chunk_size=1):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+    run(scenario, rows=2)
+
+    duration = registry.get("db_query_duration_seconds")
+    assert duration.count(pool="test", operation="ItemRepository.stream_all") == 1
+    assert duration.count(pool="test", operation=UNKNOWN_OPERATION) == 2
+
+
+@pytest.mark.parametrize(
+    "parameters, redacted",
+    (
+        ({"id": 1}, {"id": "***"}),
+        ((1, "secret"), ["***", "***"]),
+        ([(1,), (2,)], "<2 parameter sets>"),
+    ),
+)
+def test_redact_parameters(parameters, redacted):
+    assert redact_parameters(parameters) == redacted
+
+
+def test_query_tracing_middleware_sets_server_timing():
+    tracer = QueryTracer(registry=MetricsRegistry())
+    app = FastAPI()
+
+    @app.get("/queries")
+    async def run_queries() -> dict[str, int]:
+        for _ in range(3):
+            tracer.record("test", "SELECT 1", (), 0.002, 1)
+        return {"ok": 1}
+
+    app.add_middleware(QueryTracingMiddleware)
+    client = TestClient(app)
+
+    response = client.get("/queries", headers={"X-Request-ID": "abc"})
+    assert response.headers["x-request-id"] == "abc"
+    assert response.headers["server-timing"] == 'db;dur=6.000;desc="3 queries"'
+    assert client.get("/queries").headers["x-request-id"]
@@ -0,0 +1,181 @@
+"""
+Модуль, содержащий тесты единицы работы запроса (`UnitOfWorkRoute` и `TransactionDep`).
+"""
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.database import DatabaseProvider, TransactionDep, get_transaction
+from src.core.exceptions import ModelNotFoundError
+from src.core.models import Base
+from src.core.unit_of_work import UnitOfWorkRoute
+from src.handlers import apply_exception_handlers
+
+from tests.repositories import (
+    CachedItemRepository,
+    Item,
+    ItemCreateSchema,
+    ItemReadSchema,
+    ItemRepository,
+    ItemUpdateSchema,
+)
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    """
+    Файл SQLite с одной моделью `item-1`.
+    """
+    path = tmp_path / "app.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Item.__table__.insert(), {"id": 1, "name": "item-1", "rank": 0}
+        )
+    engine.dispose()
+    return path
+
+
+def names(path: Path) -> list[str]:
+    with sqlite3.connect(path) as connection:
+        return [row[0] for row in connection.execute("SELECT name FROM test_items")]
+
+
+def create_client(path: Path, router: APIRouter) -> TestClient:
+    """
+    Приложение с маршрутами `router` и транзакцией на запрос на базе `path`.
+    """
+    provider = DatabaseProvider(f"sqlite+aiosqlite:///{path}")
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        await provider.dispose()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+    apply_exception_handlers(app)
+    app.dependency_overrides[get_transaction] = provider.transaction_getter
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_commit_happens_before_response(database: Path):
+    router = APIRouter(route_class=UnitOfWorkRoute)
+    committed_on_response: list[list[str]] = []
+
+    @router.post("/items")
+    async def create_item(session: TransactionDep) -> ItemReadSchema:
+        return await ItemRepository(session).create(
+            ItemCreateSchema(name="new", rank=1)
+        )
+
+    class CheckOnResponseMiddleware:
+        def __init__(self, app: ASGIApp) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            async def checked_send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    committed_on_response.append(names(database))
+                await send(message)
+
+            await self.app(scope, receive, checked_send)
+
+    client = create_client(database, router)
+    client.app.add_middleware(CheckOnResponseMiddleware)
+    with client:
+        response = client.post("/items")
+
+    assert response.status_code == 200
+    assert committed_on_response == [["item-1", "new"]]
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    (
+        (HTTPException(status_code=409), 409),
+        (ModelNotFoundError(Item, model_id=42), 404),
+    ),
+)
+def test_rollback_on_error(database: Path, error: Exception, status_code: int):
+    router = APIRouter(route_class=UnitOfWorkRoute)
+
+    @router.post("/items")
+    async def create_item(session: TransactionDep) -> None:
+        await ItemRepository(session).create(ItemCreateSchema(name="new", rank=1))
+        raise error
+
+    with create_client(database, router) as client:
+        response = client.post("/items")
+
+    assert response.status_code == status_code
+    assert names(database) == ["item-1"]
+
+
+def test_commit_failure_is_server_error(database: Path):
+    router = APIRouter(route_class=UnitOfWorkRoute)
+
+    def fail_commit(session: Session) -> None:
+        raise RuntimeError("commit failed")
+
+    @router.post("/items")
+    async def create_item(session: TransactionDep) -> ItemReadSchema:
+        event.listen(session.sync_session, "before_commit", fail_commit)
+        return await ItemRepository(session).create(
+            ItemCreateSchema(name="new", rank=1)
+        )
+
+    with create_client(database, router) as client:
+        response = client.post("/items")
+
+    assert response.status_code == 500
+    assert names(database) == ["item-1"]
+
+
+def test_cache_is_updated_only_after_commit(database: Path):
+    """
+    Проверяем, что кэш репозитория меняется только после коммита: старая
+    схема, возвращенная в кэш конкурентным чтением, удаляется, а прочитанная
+    внутри транзакции схема не кэшируется при откате.
+    """
+    router = APIRouter(route_class=UnitOfWorkRoute)
+    cache = CachedItemRepository.cache
+    key = (Item, ItemReadSchema, 1)
+    stale = ItemReadSchema.model_validate({"id": 1, "name": "item-1", "rank": 0})
+
+    @router.put("/items/{id}")
+    async def rename_item(id: int, fail: bool, session: TransactionDep) -> None:
+        repo = CachedItemRepository(session)
+        await repo.update(ItemUpdateSchema(id=id, name="renamed"))
+        await repo.get(id)
+        # Конкурентный запрос вне транзакции возвращает в кэш старую схему
+        await cache.set(key, stale)
+        if fail:
+            raise HTTPException(status_code=409)
+
+    def cached_name() -> str | None:
+        cached = asyncio.run(cache.get(key))
+        return cached.name if cached is not None else None
+
+    asyncio.run(cache.clear())
+    with create_client(database, router) as client:
+        failed = client.put("/items/1", params={"fail": True})
+        after_rollback = cached_name()
+        renamed = client.put("/items/1", params={"fail": False})
+        after_commit = cached_name()
+
+    assert (failed.status_code, renamed.status_code) == (409, 200)
+    assert after_rollback == "item-1"
+    assert after_commit == "renamed"
+    assert names(database) == ["renamed"]